@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""Micro-benchmark: locating ``__NEXT_DATA__`` by byte scan vs. a full lxml DOM.
+
+Wraps every page sample in ``tests/sample_json_source`` in a realistic HTML
+shell and times both extraction paths (without JSON decoding, which is the
+same for both).
+
+    python benchmarks/bench_next_data.py [--number N]
+"""
+
+import argparse
+import os
+import timeit
+
+from lxml import html
+
+from imdbinfo.services import _find_next_data
+
+SAMPLE_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "sample_json_source"
+)
+PAGE_SAMPLES = (
+    "sample_resource.json",
+    "sample_series.json",
+    "sample_episode.json",
+    "sample_episodes.json",
+    "sample_person.json",
+)
+# roughly what surrounds the script tag on a real /reference page
+FILLER = "".join(
+    f'<div class="ipc-metadata-list-item" data-testid="item-{i}"><a href="/title/tt{i:07d}/">Item {i}</a></div>'
+    for i in range(2000)
+)
+
+
+def build_page(json_text: str) -> bytes:
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>IMDb</title></head>'
+        "<body>"
+        f"{FILLER}"
+        f'<script id="__NEXT_DATA__" type="application/json">{json_text}</script>'
+        f"{FILLER}</body></html>"
+    ).encode("utf-8")
+
+
+def lxml_extract(content: bytes) -> str:
+    tree = html.fromstring(content)
+    return tree.xpath('//script[@id="__NEXT_DATA__"]/text()')[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'sample':<24}{'size':>10}{'lxml ms':>12}{'scan ms':>12}{'speedup':>10}")
+    for name in PAGE_SAMPLES:
+        with open(os.path.join(SAMPLE_DIR, name), encoding="utf-8") as f:
+            json_text = f.read()
+        page = build_page(json_text)
+        assert _find_next_data(page).decode("utf-8") == lxml_extract(page)
+
+        t_lxml = timeit.timeit(lambda: lxml_extract(page), number=args.number)
+        t_scan = timeit.timeit(lambda: _find_next_data(page), number=args.number)
+        print(
+            f"{name:<24}{len(page) / 1e6:>9.2f}M"
+            f"{t_lxml / args.number * 1e3:>12.2f}"
+            f"{t_scan / args.number * 1e3:>12.3f}"
+            f"{t_lxml / t_scan:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Micro-benchmark: parse time per title, direct lookups vs JMESPath.
+
+"interpreted" sends the field lookups through ``jmespath.search`` on every
+call; "direct" is the current code, which walks plain paths with dict
+lookups and compiles the few remaining expressions once. The difference
+is the lookup cost alone: building the pydantic models dominates the rest.
+
+    python benchmarks/bench_parsers.py [--number N]
+"""
+
+import argparse
+import json
+import os
+import timeit
+from contextlib import ExitStack
+from unittest import mock
+
+import jmespath
+
+from imdbinfo import parsers
+
+SAMPLE_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "sample_json_source"
+)
+CASES = (
+    ("sample_resource.json", parsers.parse_json_movie),
+    ("sample_series.json", parsers.parse_json_movie),
+    ("sample_episode.json", parsers.parse_json_movie),
+    ("sample_person.json", parsers.parse_json_person_detail),
+)
+
+
+def uncompiled_pjmespatch(query, data, post_process=None, *args, **kwargs):
+    result = jmespath.search(query, data)
+    if post_process:
+        return post_process(result, *args, **kwargs)
+    return result
+
+
+def interpreted():
+    """Patch the parsers back to per-call ``jmespath.search``."""
+    stack = ExitStack()
+    stack.enter_context(mock.patch.object(parsers, "pjmespatch", uncompiled_pjmespatch))
+    stack.enter_context(
+        mock.patch.object(
+            parsers,
+            "_compile_lookup",
+            lambda query: lambda data: jmespath.search(query, data),
+        )
+    )
+    return stack
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'sample':<24}{'interpreted ms':>16}{'direct ms':>11}{'speedup':>10}")
+    for name, parse in CASES:
+        with open(os.path.join(SAMPLE_DIR, name), encoding="utf-8") as f:
+            raw_json = json.load(f)
+        with interpreted():
+            slow = timeit.timeit(lambda: parse(raw_json), number=args.number)
+        fast = timeit.timeit(lambda: parse(raw_json), number=args.number)
+        print(
+            f"{name:<24}"
+            f"{slow / args.number * 1e3:>16.2f}"
+            f"{fast / args.number * 1e3:>11.2f}"
+            f"{slow / fast:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import asyncio
+import logging
+
+from imdbinfo import aio
+
+logging.basicConfig(level=logging.WARNING)
+
+
+async def main():
+    ids = ["tt0133093", "tt0234215", "tt0242653", "tt1375666", "tt0816692"]
+    movies = await asyncio.gather(*(aio.get_movie(imdb_id) for imdb_id in ids))
+    for movie in movies:
+        print(f"{movie.title} ({movie.year}) - {movie.rating}")
+
+    results = await aio.search_title("matrix")
+    print(f"Search returned {len(results.titles)} titles")
+
+    await aio.close_session()
+
+
+asyncio.run(main())
@@ -23,49 +23,119 @@ import logging
 
 from .services import (
     get_movie,
+    get_movies,
     search_title,
     get_name,
     get_episodes,
     get_all_episodes,
+    iter_all_episodes,
     get_season_episodes,
+    get_series_episodes,
     get_akas,
+    get_akas_many,
     get_reviews,
+    get_reviews_many,
     get_trivia,
     get_parental_guide,
     get_filmography,
+    iter_filmography,
     get_all_interests,
     get_media_gallery,
+    prefetch_title_sections,
+    iter_reviews,
+    iter_trivia,
+    iter_akas,
+    iter_images,
+    TITLE_SECTIONS,
     TitleType,
+    configure_session,
+    set_session,
+    get_session,
+    close_session,
+    set_streaming,
+    configure_waf_refresh,
+    configure_rate_limit,
+    rate_limit_stats,
+    configure_retries,
+    configure_timeouts,
+    transfer_stats,
+    reset_transfer_stats,
+    configure_cache,
+    invalidate,
+    clear_cache,
+    cache_stats,
+    enable_disk_cache,
+    disable_disk_cache,
+    get_disk_cache,
 )
+from .decoder import get_json_backend, set_json_backend
 from .exceptions import (
     ImdbinfoError,
     HTTPError,
     WAFError,
     GraphQLError,
     ParseError,
+    RequestTimeoutError,
 )
 
 __all__ = [
     "get_movie",
+    "get_movies",
     "search_title",
     "get_name",
     "get_episodes",
     "get_all_episodes",
+    "iter_all_episodes",
     "get_season_episodes",
+    "get_series_episodes",
     "get_akas",
+    "get_akas_many",
     "get_reviews",
+    "get_reviews_many",
     "get_trivia",
     "get_parental_guide",
     "get_filmography",
+    "iter_filmography",
     "get_all_interests",
     "get_media_gallery",
+    "prefetch_title_sections",
+    "iter_reviews",
+    "iter_trivia",
+    "iter_akas",
+    "iter_images",
+    "TITLE_SECTIONS",
     "TitleType",
+    # http session
+    "configure_session",
+    "set_session",
+    "get_session",
+    "close_session",
+    "set_streaming",
+    "configure_waf_refresh",
+    "configure_rate_limit",
+    "rate_limit_stats",
+    "configure_retries",
+    "configure_timeouts",
+    "transfer_stats",
+    "reset_transfer_stats",
+    # caching
+    "configure_cache",
+    "invalidate",
+    "clear_cache",
+    "cache_stats",
+    "enable_disk_cache",
+    "disable_disk_cache",
+    "get_disk_cache",
+    # json decoding
+    "get_json_backend",
+    "set_json_backend",
     # exceptions
     "ImdbinfoError",
     "HTTPError",
     "WAFError",
     "GraphQLError",
     "ParseError",
+    "RequestTimeoutError",
 ]
 
 # setup library logging
@@ -0,0 +1,815 @@
+# MIT License
+# Copyright (c) 2025 tveronesi+imdbinfo@gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+asyncio API
+===========
+
+Async equivalents of the getters in :mod:`imdbinfo.services`, built on a
+shared ``niquests.AsyncSession``. URLs, GraphQL queries, error handling and
+parsers are shared with the blocking API, so results are identical::
+
+    from imdbinfo import aio
+
+    movie = await aio.get_movie("tt0133093")
+    await aio.close_session()
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import (
+    Optional,
+    Dict,
+    Union,
+    List,
+    Any,
+    Iterable,
+    AsyncIterator,
+    Callable,
+    Tuple,
+)
+
+import niquests
+
+from . import services
+from .cache import _MISSING, _id_tag, aio_flights, memoize, memory_cache
+from .exceptions import GraphQLError, RequestTimeoutError
+from .retry import check_deadline, deadline_exceeded, retry_policy, with_deadline
+from .throttle import rate_limiter
+from .transfer import transfer_meter
+from .services import (
+    GRAPHQL_URL,
+    HEADERS,
+    USER_AGENT,
+    TitleFilter,
+    normalize_imdb_id,
+    _dedupe_ids,
+    _check_page_response,
+    _check_graphql_response,
+    _parse_next_data,
+    _graphql_headers,
+    _search_payload,
+    _extended_title_query,
+    _extended_titles_query,
+    _paged_title_query,
+    _section_page,
+    _TITLE_SECTION_PAGE_SIZE,
+    _plan_title_batches,
+    _collect_title_batch,
+    _normalize_many,
+    _parse_many,
+    _lookup_sections,
+    _store_sections,
+    _title_sections_json,
+    TITLE_SECTIONS,
+    _extended_name_query,
+    _filmography_page,
+    _movie_url,
+    _name_url,
+    _season_episodes_url,
+    _all_episodes_url,
+    _all_episodes_key,
+    _episode_shortfall,
+    _fresh_episodes,
+    _remaining_episode_pages,
+    _remaining_seasons,
+    _waf_cookie_state,
+    _conditional_headers,
+    _response_validators,
+    _validated_key,
+    _request_timeout,
+    _schedule_waf_refresh,
+    _delete_waf_cookie_file,
+    _search_cache_key,
+)
+from .locale import _retrieve_url_lang
+from .models import (
+    SearchResult,
+    MovieDetail,
+    SeasonEpisodesList,
+    PersonDetail,
+    AkasData,
+    AkaInfo,
+    MediaGallery,
+    MediaItem,
+    MovieBriefInfo,
+    BulkedEpisode,
+)
+from .parsers import (
+    parse_json_movie,
+    parse_json_search,
+    parse_json_person_detail,
+    parse_json_season_episodes,
+    parse_json_akas,
+    parse_json_trivia,
+    parse_json_reviews,
+    parse_json_filmography,
+    parse_json_parental_guide,
+    parse_json_media_gallery,
+    parse_json_interests,
+    parse_json_bulked_episodes,
+    parse_json_bulked_episodes_cursor,
+)
+
+logger = logging.getLogger(__name__)
+
+# Shared async HTTP session, same pooling defaults as the blocking one. An
+# AsyncSession's connections belong to the loop that opened them, so there is
+# one library-managed session per running event loop.
+_SESSION_OPTIONS: Dict[str, Any] = dict(services._SESSION_OPTIONS)
+_loop_sessions = weakref.WeakKeyDictionary()  # event loop -> AsyncSession
+_session: Optional[niquests.AsyncSession] = None  # caller-owned, see set_session
+
+
+async def _close_loop_session() -> None:
+    session = _loop_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+        logger.debug("Closed shared async HTTP session")
+
+
+async def configure_session(**options) -> None:
+    """Set the options used to build the shared ``niquests.AsyncSession``.
+
+    The current loop's library-managed session is closed; sessions are
+    rebuilt lazily with the new options.
+    """
+    _SESSION_OPTIONS.update(options)
+    await _close_loop_session()
+    _loop_sessions.clear()
+
+
+async def set_session(session: Optional[niquests.AsyncSession]) -> None:
+    """Use a caller-owned ``niquests.AsyncSession`` for every async request.
+
+    The caller stays responsible for closing it and for only awaiting
+    requests on the loop it belongs to. Pass ``None`` to go back to the
+    library-managed sessions.
+    """
+    global _session
+    await _close_loop_session()
+    _session = session
+
+
+def get_session() -> niquests.AsyncSession:
+    """Return the injected session, or the running loop's shared session."""
+    if _session is not None:
+        return _session
+    loop = asyncio.get_running_loop()
+    session = _loop_sessions.get(loop)
+    if session is None:
+        for stale in [other for other in _loop_sessions if other.is_closed()]:
+            del _loop_sessions[stale]
+        logger.debug("Creating shared async HTTP session with %s", _SESSION_OPTIONS)
+        session = _loop_sessions[loop] = niquests.AsyncSession(**_SESSION_OPTIONS)
+    return session
+
+
+async def close_session() -> None:
+    """Close the running loop's library-managed session; an injected one is only detached."""
+    global _session
+    _session = None
+    await _close_loop_session()
+
+
+async def _send(method: str, url: str, **kwargs) -> Any:
+    """Async version of :func:`imdbinfo.services._send`."""
+    if not await rate_limiter.wait_async(url, check_deadline(url)):
+        raise deadline_exceeded(url)
+    timeout = _request_timeout(url)
+    try:
+        resp = await getattr(get_session(), method)(url, timeout=timeout, **kwargs)
+    except niquests.Timeout as exc:
+        raise RequestTimeoutError(
+            f"Request to {url} timed out", url=url, timeout=max(timeout)
+        ) from exc
+    rate_limiter.record(url, resp)
+    transfer_meter.record(url, resp)
+    return resp
+
+
+async def request_handler(url: str, validators: Optional[Dict] = None) -> Any:
+    conditional = _conditional_headers(validators)
+    headers = {**HEADERS, **conditional} if conditional else HEADERS
+    waf_cookies, generation = _waf_cookie_state()
+    _schedule_waf_refresh(generation)
+    resp = await _send("get", url, headers=headers, cookies=waf_cookies)
+    if resp.status_code == 200 or (conditional and resp.status_code == 304):
+        return resp
+    logger.debug(
+        "Non-200 response (%s) for %s — invalidating cached WAF cookies and refreshing",
+        resp.status_code,
+        url,
+    )
+    # the solver (and waiting for another caller's solve) is blocking: keep
+    # it off the event loop; the shared lock coordinates threads and loops
+    waf_cookies, generation = await asyncio.to_thread(
+        services._refresh_waf_cookies, generation, resp.text
+    )
+    if waf_cookies is None:
+        return resp
+    logger.debug("WAF cookies refreshed — retrying %s", url)
+    resp = await _send("get", url, headers=headers, cookies=waf_cookies)
+    if resp.status_code != 200 and not (conditional and resp.status_code == 304):
+        logger.warning(
+            "Request still non-200 (%s) after WAF cookie refresh for %s — "
+            "discarding cookies, will retry fresh on next call",
+            resp.status_code,
+            url,
+        )
+        _delete_waf_cookie_file(generation)
+    return resp
+
+
+async def request_json_url(url: str) -> Any:
+    return (await retry_policy.call_async(_request_json_url, url))[0]
+
+
+async def _request_json_url(
+    url: str, validators: Optional[Dict] = None
+) -> Tuple[Any, Dict]:
+    """Async version of :func:`imdbinfo.services._request_json_url`."""
+    resp = await request_handler(url, validators)
+    if validators and resp.status_code == 304:
+        logger.debug("Not modified: %s", url)
+        return None, validators
+    _check_page_response(resp, url)
+    return _parse_next_data(resp.content, url), _response_validators(resp)
+
+
+async def request_graphql_url(headers, search_term, payload, url, partial=False) -> Any:
+    return await retry_policy.call_async(
+        _request_graphql_url, headers, search_term, payload, url, partial
+    )
+
+
+async def _request_graphql_url(
+    headers, search_term, payload, url, partial=False
+) -> Any:
+    resp = await _send("post", url, headers=headers, json=payload)
+    return _check_graphql_response(resp, search_term, url, partial)
+
+
+async def _cached_raw(endpoint: str, key: str, lang: str, fetch, *args, **kwargs):
+    """Async version of :func:`imdbinfo.services._cached_raw`.
+
+    SQLite calls run in a worker thread so the event loop is never blocked;
+    concurrent coroutines asking for the same key share one request.
+    """
+    return await aio_flights.do(
+        ("raw", endpoint, key, lang),
+        _load_raw,
+        endpoint,
+        key,
+        lang,
+        fetch,
+        *args,
+        **kwargs,
+    )
+
+
+async def _cached_page(
+    endpoint: str, key: str, lang: str, url: str, parse: Callable[[Any], Any]
+) -> Any:
+    """Async version of :func:`imdbinfo.services._cached_page`."""
+    return await aio_flights.do(
+        ("page", endpoint, key, lang), _load_page, endpoint, key, lang, url, parse
+    )
+
+
+async def _load_page(endpoint: str, key: str, lang: str, url: str, parse) -> Any:
+    cache = services.get_disk_cache()
+    if cache is None:
+        return parse(await request_json_url(url))
+    raw_json = await asyncio.to_thread(cache.get, endpoint, key, lang)
+    if raw_json is not None:
+        return parse(raw_json)
+    stale = await asyncio.to_thread(cache.get_stale, endpoint, key, lang)
+    validators = stale[1] if stale else None
+    raw_json, validators = await retry_policy.call_async(
+        _request_json_url, url, validators
+    )
+    model_key = _validated_key(endpoint, key, lang, validators)
+    if raw_json is None:
+        await asyncio.to_thread(cache.refresh, endpoint, key, lang)
+        model = memory_cache.get(model_key, "validated")
+        if model is not _MISSING:
+            return model
+        raw_json = stale[0]
+    else:
+        await asyncio.to_thread(cache.set, endpoint, key, lang, raw_json, validators)
+    model = parse(raw_json)
+    if validators:
+        memory_cache.set(model_key, model, "validated", _id_tag(key))
+    return model
+
+
+async def _load_raw(endpoint: str, key: str, lang: str, fetch, *args, **kwargs):
+    cache = services.get_disk_cache()
+    if cache is None:
+        return await fetch(*args, **kwargs)
+    raw_json = await asyncio.to_thread(cache.get, endpoint, key, lang)
+    if raw_json is None:
+        raw_json = await fetch(*args, **kwargs)
+        await asyncio.to_thread(cache.set, endpoint, key, lang, raw_json)
+    return raw_json
+
+
+@with_deadline
+@memoize("title")
+async def get_movie(
+    imdb_id: str, locale: Optional[str] = None
+) -> Optional[MovieDetail]:
+    """Async version of :func:`imdbinfo.services.get_movie`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    url = _movie_url(imdb_id, lang)
+    logger.info("Fetching movie %s", imdb_id)
+    return await _cached_page("title", f"tt{imdb_id}", lang, url, parse_json_movie)
+
+
+@with_deadline
+async def get_movies(
+    imdb_ids: Iterable[str],
+    locale: Optional[str] = None,
+    max_concurrency: int = 16,
+) -> AsyncIterator[Tuple[str, Union[MovieDetail, Exception]]]:
+    """Async version of :func:`imdbinfo.services.get_movies`.
+
+    At most ``max_concurrency`` requests are in flight; results are yielded
+    as ``(imdb_id, MovieDetail | exception)`` in completion order.
+    """
+    ids = iter(_dedupe_ids(imdb_ids, locale))
+
+    async def fetch(imdb_id):
+        try:
+            return imdb_id, await get_movie(imdb_id, locale)
+        except Exception as exc:
+            logger.warning("Batch fetch failed for %s: %s", imdb_id, exc)
+            return imdb_id, exc
+
+    pending = {
+        asyncio.ensure_future(fetch(imdb_id))
+        for _, imdb_id in zip(range(max_concurrency), ids)
+    }
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                next_id = next(ids, None)
+                if next_id is not None:
+                    pending.add(asyncio.ensure_future(fetch(next_id)))
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+@with_deadline
+@memoize("search", by_id=False)
+async def search_title(
+    search_term: str,
+    year: int | None = None,
+    exact_match: bool = False,
+    locale: Optional[str] = None,
+    title_type: Optional[TitleFilter] = None,
+) -> Optional[SearchResult]:
+    """Async version of :func:`imdbinfo.services.search_title`."""
+    headers, payload = _search_payload(
+        search_term, year, exact_match, locale, title_type
+    )
+
+    logger.info("Searching for '%s' using GraphQL API", search_term)
+    data = await _cached_raw(
+        "search",
+        _search_cache_key(headers, payload),
+        _retrieve_url_lang(locale),
+        request_graphql_url,
+        headers=headers,
+        search_term=search_term,
+        payload=payload,
+        url=GRAPHQL_URL,
+    )
+    return parse_json_search(data)
+
+
+@with_deadline
+@memoize("name")
+async def get_name(
+    person_id: str, locale: Optional[str] = None
+) -> Optional[PersonDetail]:
+    """Async version of :func:`imdbinfo.services.get_name`."""
+    person_id, lang = normalize_imdb_id(person_id, locale)
+    url = _name_url(person_id, lang)
+    logger.info("Fetching person %s", person_id)
+    return await _cached_page(
+        "name", f"nm{person_id}", lang, url, parse_json_person_detail
+    )
+
+
+@with_deadline
+@memoize("season")
+async def get_season_episodes(
+    imdb_id: str, season=1, locale: Optional[str] = None
+) -> SeasonEpisodesList:
+    """Async version of :func:`imdbinfo.services.get_season_episodes`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    url = _season_episodes_url(imdb_id, season, lang)
+    logger.info("Fetching episodes for movie %s", imdb_id)
+    return await _cached_page(
+        "season", f"tt{imdb_id}:{season}", lang, url, parse_json_season_episodes
+    )
+
+
+@with_deadline
+async def get_series_episodes(
+    imdb_id: str, locale: Optional[str] = None, max_concurrency: int = 8
+) -> List[SeasonEpisodesList]:
+    """Async version of :func:`imdbinfo.services.get_series_episodes`."""
+    first = await get_season_episodes(imdb_id, 1, locale)
+    limit = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(season):
+        async with limit:
+            return await get_season_episodes(imdb_id, season, locale)
+
+    remaining = _remaining_seasons(first)
+    logger.info("Fetching %d more seasons for series %s", len(remaining), imdb_id)
+    seasons = await asyncio.gather(*(fetch(season) for season in remaining))
+    return sorted([first, *seasons], key=lambda season: season.season_number)
+
+
+async def _all_episodes_page(
+    series_id: str, lang: str, start: int = 1, after: str = ""
+) -> Any:
+    key = _all_episodes_key(series_id, start, after)
+    url = _all_episodes_url(series_id, lang, start, after)
+    return await _cached_raw("episodes", key, lang, request_json_url, url)
+
+
+@with_deadline
+async def iter_all_episodes(
+    imdb_id: str, locale: Optional[str] = None, max_concurrency: int = 4
+) -> AsyncIterator[BulkedEpisode]:
+    """Async version of :func:`imdbinfo.services.iter_all_episodes`."""
+    series_id, lang = normalize_imdb_id(imdb_id, locale)
+    logger.info("Fetching bulk episodes for series %s", imdb_id)
+    first = last = await _all_episodes_page(series_id, lang)
+    seen: set = set()
+    for episode in _fresh_episodes(first, seen):
+        yield episode
+    limit = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(start):
+        async with limit:
+            return await _all_episodes_page(series_id, lang, start)
+
+    tasks = [
+        asyncio.ensure_future(fetch(start)) for start in _remaining_episode_pages(first)
+    ]
+    if tasks:
+        try:
+            for task in tasks:
+                raw_json = await task
+                fresh = _fresh_episodes(raw_json, seen)
+                if not fresh:
+                    if not parse_json_bulked_episodes(raw_json):
+                        last = None  # past the end: nothing left to follow
+                    break
+                last = raw_json
+                for episode in fresh:
+                    yield episode
+            else:
+                last = None
+        finally:
+            for task in tasks:
+                task.cancel()
+        if last is not None:
+            logger.warning(
+                "Episode search ignored start= for series %s, following its cursor",
+                imdb_id,
+            )
+            cursor = parse_json_bulked_episodes_cursor(last)
+            while cursor:
+                raw_json = await _all_episodes_page(series_id, lang, after=cursor)
+                fresh = _fresh_episodes(raw_json, seen)
+                if not fresh:
+                    break
+                for episode in fresh:
+                    yield episode
+                cursor = parse_json_bulked_episodes_cursor(raw_json)
+    _episode_shortfall(imdb_id, first, seen)
+
+
+@with_deadline
+@memoize("episodes")
+async def get_all_episodes(imdb_id: str, locale: Optional[str] = None):
+    """Async version of :func:`imdbinfo.services.get_all_episodes`."""
+    return [episode async for episode in iter_all_episodes(imdb_id, locale)]
+
+
+async def _off_loop(func: Callable, *args) -> Any:
+    """Run a section cache helper, in a worker thread when it may hit SQLite."""
+    if services.get_disk_cache() is None:
+        return func(*args)
+    return await asyncio.to_thread(func, *args)
+
+
+async def _get_extended_title_info(
+    imdb_id, locale=None, sections: Iterable[str] = TITLE_SECTIONS
+) -> dict:
+    imdbId = "tt" + imdb_id
+    found, missing = await _off_loop(
+        _lookup_sections, "title_extended", imdbId, locale, sections
+    )
+    title = {}
+    if missing:
+        missing = tuple(missing)
+        title = await aio_flights.do(
+            ("title_sections", imdbId, locale, missing),
+            _fetch_title_sections,
+            imdb_id,
+            locale,
+            missing,
+        )
+        found.update((section, title.get(section)) for section in missing)
+    return _title_sections_json(imdbId, title, found)
+
+
+async def _fetch_title_sections(imdb_id: str, locale, missing: Tuple[str, ...]) -> dict:
+    imdbId = "tt" + imdb_id
+    payload = {"query": _extended_title_query(imdbId, missing)}
+    logger.info("Fetching title %s (%s) from GraphQL API", imdb_id, ", ".join(missing))
+    data = await request_graphql_url(
+        _graphql_headers(locale), imdbId, payload, GRAPHQL_URL
+    )
+    title = data.get("data", {}).get("title") or {}
+    await _off_loop(_store_sections, "title_extended", imdbId, locale, missing, title)
+    return title
+
+
+@with_deadline
+async def prefetch_title_sections(
+    imdb_id: str,
+    sections: Iterable[str] = TITLE_SECTIONS,
+    locale: Optional[str] = None,
+) -> None:
+    """Async version of :func:`imdbinfo.services.prefetch_title_sections`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    await _get_extended_title_info(imdb_id, lang, tuple(sections))
+
+
+async def _get_extended_titles_info(
+    imdb_ids: List[str], lang: str, sections: Tuple[str, ...], batch_size: int
+) -> Dict[str, dict]:
+    results, batches = await _off_loop(
+        _plan_title_batches, imdb_ids, lang, sections, batch_size
+    )
+    for batch in batches:
+        results.update(
+            await aio_flights.do(
+                ("title_sections", tuple(batch), lang, sections),
+                _fetch_title_batch,
+                batch,
+                lang,
+                sections,
+            )
+        )
+    return results
+
+
+async def _fetch_title_batch(
+    batch: List[str], lang: str, sections: Tuple[str, ...]
+) -> Dict[str, dict]:
+    imdbIds = ["tt" + imdb_id for imdb_id in batch]
+    payload = {"query": _extended_titles_query(imdbIds, sections)}
+    logger.info(
+        "Fetching %d titles (%s) from GraphQL API", len(batch), ", ".join(sections)
+    )
+    data = await request_graphql_url(
+        _graphql_headers(lang), ",".join(imdbIds), payload, GRAPHQL_URL, partial=True
+    )
+    return await _off_loop(_collect_title_batch, batch, data, lang, sections)
+
+
+@with_deadline
+async def get_akas_many(
+    imdb_ids: Iterable[str], locale: Optional[str] = None, batch_size: int = 25
+) -> Dict[str, Union[AkasData, list, GraphQLError]]:
+    """Async version of :func:`imdbinfo.services.get_akas_many`."""
+    normalized, lang = _normalize_many(imdb_ids, locale)
+    raw = await _get_extended_titles_info(
+        list(dict.fromkeys(normalized.values())), lang, ("akas",), batch_size
+    )
+    return _parse_many(normalized, raw, parse_json_akas, [])
+
+
+@with_deadline
+async def get_reviews_many(
+    imdb_ids: Iterable[str], locale: Optional[str] = None, batch_size: int = 25
+) -> Dict[str, Union[List[Dict], GraphQLError]]:
+    """Async version of :func:`imdbinfo.services.get_reviews_many`."""
+    normalized, lang = _normalize_many(imdb_ids, locale)
+    raw = await _get_extended_titles_info(
+        list(dict.fromkeys(normalized.values())), lang, ("reviews",), batch_size
+    )
+    return _parse_many(normalized, raw, parse_json_reviews, [])
+
+
+async def _iter_title_section(
+    imdb_id: str, section: str, locale: Optional[str], page_size: Optional[int]
+) -> AsyncIterator[Any]:
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    imdbId = "tt" + imdb_id
+    first = page_size or _TITLE_SECTION_PAGE_SIZE[section]
+    headers = _graphql_headers(lang)
+    cursor = ""
+    page = 0
+    while True:
+        page += 1
+        logger.info("Fetching %s page %d for title %s", section, page, imdb_id)
+        payload = {"query": _paged_title_query(imdbId, section, first, cursor)}
+        data = await request_graphql_url(headers, imdbId, payload, GRAPHQL_URL)
+        title = data.get("data", {}).get("title") or {}
+        items, cursor = _section_page(title, section)
+        for item in items:
+            yield item
+        if not cursor:
+            return
+
+
+@with_deadline
+def iter_reviews(
+    imdb_id: str, locale: Optional[str] = None, page_size: int = 50
+) -> AsyncIterator[Dict]:
+    """Async version of :func:`imdbinfo.services.iter_reviews`."""
+    return _iter_title_section(imdb_id, "reviews", locale, page_size)
+
+
+@with_deadline
+def iter_trivia(
+    imdb_id: str, locale: Optional[str] = None, page_size: int = 50
+) -> AsyncIterator[Dict]:
+    """Async version of :func:`imdbinfo.services.iter_trivia`."""
+    return _iter_title_section(imdb_id, "trivia", locale, page_size)
+
+
+@with_deadline
+def iter_akas(
+    imdb_id: str, locale: Optional[str] = None, page_size: int = 200
+) -> AsyncIterator[AkaInfo]:
+    """Async version of :func:`imdbinfo.services.iter_akas`."""
+    return _iter_title_section(imdb_id, "akas", locale, page_size)
+
+
+@with_deadline
+def iter_images(
+    imdb_id: str, locale: Optional[str] = None, page_size: int = 50
+) -> AsyncIterator[MediaItem]:
+    """Async version of :func:`imdbinfo.services.iter_images`."""
+    return _iter_title_section(imdb_id, "images", locale, page_size)
+
+
+async def _get_extended_name_info(person_id, locale=None) -> dict:
+    person_id = "nm" + person_id
+    payload = {"query": _extended_name_query(person_id)}
+    logger.info("Fetching person %s from GraphQL API", person_id)
+    data = await _cached_raw(
+        "name_extended",
+        person_id,
+        locale,
+        request_graphql_url,
+        _graphql_headers(locale),
+        person_id,
+        payload,
+        GRAPHQL_URL,
+    )
+    return data.get("data", {}).get("name", {})
+
+
+@with_deadline
+async def iter_filmography(
+    imdb_id: str,
+    locale: Optional[str] = None,
+    max_items: Optional[int] = None,
+    page_size: int = 250,
+) -> AsyncIterator[Tuple[str, MovieBriefInfo]]:
+    """Async version of :func:`imdbinfo.services.iter_filmography`."""
+    person_id, lang = normalize_imdb_id(imdb_id, locale)
+    person_id = "nm" + person_id
+    headers = _graphql_headers(lang)
+    yielded = 0
+    cursor = ""
+    while max_items is None or yielded < max_items:
+        logger.info("Fetching filmography page for person %s", person_id)
+        payload = {"query": _extended_name_query(person_id, page_size, cursor)}
+        data = await request_graphql_url(headers, person_id, payload, GRAPHQL_URL)
+        credits, cursor = _filmography_page(data)
+        for category, title in credits:
+            if max_items is not None and yielded >= max_items:
+                return
+            yielded += 1
+            yield category, title
+        if not cursor:
+            return
+
+
+@with_deadline
+async def get_akas(imdb_id: str, locale: Optional[str] = None) -> Union[AkasData, list]:
+    """Async version of :func:`imdbinfo.services.get_akas`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    raw_json = await _get_extended_title_info(imdb_id, lang, ("akas",))
+    if not raw_json:
+        logger.warning("No AKAs found for title %s", imdb_id)
+        return []
+    return parse_json_akas(raw_json)
+
+
+@with_deadline
+async def get_all_interests(imdb_id: str, locale: Optional[str] = None):
+    """Async version of :func:`imdbinfo.services.get_all_interests`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    raw_json = await _get_extended_title_info(imdb_id, lang, ("interests",))
+    if not raw_json:
+        logger.warning("No interests found for title %s", imdb_id)
+        return []
+    return parse_json_interests(raw_json)
+
+
+@with_deadline
+async def get_trivia(imdb_id: str, locale: Optional[str] = None) -> List[Dict]:
+    """Async version of :func:`imdbinfo.services.get_trivia`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    raw_json = await _get_extended_title_info(imdb_id, lang, ("trivia",))
+    if not raw_json:
+        logger.warning("No trivia found for title %s", imdb_id)
+        return []
+    return parse_json_trivia(raw_json)
+
+
+@with_deadline
+async def get_reviews(imdb_id: str, locale: Optional[str] = None) -> List[Dict]:
+    """Async version of :func:`imdbinfo.services.get_reviews`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    raw_json = await _get_extended_title_info(imdb_id, lang, ("reviews",))
+    if not raw_json:
+        logger.warning("No reviews found for title %s", imdb_id)
+        return []
+    return parse_json_reviews(raw_json)
+
+
+@with_deadline
+async def get_parental_guide(imdb_id: str, locale: Optional[str] = None) -> Dict:
+    """Async version of :func:`imdbinfo.services.get_parental_guide`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    raw_json = await _get_extended_title_info(imdb_id, lang, ("parentsGuide",))
+    if not raw_json:
+        logger.warning("No parental guide found for title %s", imdb_id)
+        return {}
+    return parse_json_parental_guide(raw_json)
+
+
+@with_deadline
+async def get_filmography(imdb_id, locale: Optional[str] = None) -> dict:
+    """Async version of :func:`imdbinfo.services.get_filmography`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    raw_json = await _get_extended_name_info(imdb_id, lang)
+    if not raw_json:
+        logger.warning("No full_credit found for name %s", imdb_id)
+        return {}
+    return parse_json_filmography(raw_json)
+
+
+@with_deadline
+@memoize("title_extended")
+async def get_media_gallery(
+    imdb_id: str,
+    locale: Optional[str] = None,
+) -> Optional[MediaGallery]:
+    """Async version of :func:`imdbinfo.services.get_media_gallery`."""
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    raw_json = await _get_extended_title_info(imdb_id, lang, ("images",))
+    if not raw_json:
+        logger.warning("No media_gallery found for title %s", imdb_id)
+        return []
+    return parse_json_media_gallery(raw_json)
@@ -0,0 +1,702 @@
+# MIT License
+# Copyright (c) 2025 tveronesi+imdbinfo@gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Caches used by the getters.
+
+:class:`MemoryCache` holds parsed results in-process, bounded by entry count
+and approximate size, with a time-to-live per data type. Every cached getter
+goes through the module-level :data:`memory_cache` via :func:`memoize`.
+
+:class:`DiskCache` is the opt-in persistent tier: raw JSON payloads
+(``__NEXT_DATA__`` pages and GraphQL results) are stored in a SQLite database
+keyed by ``(endpoint, id, locale)``. Each endpoint has its own time-to-live
+and the least recently used entries are evicted once the database grows past
+``max_bytes``. SQLite's own locking makes the store safe to share between
+worker processes.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import re
+import sqlite3
+import sys
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+from time import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+import pydantic_core
+
+from . import decoder
+from .exceptions import RequestTimeoutError
+from .retry import deadline_exceeded, remaining_time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.cwd() / ".cache" / "imdbinfo"
+DEFAULT_CACHE_FILE = "responses.sqlite3"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Seconds each kind of payload stays fresh. Ratings and votes move daily,
+# people and filmographies far less often.
+DEFAULT_TTLS: Dict[str, float] = {
+    "title": 24 * 3600,
+    "title_extended": 24 * 3600,
+    "name": 7 * 24 * 3600,
+    "name_extended": 7 * 24 * 3600,
+    "season": 24 * 3600,
+    "episodes": 24 * 3600,
+    "search": 6 * 3600,
+}
+DEFAULT_TTL = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    endpoint TEXT NOT NULL,
+    key TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    PRIMARY KEY (endpoint, key, locale)
+)
+"""
+# columns added after the first release, created on older databases
+_VALIDATOR_COLUMNS = ("etag", "last_modified")
+
+
+class DiskCache:
+    """SQLite-backed store for raw JSON responses.
+
+    ``ttls`` overrides :data:`DEFAULT_TTLS` per endpoint; a TTL of ``0``
+    disables caching for that endpoint. Hit/miss counters are kept per
+    process and returned by :meth:`stats`.
+
+    Entries stored with HTTP validators (``ETag`` / ``Last-Modified``) are
+    kept after they expire so they can be revalidated with a conditional
+    request (:meth:`get_stale`); a ``304`` renews them with :meth:`refresh`.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.path = Path(path) if path else DEFAULT_CACHE_DIR / DEFAULT_CACHE_FILE
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_bytes = max_bytes
+        self._counters: Counter = Counter()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        for column in _VALIDATOR_COLUMNS:
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+        logger.debug("Opened response cache %s", self.path)
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, DEFAULT_TTL)
+
+    def get(self, endpoint: str, key: str, locale: Optional[str] = None) -> Any:
+        """Return the cached payload, or ``None`` on a miss or expired entry."""
+        locale = locale or ""
+        now = time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at, etag, last_modified FROM responses "
+                "WHERE endpoint = ? AND key = ? AND locale = ?",
+                (endpoint, key, locale),
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self._counters[endpoint, "misses"] += 1
+                if row is not None:
+                    if row[2] is None and row[3] is None:
+                        self._delete(endpoint, key, locale)
+                    self._counters[endpoint, "expired"] += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? "
+                "WHERE endpoint = ? AND key = ? AND locale = ?",
+                (now, endpoint, key, locale),
+            )
+            self._counters[endpoint, "hits"] += 1
+        logger.debug("Response cache hit for %s %s (%s)", endpoint, key, locale)
+        return decoder.loads(row[0])
+
+    def set(
+        self,
+        endpoint: str,
+        key: str,
+        locale: Optional[str],
+        value: Any,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Store ``value`` (any JSON-serializable payload) for ``endpoint``'s TTL.
+
+        ``validators`` may hold the response's ``etag`` and ``last_modified``.
+        """
+        ttl = self.ttl(endpoint)
+        if not ttl or ttl <= 0:
+            return
+        blob = decoder.dumps(value)
+        validators = validators or {}
+        now = time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (endpoint, key, locale, value, "
+                "size, expires_at, accessed_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    endpoint,
+                    key,
+                    locale or "",
+                    blob,
+                    len(blob),
+                    now + ttl,
+                    now,
+                    validators.get("etag"),
+                    validators.get("last_modified"),
+                ),
+            )
+            self._counters[endpoint, "stores"] += 1
+            self._evict()
+
+    def get_stale(
+        self, endpoint: str, key: str, locale: Optional[str] = None
+    ) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """Return ``(payload, validators)`` of an entry that can be revalidated.
+
+        Expired entries are returned too; ``None`` when nothing is stored or
+        the entry has no validators. Each call counts as a revalidation.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, etag, last_modified FROM responses "
+                "WHERE endpoint = ? AND key = ? AND locale = ?",
+                (endpoint, key, locale or ""),
+            ).fetchone()
+            if row is None or (row[1] is None and row[2] is None):
+                return None
+            self._counters[endpoint, "revalidations"] += 1
+        validators = {"etag": row[1], "last_modified": row[2]}
+        return decoder.loads(row[0]), {k: v for k, v in validators.items() if v}
+
+    def refresh(self, endpoint: str, key: str, locale: Optional[str] = None) -> None:
+        """Renew an entry the server reported unchanged (HTTP 304)."""
+        now = time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ? "
+                "WHERE endpoint = ? AND key = ? AND locale = ?",
+                (now + self.ttl(endpoint), now, endpoint, key, locale or ""),
+            )
+            self._counters[endpoint, "not_modified"] += 1
+
+    def invalidate(self, endpoint: str, key: str, locale: Optional[str] = None) -> None:
+        """Drop one entry; with ``locale=None`` every locale of ``key`` is dropped."""
+        with self._lock:
+            if locale is None:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE endpoint = ? AND key = ?",
+                    (endpoint, key),
+                )
+            else:
+                self._delete(endpoint, key, locale)
+
+    def invalidate_id(self, imdb_id: str, endpoint: Optional[str] = None) -> int:
+        """Drop every entry stored for ``imdb_id`` (all seasons and locales).
+
+        Bare digits are taken as a title id; pass ``nm...`` for a person.
+        """
+        tag = _id_tag(imdb_id)
+        if tag is None:
+            return 0
+        sql = "DELETE FROM responses WHERE (key = ? OR key LIKE ?)" + (
+            " AND endpoint = ?" if endpoint else ""
+        )
+        params = [tag, f"{tag}:%"]
+        if endpoint:
+            params.append(endpoint)
+        with self._lock:
+            return max(self._conn.execute(sql, params).rowcount, 0)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._counters.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters (total and per endpoint) and the store size."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            counters = dict(self._counters)
+        totals: Counter = Counter()
+        endpoints: Dict[str, Dict[str, int]] = {}
+        for (endpoint, name), count in counters.items():
+            totals[name] += count
+            endpoints.setdefault(endpoint, {})[name] = count
+        revalidations = totals["revalidations"]
+        return {
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "stores": totals["stores"],
+            "expired": totals["expired"],
+            "evictions": totals["evictions"],
+            "revalidations": revalidations,
+            "not_modified": totals["not_modified"],
+            # share of conditional requests answered with 304
+            "revalidation_hit_rate": (
+                totals["not_modified"] / revalidations if revalidations else 0.0
+            ),
+            "entries": entries,
+            "bytes": size,
+            "endpoints": endpoints,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _delete(self, endpoint: str, key: str, locale: str) -> None:
+        self._conn.execute(
+            "DELETE FROM responses WHERE endpoint = ? AND key = ? AND locale = ?",
+            (endpoint, key, locale),
+        )
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones above ``max_bytes``.
+
+        Expired entries with validators stay until the size bound needs room.
+        """
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ? "
+            "AND etag IS NULL AND last_modified IS NULL",
+            (time(),),
+        )
+        (size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if size <= self.max_bytes:
+            return
+        victims = []
+        rows = self._conn.execute(
+            "SELECT endpoint, key, locale, size FROM responses ORDER BY accessed_at"
+        )
+        for endpoint, key, locale, entry_size in rows:
+            if size <= self.max_bytes:
+                break
+            victims.append((endpoint, key, locale))
+            size -= entry_size
+        self._conn.executemany(
+            "DELETE FROM responses WHERE endpoint = ? AND key = ? AND locale = ?",
+            victims,
+        )
+        for endpoint, _, _ in victims:
+            self._counters[endpoint, "evictions"] += 1
+        logger.debug("Evicted %d entries from the response cache", len(victims))
+
+
+# In-memory cache
+# ---------------
+# Seconds parsed results stay fresh in memory, per data type (same names as
+# the disk cache endpoints). Kept short so ratings and votes do not go stale
+# in long-running processes.
+DEFAULT_MEMORY_TTLS: Dict[str, float] = {
+    "title": 3600,
+    "title_extended": 3600,
+    "name": 6 * 3600,
+    "season": 3600,
+    "episodes": 3600,
+    "search": 600,
+    # parsed pages kept by validator, reused when a revalidation gets a 304
+    "validated": 7 * 24 * 3600,
+}
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MEMORY_MAX_BYTES = 256 * 1024 * 1024
+
+_MISSING = object()
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a cached result, as its JSON length.
+
+    Serialized by pydantic-core, which handles models, lists and dicts of
+    them without building the intermediate ``model_dump()`` structures.
+    """
+    try:
+        return len(pydantic_core.to_json(value, fallback=str))
+    except (TypeError, ValueError, pydantic_core.PydanticSerializationError):
+        return sys.getsizeof(value)
+
+
+_ID_RE = re.compile(r"(tt|nm)?(\d+)")
+
+# getter kinds whose ids are people; every other kind is keyed by title
+_NAME_KINDS = frozenset({"name", "name_extended"})
+
+
+def _id_tag(value: Any, prefix: str = "tt") -> Optional[str]:
+    """Normalize an IMDb id to its tag (``0133093`` -> ``tt0133093``).
+
+    The ``tt``/``nm`` prefix is kept so a title and a person sharing the
+    same digits are told apart; bare digits get ``prefix``.
+    """
+    match = _ID_RE.search(str(value)) if value is not None else None
+    if match is None:
+        return None
+    return f"{match.group(1) or prefix}{int(match.group(2)):07d}"
+
+
+class MemoryCache:
+    """Thread-safe LRU of parsed results with per-type TTLs and a size bound.
+
+    Entries are evicted least recently used first once either ``max_entries``
+    or ``max_bytes`` is exceeded, and dropped on access after their type's
+    TTL. A TTL of ``0`` disables caching for that type.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MEMORY_MAX_BYTES,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_MEMORY_TTLS, **(ttls or {})}
+        # key -> (value, size, expires_at, kind, tag)
+        self._entries: "OrderedDict[Hashable, Tuple]" = OrderedDict()
+        self._bytes = 0
+        self._counters: Counter = Counter()
+        self._lock = threading.RLock()
+
+    def configure(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if ttls:
+                self.ttls.update(ttls)
+            self._evict()
+
+    def ttl(self, kind: str) -> float:
+        return self.ttls.get(kind, DEFAULT_TTL)
+
+    def get(self, key: Hashable, kind: str, count: bool = True) -> Any:
+        """Return the cached value or the ``_MISSING`` sentinel.
+
+        ``count=False`` leaves the hit/miss counters untouched (re-checks).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= time():
+                self._pop(key)
+                self._counters[kind, "expired"] += 1
+                entry = None
+            if entry is None:
+                if count:
+                    self._counters[kind, "misses"] += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            if count:
+                self._counters[kind, "hits"] += 1
+            return entry[0]
+
+    def set(
+        self, key: Hashable, value: Any, kind: str, tag: Optional[str] = None
+    ) -> None:
+        ttl = self.ttl(kind)
+        if not ttl or ttl <= 0:
+            return
+        size = _estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (value, size, time() + ttl, kind, tag)
+            self._bytes += size
+            self._evict()
+
+    def invalidate(self, imdb_id: str, kind: Optional[str] = None) -> int:
+        """Drop every entry for ``imdb_id`` (optionally of one ``kind``).
+
+        Bare digits are taken as a title id; pass ``nm...`` for a person.
+        """
+        tag = _id_tag(imdb_id)
+        return self._discard(
+            lambda entry: entry[4] == tag and (kind is None or entry[3] == kind)
+        )
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        """Drop every entry (or those of ``kind``); counters are reset on a full clear."""
+        if kind is None:
+            with self._lock:
+                self._entries.clear()
+                self._bytes = 0
+                self._counters.clear()
+            return
+        self._discard(lambda entry: entry[3] == kind)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters (total and per type) and the current size."""
+        with self._lock:
+            counters = dict(self._counters)
+            entries, size = len(self._entries), self._bytes
+        totals: Counter = Counter()
+        kinds: Dict[str, Dict[str, int]] = {}
+        for (kind, name), count in counters.items():
+            totals[name] += count
+            kinds.setdefault(kind, {})[name] = count
+        return {
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "expired": totals["expired"],
+            "evictions": totals["evictions"],
+            "entries": entries,
+            "bytes": size,
+            "kinds": kinds,
+        }
+
+    def _pop(self, key: Hashable) -> Tuple:
+        entry = self._entries.pop(key)
+        self._bytes -= entry[1]
+        return entry
+
+    def _discard(self, predicate: Callable[[Tuple], bool]) -> int:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if predicate(entry)]
+            for key in keys:
+                self._pop(key)
+        return len(keys)
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry[1]
+            self._counters[entry[3], "evictions"] += 1
+
+
+memory_cache = MemoryCache()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _own_deadline(error: Optional[BaseException]) -> bool:
+    """Whether ``error`` is the leading caller running out of its own deadline."""
+    return isinstance(error, RequestTimeoutError) and error.deadline_exceeded
+
+
+class SingleFlight:
+    """Coalesce concurrent calls sharing a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait and receive the same result (or exception). Nothing is
+    remembered once the call completes, that is the caches' job. Waiters
+    only give up on their own deadline: when the leading caller runs out of
+    its deadline, one of them takes over and runs the call again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.shared = 0  # calls served by another caller's in-flight fetch
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = _Call()
+                    break
+                self.shared += 1
+            logger.debug("Waiting for in-flight call %s", key)
+            if not call.done.wait(remaining_time()):
+                raise deadline_exceeded()
+            if not _own_deadline(call.error):
+                if call.error is not None:
+                    raise call.error
+                return call.result
+            logger.debug("In-flight call %s ran out of its deadline, taking over", key)
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """:class:`SingleFlight` for coroutines; calls only coalesce within a loop.
+
+    When the leading coroutine is cancelled or runs out of its deadline its
+    waiters are not affected: one of them takes over and runs the call again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        key = (loop, key)  # futures cannot be awaited across loops
+        while key in self._calls:
+            future = self._calls[key]
+            self.shared += 1
+            logger.debug("Waiting for in-flight call %s", key[1])
+            try:
+                result = await asyncio.wait_for(
+                    asyncio.shield(future), remaining_time()
+                )
+            except asyncio.TimeoutError:
+                if future.done():  # the leader's own timeout error
+                    raise
+                raise deadline_exceeded() from None
+            if result is not _MISSING:
+                return result
+            logger.debug("In-flight call %s was not completed, taking over", key[1])
+        future = self._calls[key] = loop.create_future()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            # a cancelled leader must not cancel its waiters: they retry
+            future.set_result(_MISSING)
+            raise
+        except BaseException as exc:
+            if _own_deadline(exc):  # nor fail them with its deadline
+                future.set_result(_MISSING)
+            else:
+                future.set_exception(exc)
+                future.exception()  # retrieved: waiters are optional
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+flights = SingleFlight()
+aio_flights = AsyncSingleFlight()
+
+
+def _memo_key(name: str, args: tuple, kwargs: dict) -> Hashable:
+    return (name, args, tuple(sorted(kwargs.items())))
+
+
+def memoize(kind: str, by_id: bool = True) -> Callable:
+    """Cache a getter's results in :data:`memory_cache` under data type ``kind``.
+
+    Drop-in replacement for ``functools.lru_cache``: arguments must be
+    hashable, exceptions are not cached and the wrapper keeps a
+    ``cache_clear()`` method (clearing every entry of ``kind``). With
+    ``by_id`` the first argument is treated as an IMDb id so
+    :meth:`MemoryCache.invalidate` can find the entry. Concurrent misses
+    for the same arguments share a single call through :data:`flights`.
+    Coroutine functions are supported too, coalescing through
+    :data:`aio_flights`.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+        first_param = next(iter(inspect.signature(func).parameters))
+        prefix = "nm" if kind in _NAME_KINDS else "tt"
+
+        def tag(args, kwargs):
+            if by_id:
+                return _id_tag(args[0] if args else kwargs.get(first_param), prefix)
+            return None
+
+        if inspect.iscoroutinefunction(func):
+
+            async def aload(key, args, kwargs):
+                value = memory_cache.get(key, kind, count=False)
+                if value is not _MISSING:
+                    return value
+                value = await func(*args, **kwargs)
+                memory_cache.set(key, value, kind, tag(args, kwargs))
+                return value
+
+            @functools.wraps(func)
+            async def awrapper(*args, **kwargs):
+                key = _memo_key(name, args, kwargs)
+                value = memory_cache.get(key, kind)
+                if value is not _MISSING:
+                    return value
+                return await aio_flights.do(key, aload, key, args, kwargs)
+
+            awrapper.cache_clear = lambda: memory_cache.clear(kind)
+            return awrapper
+
+        def load(key, args, kwargs):
+            # another caller may have filled the entry just before we led
+            value = memory_cache.get(key, kind, count=False)
+            if value is not _MISSING:
+                return value
+            value = func(*args, **kwargs)
+            memory_cache.set(key, value, kind, tag(args, kwargs))
+            return value
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _memo_key(name, args, kwargs)
+            value = memory_cache.get(key, kind)
+            if value is not _MISSING:
+                return value
+            return flights.do(key, load, key, args, kwargs)
+
+        wrapper.cache_clear = lambda: memory_cache.clear(kind)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,132 @@
+# MIT License
+# Copyright (c) 2025 tveronesi+imdbinfo@gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""JSON decoding backends for page payloads and GraphQL responses.
+
+The fastest installed backend is picked at import time, in the order of
+:data:`BACKENDS`; the standard library ``json`` module is always available
+as fallback. All backends decode straight from ``bytes`` (or ``bytearray``)
+so callers never need to build an intermediate ``str``. :func:`dumps` uses
+the same backend to serialize payloads for the response cache.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+_Codec = Tuple[Callable[[Any], Any], Callable[[Any], bytes]]
+
+
+def _json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _orjson_codec() -> _Codec:
+    import orjson
+
+    # orjson.JSONDecodeError already subclasses ValueError
+    return orjson.loads, orjson.dumps
+
+
+def _msgspec_codec() -> _Codec:
+    import msgspec
+
+    decode = msgspec.json.decode
+
+    def loads(data: Union[bytes, bytearray, str]) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError as exc:
+            # keep the ``ValueError`` contract of ``json.loads``
+            raise ValueError(str(exc)) from exc
+
+    return loads, msgspec.json.encode
+
+
+_FACTORIES: Dict[str, Callable[[], _Codec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": lambda: (_json_loads, _json_dumps),
+}
+
+_backend = "json"
+_loads: Callable[[Any], Any] = _json_loads
+_dumps: Callable[[Any], bytes] = _json_dumps
+
+
+def set_json_backend(name: str = None) -> str:
+    """Select the JSON decoder backend and return the name actually in use.
+
+    With no ``name`` the first importable entry of :data:`BACKENDS` is used.
+    Asking for a backend that is not installed logs a warning and falls back
+    to the standard library.
+    """
+    global _backend, _loads, _dumps
+    candidates = BACKENDS if name is None else (name,)
+    for candidate in candidates:
+        factory = _FACTORIES.get(candidate)
+        if factory is None:
+            logger.warning(
+                "Unknown JSON backend '%s'. Falling back to 'json'.", candidate
+            )
+            continue
+        try:
+            codec = factory()
+        except ImportError:
+            if name is not None:
+                logger.warning(
+                    "JSON backend '%s' is not installed. Falling back to 'json'.",
+                    candidate,
+                )
+            continue
+        _backend, (_loads, _dumps) = candidate, codec
+        break
+    else:
+        _backend, _loads, _dumps = "json", _json_loads, _json_dumps
+    logger.debug("Using JSON backend '%s'", _backend)
+    return _backend
+
+
+def get_json_backend() -> str:
+    """Return the name of the active JSON decoder backend."""
+    return _backend
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Decode ``data`` with the active backend; raises ``ValueError`` on bad input."""
+    return _loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes with the active backend."""
+    return _dumps(obj)
+
+
+set_json_backend()
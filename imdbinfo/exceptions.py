@@ -27,14 +27,24 @@ ImdbinfoError
 ├── HTTPError        — any non-200 HTTP response (status_code, url, response_text)
 │   └── WAFError     — HTTP 202 from AWS WAF enforcement
 ├── GraphQLError     — non-200 or {"errors": …} from the GraphQL endpoint
-└── ParseError       — __NEXT_DATA__ script not found in HTML response
+├── ParseError       — __NEXT_DATA__ script not found in HTML response
+└── RequestTimeoutError — request timed out or the call's deadline passed
 """
 
 from typing import Optional, List, Dict, Any
 
 
 class ImdbinfoError(Exception):
-    """Base class for all imdbinfo exceptions."""
+    """Base class for all imdbinfo exceptions.
+
+    Attributes
+    ----------
+    retries : int
+        How many times the failing request was retried before the error was
+        raised (see :func:`imdbinfo.configure_retries`).
+    """
+
+    retries: int = 0
 
 
 class HTTPError(ImdbinfoError):
@@ -148,3 +158,41 @@ class ParseError(ImdbinfoError):
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(url={self.url!r}, message={str(self)!r})"
+
+
+class RequestTimeoutError(ImdbinfoError, TimeoutError):
+    """Raised when a request times out or a getter's ``deadline`` is exceeded.
+
+    Also a subclass of the built-in :class:`TimeoutError`.
+
+    Attributes
+    ----------
+    url : str
+        The URL being requested (may be empty when no request was pending).
+    timeout : Optional[float]
+        The timeout in seconds that expired, when known.
+    deadline_exceeded : bool
+        ``True`` when the call's overall ``deadline`` ran out (never
+        retried), ``False`` for a single request timing out.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        url: str = "",
+        timeout: Optional[float] = None,
+        deadline_exceeded: bool = False,
+    ):
+        super().__init__(message)
+        self.url: str = url
+        self.timeout: Optional[float] = timeout
+        self.deadline_exceeded: bool = deadline_exceeded
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"url={self.url!r}, "
+            f"timeout={self.timeout!r}, "
+            f"deadline_exceeded={self.deadline_exceeded!r}, "
+            f"message={str(self)!r})"
+        )
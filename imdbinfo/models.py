@@ -550,6 +550,7 @@ class SeasonEpisodesList(BaseModel):
         None  # Total number of episodes in the series
     )
     total_series_seasons: Optional[int] = None  # Total number of seasons in the series
+    season_numbers: Optional[List[int]] = None  # Season numbers listed by IMDb, e.g. [1, 2, 4]
     top_ten_episodes: Optional[List[dict]] = (
         None  # List of top ten episodes based on rating
     )
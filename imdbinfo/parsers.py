@@ -19,8 +19,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Optional, List, Dict, Union, Any
+from typing import Optional, List, Dict, Union, Any, Callable, Tuple
+from functools import lru_cache
 import logging
+import re
 
 import jmespath
 
@@ -125,14 +127,76 @@ OldCategoryIdToNewCategoryIdObject = flip_unique(
 )
 
 
+@lru_cache(maxsize=1024)
+def _compile_jmespath(query: str):
+    """Compile a JMESPath expression once; parsers reuse a small fixed set."""
+    return jmespath.compile(query)
+
+
 def pjmespatch(query, data, post_process=None, *args, **kwargs):
-    result = jmespath.search(query, data)
+    result = _compile_jmespath(query).search(data)
     # logger.debug("Query %s -> %s", query, result)
     if post_process:
         return post_process(result, *args, **kwargs)
     return result
 
 
+# Plain dotted paths with optional ``[]`` flatten projections, e.g.
+# ``akas.edges[].node.text``: these are walked directly instead of through
+# the JMESPath interpreter.
+_PLAIN_PATH = re.compile(
+    r"^[A-Za-z_][A-Za-z0-9_]*(?:(?:\.|\[\]\.?)[A-Za-z_][A-Za-z0-9_]*)*(?:\[\])?$"
+)
+
+
+def _walk(data, keys: Tuple[str, ...]):
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _flatten(items: List[Any]) -> List[Any]:
+    """JMESPath ``[]``: merge nested lists one level deep."""
+    flat = []
+    for item in items:
+        if isinstance(item, list):
+            flat.extend(item)
+        else:
+            flat.append(item)
+    return flat
+
+
+@lru_cache(maxsize=1024)
+def _compile_lookup(query: str) -> Callable[[Any], Any]:
+    """Return a callable evaluating ``query`` with JMESPath semantics.
+
+    Plain paths and ``[]`` flatten projections are resolved with dict
+    lookups; anything else (filters, multi-selects, indexes) falls back to
+    the compiled JMESPath expression.
+    """
+    if not _PLAIN_PATH.match(query):
+        return _compile_jmespath(query).search
+    head, *stages = [
+        tuple(key for key in part.split(".") if key) for part in query.split("[]")
+    ]
+
+    def lookup(data):
+        value = _walk(data, head)
+        for keys in stages:
+            if not isinstance(value, list):
+                return None
+            value = [
+                v
+                for v in (_walk(item, keys) for item in _flatten(value))
+                if v is not None
+            ]
+        return value
+
+    return lookup
+
+
 def _parse_directors(result):
     if not result:
         return []
@@ -288,218 +352,148 @@ def _parse_awards(awards_node) -> AwardInfo:
     return awards
 
 
+MAIN_COLUMN_PATH = "props.pageProps.mainColumnData"
+ABOVE_THE_FOLD_PATH = "props.pageProps.aboveTheFoldData"
+
+
+def _movie_lookups(raw_json):
+    """Return ``(main, above)`` field getters for a title page.
+
+    The ``mainColumnData`` and ``aboveTheFoldData`` sections are resolved
+    once and every field is read relative to them.
+    """
+
+    def relative(section):
+        def lookup(query, post_process=None):
+            result = _compile_lookup(query)(section)
+            if post_process:
+                return post_process(result)
+            return result
+
+        return lookup
+
+    main_column = _compile_lookup(MAIN_COLUMN_PATH)(raw_json)
+    above_the_fold = _compile_lookup(ABOVE_THE_FOLD_PATH)(raw_json)
+    return relative(main_column), relative(above_the_fold)
+
+
+def _certificate_rows(edges) -> Optional[List[List[Any]]]:
+    """``edges[].node.[id,country.id,country.text,rating,ratingReason,attributes[].text]``."""
+    if not isinstance(edges, list):
+        return None
+    nodes = [
+        node
+        for node in (_walk(e, ("node",)) for e in _flatten(edges))
+        if node is not None
+    ]
+    return [
+        [
+            _walk(node, ("id",)),
+            _walk(node, ("country", "id")),
+            _walk(node, ("country", "text")),
+            _walk(node, ("rating",)),
+            _walk(node, ("ratingReason",)),
+            _texts(_walk(node, ("attributes",))),
+        ]
+        for node in nodes
+    ]
+
+
+def _mpaa_edges(edges) -> Optional[List[Any]]:
+    """``edges[?node.ratingsBody.id=='MPAA']``."""
+    if not isinstance(edges, list):
+        return None
+    return [e for e in edges if _walk(e, ("node", "ratingsBody", "id")) == "MPAA"]
+
+
+def _texts(items) -> Optional[List[Any]]:
+    """``[].text`` of a list of nodes, without going through JMESPath."""
+    if not isinstance(items, list):
+        return None
+    return [
+        item["text"]
+        for item in _flatten(items)
+        if isinstance(item, dict) and item.get("text") is not None
+    ]
+
+
 def parse_json_movie(raw_json) -> Optional[MovieDetail]:
     logger.debug("Parsing movie JSON")
     data = {}
     movie: Union[TvSeriesDetail, TvEpisodeDetail, MovieDetail]
-    mainColumnData = pjmespatch("props.pageProps.mainColumnData", raw_json)
+    mainColumnData = pjmespatch(MAIN_COLUMN_PATH, raw_json)
     if not mainColumnData:
         logger.warning("'mainColumnData' not found in movie JSON")
         return None
-    movie_kind = pjmespatch(
-        "props.pageProps.mainColumnData.titleType.id", raw_json
-    )  # movie/tvSeries/tvEpisode
-    data["imdbId"] = pjmespatch(
-        "props.pageProps.mainColumnData.id", raw_json
-    )  # mainColumnData['id']
+    main, above = _movie_lookups(raw_json)
+    movie_kind = main("titleType.id")  # movie/tvSeries/tvEpisode
+    data["imdbId"] = main("id")  # mainColumnData['id']
     data["imdb_id"] = data["imdbId"].replace("tt", "")  # movie id without 'tt'
     data["id"] = data["imdb_id"]  # same as imdb_id
     data["url"] = f"{TITLE_URL}{data['imdbId']}/"
-    data["title"] = pjmespatch(
-        "props.pageProps.aboveTheFoldData.originalTitleText.text", raw_json
-    )
-    data["awards"] = pjmespatch(
-        "props.pageProps.mainColumnData.[wins.total,nominationsExcludeWins.total,prestigiousAwardSummary ]",
-        raw_json,
+    data["title"] = above("originalTitleText.text")
+    data["awards"] = main(
+        "[wins.total,nominationsExcludeWins.total,prestigiousAwardSummary ]",
         _parse_awards,
     )
-    data["title_localized"] = pjmespatch(
-        "props.pageProps.aboveTheFoldData.titleText.text", raw_json
-    )
-    data["title_akas"] = pjmespatch(
-        "props.pageProps.mainColumnData.akas.edges[].node.text", raw_json
-    )
+    data["title_localized"] = above("titleText.text")
+    data["title_akas"] = main("akas.edges[].node.text")
     data["kind"] = movie_kind
-    data["metacritic_rating"] = pjmespatch(
-        "props.pageProps.mainColumnData.metacritic.metascore.score", raw_json
-    )
-    data["cover_url"] = pjmespatch(
-        "props.pageProps.aboveTheFoldData.primaryImage.url", raw_json
-    )
-    data["plot"] = pjmespatch(
-        "props.pageProps.mainColumnData.plot.plotText.plainText", raw_json
-    )
+    data["metacritic_rating"] = main("metacritic.metascore.score")
+    data["cover_url"] = above("primaryImage.url")
+    data["plot"] = main("plot.plotText.plainText")
     # TODO release_date format with datetime...
-    data["release_date"] = pjmespatch(
-        "props.pageProps.mainColumnData.releaseDate", raw_json, _release_date
-    )
-    data["year"] = pjmespatch(
-        "props.pageProps.aboveTheFoldData.releaseYear.year", raw_json
-    )
-    data["year_end"] = pjmespatch(
-        "props.pageProps.aboveTheFoldData.releaseYear.endYear", raw_json
-    )
-    data["duration"] = pjmespatch(
-        "props.pageProps.aboveTheFoldData.runtime.seconds",
-        raw_json,
-        lambda x: x / 60 if x else None,
-    )
-    data["rating"] = pjmespatch(
-        "props.pageProps.mainColumnData.ratingsSummary.aggregateRating", raw_json
-    )
-    data["votes"] = pjmespatch(
-        "props.pageProps.mainColumnData.ratingsSummary.voteCount", raw_json
-    )
-    data["genres"] = pjmespatch(
-        "props.pageProps.mainColumnData.genres.genres[].text", raw_json
-    )
-    data["worldwide_gross"] = pjmespatch(
-        "props.pageProps.mainColumnData.worldwideGross.total.[amount,currency]",
-        raw_json,
-        _join,
-    )
-    data["production_budget"] = pjmespatch(
-        "props.pageProps.mainColumnData.productionBudget.budget.[amount,currency]",
-        raw_json,
-        _join,
-    )
-    data["trailers"] = pjmespatch(
-        "props.pageProps.mainColumnData.primaryVideos.edges[].node.id",
-        raw_json,
+    data["release_date"] = main("releaseDate", _release_date)
+    data["year"] = above("releaseYear.year")
+    data["year_end"] = above("releaseYear.endYear")
+    data["duration"] = above("runtime.seconds", lambda x: x / 60 if x else None)
+    data["rating"] = main("ratingsSummary.aggregateRating")
+    data["votes"] = main("ratingsSummary.voteCount")
+    data["genres"] = main("genres.genres[].text")
+    data["worldwide_gross"] = main("worldwideGross.total.[amount,currency]", _join)
+    data["production_budget"] = main("productionBudget.budget.[amount,currency]", _join)
+    data["trailers"] = main(
+        "primaryVideos.edges[].node.id",
         lambda x: [f"{VIDEO_URL}{i}" for i in (x or []) if i],
     )
-    data["interests"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.interests.edges[].node.primaryText.text",
-            raw_json,
-        )
-        or []
-    )
+    data["interests"] = main("interests.edges[].node.primaryText.text") or []
 
-    data["certificates"] = pjmespatch(
-        "props.pageProps.mainColumnData.certificates.edges[].node.[id,country.id,country.text,rating,ratingReason,attributes[].text]",
-        raw_json,
-        _certificates_to_dict,
-    )
+    certificate_edges = main("certificates.edges")
+    data["certificates"] = _certificates_to_dict(_certificate_rows(certificate_edges))
     # TODO is not working 100% need deeper check
-    data["mpaa"] = pjmespatch(
-        "props.pageProps.mainColumnData.certificates.edges[?node.ratingsBody.id=='MPAA']",
-        raw_json,
-        _parse_mpaa,
-    )
-    data["stars"] = pjmespatch(
-        "props.pageProps.mainColumnData.principalCreditsV2",
-        raw_json,
-        _parse_principal_credits_v2_stars,
-    )
-    data["directors"] = pjmespatch(
-        "props.pageProps.mainColumnData.crewV2",
-        raw_json,
-        _parse_directors_crewv2,
-    )
+    data["mpaa"] = _parse_mpaa(_mpaa_edges(certificate_edges))
+    data["stars"] = main("principalCreditsV2", _parse_principal_credits_v2_stars)
+    data["directors"] = main("crewV2", _parse_directors_crewv2)
 
     if not data["directors"]:  # fallback to old parsing if new one fails
-        data["directors"] = pjmespatch(
-            "props.pageProps.mainColumnData.creditGroupings.edges[].node",
-            raw_json,
-            _parse_directors,
-        )
-
-    data["filming_locations"] = pjmespatch(
-        "props.pageProps.mainColumnData.filmingLocations.edges[].node.text", raw_json
-    )
-    data["country_codes"] = pjmespatch(
-        "props.pageProps.mainColumnData.countriesDetails.countries[].id", raw_json
-    )
-    data["countries"] = pjmespatch(
-        "props.pageProps.mainColumnData.countriesDetails.countries[].text", raw_json
-    )
-    data["storyline_keywords"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.storylineKeywords.edges[].node.text",
-            raw_json,
-        )
-        or []
-    )
-    data["production"] = pjmespatch(
-        "props.pageProps.mainColumnData.production.edges[].node.company.companyText.text",
-        raw_json,
-    )
-    data["summaries"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.summaries.edges[].node.plotText.plaidHtml",
-            raw_json,
-        )
-        or []
-    )
-    data["synopses"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.synopses.edges[].node.plotText.plaidHtml",
-            raw_json,
-        )
-        or []
-    )
-    data["sound_mixes"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.technicalSpecifications.soundMixes.items[].text",
-            raw_json,
-        )
-        or []
-    )
-    data["processes"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.technicalSpecifications.processes.items[].process",
-            raw_json,
-        )
-        or []
-    )
+        data["directors"] = main("creditGroupings.edges[].node", _parse_directors)
+
+    data["filming_locations"] = main("filmingLocations.edges[].node.text")
+    data["country_codes"] = main("countriesDetails.countries[].id")
+    data["countries"] = main("countriesDetails.countries[].text")
+    data["storyline_keywords"] = main("storylineKeywords.edges[].node.text") or []
+    data["production"] = main("production.edges[].node.company.companyText.text")
+    data["summaries"] = main("summaries.edges[].node.plotText.plaidHtml") or []
+    data["synopses"] = main("synopses.edges[].node.plotText.plaidHtml") or []
+    data["sound_mixes"] = main("technicalSpecifications.soundMixes.items[].text") or []
+    data["processes"] = main("technicalSpecifications.processes.items[].process") or []
     data["printed_formats"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.technicalSpecifications.printedFormats.items[].printedFormat",
-            raw_json,
-        )
-        or []
+        main("technicalSpecifications.printedFormats.items[].printedFormat") or []
     )
     data["negative_formats"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.technicalSpecifications.negativeFormats.items[].negativeFormat",
-            raw_json,
-        )
-        or []
+        main("technicalSpecifications.negativeFormats.items[].negativeFormat") or []
     )
     data["laboratories"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.technicalSpecifications.laboratories.items[].laboratory",
-            raw_json,
-        )
-        or []
-    )
-    data["colorations"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.technicalSpecifications.colorations.items[].text",
-            raw_json,
-        )
-        or []
+        main("technicalSpecifications.laboratories.items[].laboratory") or []
     )
-    data["cameras"] = (
-        pjmespatch(
-            "props.pageProps.mainColumnData.technicalSpecifications.cameras.items[].camera",
-            raw_json,
-        )
-        or []
-    )
-    data["aspect_ratios"] = pjmespatch(
-        "props.pageProps.mainColumnData.technicalSpecifications.aspectRatios.items[].[aspectRatio,attributes[0].text]",
-        raw_json,
+    data["colorations"] = main("technicalSpecifications.colorations.items[].text") or []
+    data["cameras"] = main("technicalSpecifications.cameras.items[].camera") or []
+    data["aspect_ratios"] = main(
+        "technicalSpecifications.aspectRatios.items[].[aspectRatio,attributes[0].text]",
         _none_to_string_in_list,
     )
-    data["languages"] = pjmespatch(
-        "props.pageProps.mainColumnData.spokenLanguages.spokenLanguages[].id", raw_json
-    )
-    data["languages_text"] = pjmespatch(
-        "props.pageProps.mainColumnData.spokenLanguages.spokenLanguages[].text",
-        raw_json,
-    )
+    data["languages"] = main("spokenLanguages.spokenLanguages[].id")
+    data["languages_text"] = main("spokenLanguages.spokenLanguages[].text")
     # categories
 
     data["categories"] = {"cast": []}  # init with cast to avoid keyerror
@@ -509,9 +503,7 @@ def parse_json_movie(raw_json) -> Optional[MovieDetail]:
         for c in newCreditCategoryIdToOldCategoryIdObject.values()
     ]
 
-    for category in (
-        pjmespatch("props.pageProps.mainColumnData.categories[]", raw_json) or []
-    ):
+    for category in main("categories[]") or []:
         jobtitle = category["name"]
         _category_id_ = category["id"]
 
@@ -534,33 +526,26 @@ def parse_json_movie(raw_json) -> Optional[MovieDetail]:
     # company_credits [ distributors , production_companies, special_effects_companies, etc ]
     data["company_credits"] = {}
 
-    company_credit_categories = pjmespatch(
-        "props.pageProps.mainColumnData.companyCreditCategories[]", raw_json
-    )
+    company_credit_categories = main("companyCreditCategories[]")
     if company_credit_categories:
-        for company_credits_category in pjmespatch(
-            "props.pageProps.mainColumnData.companyCreditCategories[]", raw_json
-        ):
+        for company_credits_category in company_credit_categories:
             cat_id = company_credits_category.get("category").get("id")
             if not cat_id:  # sometimes there is no id, skip those
                 continue
             data["company_credits"].setdefault(cat_id, [])
             for company in company_credits_category["companyCredits"]["edges"]:
                 company_node = company.get("node", {})
+                company_id = company_node.get("company", {}).get("id", "")
                 company_data = {
-                    "id": company_node.get("company", {})
-                    .get("id", "")
-                    .replace("co", ""),
-                    "imdb_id": company_node.get("company", {})
-                    .get("id", "")
-                    .replace("co", ""),
-                    "imdbId": company_node.get("company", {}).get("id", ""),
+                    "id": company_id.replace("co", ""),
+                    "imdb_id": company_id.replace("co", ""),
+                    "imdbId": company_id,
                     "name": company_node.get("displayableProperty", {})
                     .get("value", {})
                     .get("plainText", ""),
-                    "url": f"{COMPANY_URL}{company_node.get('company', {}).get('id', '')}/",
-                    "attributes": pjmespatch("[].text", company_node.get("attributes")),
-                    "countries": pjmespatch("[].text", company_node.get("countries")),
+                    "url": f"{COMPANY_URL}{company_id}/",
+                    "attributes": _texts(company_node.get("attributes")),
+                    "countries": _texts(company_node.get("countries")),
                 }
                 data["company_credits"][cat_id].append(CompanyInfo(**company_data))
 
@@ -568,45 +553,21 @@ def parse_json_movie(raw_json) -> Optional[MovieDetail]:
     # tvMovie,short,movie,tvEpisode,tvMiniseries,tvSpecial,tvShort,videoGame,video,musicVideo,podcastEpisode,podcastSeries
     if movie_kind in SERIES_IDENTIFIERS:
         data["info_series"] = InfoSeries(
-            display_years=pjmespatch(
-                "props.pageProps.mainColumnData.episodes.displayableYears.edges[].node.year",
-                raw_json,
-            )
+            display_years=main("episodes.displayableYears.edges[].node.year") or [],
+            display_seasons=main("episodes.displayableSeasons.edges[].node.season")
             or [],
-            display_seasons=pjmespatch(
-                "props.pageProps.mainColumnData.episodes.displayableSeasons.edges[].node.season",
-                raw_json,
-            )
-            or [],
-            creators=pjmespatch(
-                "props.pageProps.mainColumnData.principalCreditsV2[0].credits[]",
-                raw_json,
-                _parse_creators,
-            ),
+            creators=main("principalCreditsV2[0].credits[]", _parse_creators),
         )
         logger.info("Parsed series %s", data["imdbId"])
         movie = TvSeriesDetail.model_validate(data)
 
     elif movie_kind in EPISODE_IDENTIFIERS:
         data["info_episode"] = InfoEpisode(
-            season_n=pjmespatch(
-                "props.pageProps.mainColumnData.series.episodeNumber.seasonNumber",
-                raw_json,
-            ),
-            episode_n=pjmespatch(
-                "props.pageProps.mainColumnData.series.episodeNumber.episodeNumber",
-                raw_json,
-            ),
-            series_imdbId=pjmespatch(
-                "props.pageProps.mainColumnData.series.series.id", raw_json
-            ),
-            series_title=pjmespatch(
-                "props.pageProps.mainColumnData.series.series.originalTitleText.text",
-                raw_json,
-            ),
-            series_title_localized=pjmespatch(
-                "props.pageProps.mainColumnData.series.series.titleText.text", raw_json
-            ),
+            season_n=main("series.episodeNumber.seasonNumber"),
+            episode_n=main("series.episodeNumber.episodeNumber"),
+            series_imdbId=main("series.series.id"),
+            series_title=main("series.series.originalTitleText.text"),
+            series_title_localized=main("series.series.titleText.text"),
         )
         logger.info("Parsed episode %s", data["imdbId"])
         movie = TvEpisodeDetail.model_validate(data)
@@ -770,6 +731,9 @@ def parse_json_season_episodes(raw_json) -> SeasonEpisodesList:
     total_series_seasons = len(
         pjmespatch("props.pageProps.contentData.data.title.episodes.seasons", raw_json)
     )
+    season_numbers = pjmespatch(
+        "props.pageProps.contentData.data.title.episodes.seasons[].number", raw_json
+    )
     top_ten_episodes = pjmespatch(
         "props.pageProps.contentData.data.title.episodes.topTenEpisodes.edges[].[node.id,node.ratingsSummary.aggregateRating,node.ratingsSummary.voteCount]",
         raw_json,
@@ -788,6 +752,7 @@ def parse_json_season_episodes(raw_json) -> SeasonEpisodesList:
         top_rating_episode=top_rated_episode,
         total_series_episodes=total_series_episodes,
         total_series_seasons=total_series_seasons,
+        season_numbers=season_numbers,
         top_ten_episodes=top_ten_episodes,
         episodes=season_episodes,
     )
@@ -805,6 +770,20 @@ def parse_json_bulked_episodes(raw_json) -> List[BulkedEpisode]:
     return all_episodes
 
 
+def parse_json_bulked_episodes_total(raw_json) -> Optional[int]:
+    """Total number of matches reported by a bulk episodes search page."""
+    return pjmespatch("props.pageProps.searchResults.titleResults.total", raw_json)
+
+
+def parse_json_bulked_episodes_cursor(raw_json) -> Optional[str]:
+    """Continuation cursor of a bulk episodes search page, if it has one."""
+    results = pjmespatch("props.pageProps.searchResults.titleResults", raw_json) or {}
+    page_info = results.get("pageInfo") or {}
+    if page_info and not page_info.get("hasNextPage"):
+        return None
+    return page_info.get("endCursor") or results.get("nextCursor") or None
+
+
 def parse_json_akas(raw_json) -> AkasData:
     logger.debug("Parsing akas JSON")
     imdb_id = pjmespatch("id", raw_json)
@@ -860,6 +839,17 @@ def parse_json_filmography(raw_json) -> Dict[str, List[MovieBriefInfo]]:
     return credits_by_job
 
 
+def parse_json_interests(raw_json: dict) -> List[str]:
+    interests = []
+    interests_edges = raw_json.get("interests", {}).get("edges", [])
+    for edge in interests_edges:
+        node = edge.get("node", {})
+        primary_text = node.get("primaryText", {}).get("text", "")
+        if primary_text:
+            interests.append(primary_text)
+    return interests
+
+
 def parse_json_parental_guide(raw_json):
     """Return ParentalGuideData or None."""
     return ParentalGuideList.from_raw(raw_json.get("parentsGuide"))
@@ -0,0 +1,284 @@
+# MIT License
+# Copyright (c) 2025 tveronesi+imdbinfo@gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Retrying transient request failures.
+
+A :class:`RetryPolicy` re-runs a fetch that failed with a retryable error:
+an :class:`~imdbinfo.exceptions.HTTPError` or
+:class:`~imdbinfo.exceptions.GraphQLError` whose status code is in
+``retry_on``, or a transport error (``OSError``, which niquests' connection
+errors and timeouts derive from). Attempts are spaced by exponential
+backoff with optional full jitter, and stop after ``max_attempts`` or once
+the next attempt would start later than ``deadline`` seconds after the
+first. The exception finally raised carries the number of retries made in
+its ``retries`` attribute.
+
+A getter call can also carry a time budget: :func:`with_deadline` lets it
+accept ``deadline=`` (seconds for the whole call, including WAF solving,
+rate-limit waits and retries) and ``timeout=`` (per-request connect/read
+timeouts). Both live in context variables, so they follow the call into
+coroutines, tasks and, through :func:`in_context`, worker threads.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import random
+from contextlib import contextmanager
+from time import monotonic, sleep
+from typing import Any, Callable, FrozenSet, Iterable, Iterator, Optional, Tuple, Union
+
+from .exceptions import GraphQLError, HTTPError, RequestTimeoutError
+
+logger = logging.getLogger(__name__)
+
+Timeout = Union[float, Tuple[float, float]]
+
+# monotonic() time by which the current call must finish
+_deadline: contextvars.ContextVar = contextvars.ContextVar(
+    "imdbinfo_deadline", default=None
+)
+# per-call timeout overriding the global connect/read timeouts
+_timeout: contextvars.ContextVar = contextvars.ContextVar(
+    "imdbinfo_timeout", default=None
+)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current call's deadline, ``None`` without one."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - monotonic()
+
+
+def call_timeout() -> Optional[Timeout]:
+    """The ``timeout=`` given to the current getter call, if any."""
+    return _timeout.get()
+
+
+def check_deadline(url: str = "") -> Optional[float]:
+    """Return :func:`remaining_time`, raising once the deadline has passed."""
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise deadline_exceeded(url)
+    return remaining
+
+
+def deadline_exceeded(url: str = "") -> RequestTimeoutError:
+    target = f" for {url}" if url else ""
+    return RequestTimeoutError(
+        f"Deadline exceeded{target}", url=url, deadline_exceeded=True
+    )
+
+
+@contextmanager
+def request_scope(
+    deadline_at: Optional[float] = None, timeout: Optional[Timeout] = None
+) -> Iterator[None]:
+    """Apply an absolute deadline and a timeout to the calls made inside.
+
+    Nested scopes keep the earliest deadline.
+    """
+    outer = _deadline.get()
+    if outer is not None and (deadline_at is None or outer < deadline_at):
+        deadline_at = outer
+    deadline_token = _deadline.set(deadline_at)
+    timeout_token = _timeout.set(timeout if timeout is not None else _timeout.get())
+    try:
+        yield
+    finally:
+        _timeout.reset(timeout_token)
+        _deadline.reset(deadline_token)
+
+
+def _step_generator(gen: Iterator, deadline_at, timeout) -> Iterator:
+    try:
+        while True:
+            with request_scope(deadline_at, timeout):
+                try:
+                    item = next(gen)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        gen.close()
+
+
+async def _step_async_generator(agen, deadline_at, timeout):
+    try:
+        while True:
+            with request_scope(deadline_at, timeout):
+                try:
+                    item = await agen.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        await agen.aclose()
+
+
+def with_deadline(func: Callable) -> Callable:
+    """Let getter ``func`` accept ``deadline=`` and ``timeout=`` keywords.
+
+    Works for plain and async functions as well as for (async) generators,
+    whose every step runs under the budget fixed when they were called.
+    Apply it outside :func:`~imdbinfo.cache.memoize` so the keywords stay
+    out of the cache key.
+    """
+
+    def start(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else monotonic() + deadline
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, deadline=None, timeout=None, **kwargs):
+            with request_scope(start(deadline), timeout):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, deadline=None, timeout=None, **kwargs):
+        deadline_at = start(deadline)
+        with request_scope(deadline_at, timeout):
+            result = func(*args, **kwargs)
+        if inspect.isgenerator(result):
+            return _step_generator(result, deadline_at, timeout)
+        if inspect.isasyncgen(result):
+            return _step_async_generator(result, deadline_at, timeout)
+        return result
+
+    return wrapper
+
+
+def in_context(func: Callable) -> Callable:
+    """Bind ``func`` to the caller's context, for running in worker threads."""
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        # a context can only be entered by one thread at a time
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
+
+
+DEFAULT_RETRY_ON: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """Retry settings plus the sync and async loops that apply them."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        jitter: bool = True,
+        retry_on: Iterable[int] = DEFAULT_RETRY_ON,
+        deadline: Optional[float] = 30.0,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on = frozenset(retry_on)
+        self.deadline = deadline
+        self.retries = 0  # total retries made, for monitoring
+
+    def configure(self, **options: Any) -> None:
+        for name, value in options.items():
+            if value is not None:
+                setattr(self, name, frozenset(value) if name == "retry_on" else value)
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, RequestTimeoutError):
+            return not exc.deadline_exceeded
+        if isinstance(exc, (HTTPError, GraphQLError)):
+            return exc.status_code in self.retry_on
+        return isinstance(exc, OSError)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number ``attempt`` (1-based)."""
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def _next_delay(
+        self, exc: BaseException, attempt: int, started: float
+    ) -> Optional[float]:
+        """Return the wait before the next attempt, or ``None`` to give up.
+
+        Raises :class:`~imdbinfo.exceptions.RequestTimeoutError` (chained to
+        ``exc``) when a retry is due but the call's deadline would pass first.
+        """
+        delay = None
+        if attempt < self.max_attempts and self.is_retryable(exc):
+            delay = self.backoff_delay(attempt)
+            if self.deadline is not None and (
+                monotonic() + delay - started > self.deadline
+            ):
+                delay = None
+            remaining = remaining_time()
+            if remaining is not None and delay is not None and delay >= remaining:
+                timeout = deadline_exceeded(getattr(exc, "url", ""))
+                timeout.retries = attempt - 1
+                raise timeout from exc
+        if delay is None:
+            try:
+                exc.retries = attempt - 1
+            except AttributeError:  # exceptions with __slots__
+                pass
+            return None
+        self.retries += 1
+        logger.debug("Attempt %d failed (%s) — retrying in %.2fs", attempt, exc, delay)
+        return delay
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        started = monotonic()
+        attempt = 1
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as exc:
+                delay = self._next_delay(exc, attempt, started)
+                if delay is None:
+                    raise
+            sleep(delay)
+            attempt += 1
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        started = monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as exc:
+                delay = self._next_delay(exc, attempt, started)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+retry_policy = RetryPolicy()
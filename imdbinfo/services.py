@@ -18,11 +18,18 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import atexit
+import hashlib
+import os
 import random
 import re
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Union, List, Tuple, Any
-from functools import lru_cache
+from urllib.parse import quote
+from typing import Optional, Dict, Union, List, Tuple, Any, Iterable, Iterator, Callable
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from time import time
 import logging
 import niquests
@@ -30,7 +37,35 @@ import json
 from lxml import html
 from enum import Enum
 from .locale import _retrieve_url_lang, _get_country_code_from_lang_locale
-from .exceptions import HTTPError, WAFError, GraphQLError, ParseError
+from .exceptions import (
+    HTTPError,
+    WAFError,
+    GraphQLError,
+    ParseError,
+    RequestTimeoutError,
+)
+from . import decoder
+from .retry import (
+    Timeout,
+    call_timeout,
+    check_deadline,
+    deadline_exceeded,
+    in_context,
+    retry_policy,
+    with_deadline,
+)
+from .throttle import rate_limiter
+from .transfer import ACCEPT_ENCODING, transfer_meter
+from .cache import (
+    DiskCache,
+    DEFAULT_MAX_BYTES,
+    memoize,
+    memory_cache,
+    aio_flights,
+    flights,
+    _MISSING,
+    _id_tag,
+)
 
 from .models import (
     SearchResult,
@@ -38,7 +73,11 @@ from .models import (
     SeasonEpisodesList,
     PersonDetail,
     AkasData,
+    AkaInfo,
     MediaGallery,
+    MediaItem,
+    MovieBriefInfo,
+    BulkedEpisode,
 )
 from .parsers import (
     parse_json_movie,
@@ -46,15 +85,23 @@ from .parsers import (
     parse_json_person_detail,
     parse_json_season_episodes,
     parse_json_bulked_episodes,
+    parse_json_bulked_episodes_total,
+    parse_json_bulked_episodes_cursor,
     parse_json_akas,
     parse_json_trivia,
     parse_json_reviews,
     parse_json_filmography,
     parse_json_parental_guide,
     parse_json_media_gallery,
+    parse_json_interests,
 )
 from imdbinfo_aws.aws import AwsSolver
 
+try:
+    import fcntl
+except ImportError:  # Windows: the refresh is only serialized within a process
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 GRAPHQL_URL = "https://api.graphql.imdb.com/"
@@ -67,48 +114,652 @@ _WAF_COOKIE_FILE = Path.cwd() / ".cache" / "imdbinfo" / "waf_cookies.json"
 # dict    → valid cookies ready to use.
 _UNSET = object()
 _waf_cookies: Any = _UNSET
+# (inode, mtime) of the cookie file the mirror was loaded from or written to;
+# a different stamp means another process replaced the file.
+_waf_cookie_stamp: Optional[Tuple[int, int]] = None
+# Bumped on every save/delete so a caller can tell whether the cookies it
+# was rejected with are still current or were already replaced.
+_waf_generation = 0
+_waf_lock = threading.RLock()  # guards the mirror, the counter and the file
+_waf_solve_lock = threading.Lock()  # held for the whole solver run
+
+# Proactive refresh: a token is trusted for _WAF_TOKEN_LIFETIME seconds after
+# it was issued; once fewer than _WAF_REFRESH_MARGIN remain, the next request
+# starts a background solve and keeps using the current token meanwhile.
+_WAF_TOKEN_LIFETIME = 300.0
+_WAF_REFRESH_MARGIN = 30.0
+_WAF_REFRESH_URL = "https://www.imdb.com/"
+_waf_proactive_refresh = True
+_waf_issued_at: Optional[float] = None  # when the current token was solved
+_waf_retry_after = 0.0  # back-off after a background attempt that got nothing
+_waf_refresh_thread: Optional[threading.Thread] = None
+
+
+def configure_waf_refresh(
+    lifetime: Optional[float] = None,
+    margin: Optional[float] = None,
+    enabled: Optional[bool] = None,
+) -> None:
+    """Tune the proactive WAF token refresh.
+
+    ``lifetime`` is how many seconds a solved token is trusted. Once fewer
+    than ``margin`` seconds remain, the next request starts solving a new
+    challenge in a background thread while foreground requests keep using
+    the current token. ``enabled=False`` only refreshes after a request has
+    been rejected.
+    """
+    global _WAF_TOKEN_LIFETIME, _WAF_REFRESH_MARGIN, _waf_proactive_refresh
+    if lifetime is not None:
+        _WAF_TOKEN_LIFETIME = lifetime
+    if margin is not None:
+        _WAF_REFRESH_MARGIN = margin
+    if enabled is not None:
+        _waf_proactive_refresh = enabled
+
+
+def _waf_cookie_file_stamp() -> Optional[Tuple[int, int]]:
+    try:
+        st = _WAF_COOKIE_FILE.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns
 
 
 def _load_waf_cookies() -> Optional[Dict]:
     """Return WAF cookies from the in-memory cache.
-    On first call per process the cache is populated from disk (one file read only)."""
-    global _waf_cookies
-    if _waf_cookies is not _UNSET:
+
+    The cache is populated from disk on first call per process and reloaded
+    whenever the cookie file has been replaced since (e.g. by a sibling
+    worker that solved a fresh challenge); otherwise only a ``stat`` is made.
+    """
+    global _waf_cookies, _waf_cookie_stamp, _waf_generation, _waf_issued_at
+    stamp = _waf_cookie_file_stamp()
+    if _waf_cookies is not _UNSET and stamp in (None, _waf_cookie_stamp):
         return _waf_cookies  # fast path — already in memory
-    try:
-        if _WAF_COOKIE_FILE.exists():
-            data = json.loads(_WAF_COOKIE_FILE.read_text(encoding="utf-8"))
-            logger.debug("Loaded WAF cookies from %s", _WAF_COOKIE_FILE)
-            _waf_cookies = data
+    with _waf_lock:
+        stamp = _waf_cookie_file_stamp()
+        if _waf_cookies is not _UNSET and stamp in (None, _waf_cookie_stamp):
             return _waf_cookies
-    except Exception as exc:
-        logger.debug("Could not load WAF cookies from cache file: %s", exc)
-    _waf_cookies = None
-    return None
+        cookies = None
+        if stamp is not None:
+            try:
+                cookies = json.loads(_WAF_COOKIE_FILE.read_text(encoding="utf-8"))
+                logger.debug("Loaded WAF cookies from %s", _WAF_COOKIE_FILE)
+            except Exception as exc:
+                logger.debug("Could not load WAF cookies from cache file: %s", exc)
+        if _waf_cookies is not _UNSET:
+            _waf_generation += 1
+        _waf_cookies, _waf_cookie_stamp = cookies, stamp
+        # the file is written right after a solve: its mtime is the issue time
+        _waf_issued_at = stamp[1] / 1e9 if cookies else None
+        return cookies
+
+
+def _waf_cookie_state() -> Tuple[Optional[Dict], int]:
+    """Return the current cookies together with their generation."""
+    with _waf_lock:
+        return _load_waf_cookies(), _waf_generation
 
 
 def _save_waf_cookies(cookies: Dict) -> None:
-    """Update the in-memory cache and persist to disk."""
-    global _waf_cookies
-    _waf_cookies = cookies
+    """Update the in-memory cache and persist to disk.
+
+    The file is written to a temporary sibling and renamed into place, so
+    other processes never read a partially written file.
+    """
+    global _waf_cookies, _waf_cookie_stamp, _waf_generation, _waf_issued_at
+    with _waf_lock:
+        _waf_cookies, _waf_issued_at = cookies, time()
+        _waf_generation += 1
+        try:
+            _WAF_COOKIE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=_WAF_COOKIE_FILE.parent, prefix=".waf_cookies.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(cookies))
+                os.replace(tmp, _WAF_COOKIE_FILE)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            _waf_cookie_stamp = _waf_cookie_file_stamp()
+            logger.debug("Saved WAF cookies to %s", _WAF_COOKIE_FILE)
+        except Exception as exc:
+            logger.debug("Could not save WAF cookies to cache file: %s", exc)
+
+
+def _delete_waf_cookie_file(generation: Optional[int] = None) -> None:
+    """Clear the in-memory cache and remove the on-disk file.
+
+    With ``generation`` the cookies are only dropped if they have not been
+    replaced since that generation was observed.
+    """
+    global _waf_cookies, _waf_cookie_stamp, _waf_generation, _waf_issued_at
+    with _waf_lock:
+        if generation is not None and generation != _waf_generation:
+            return
+        _waf_cookies, _waf_cookie_stamp, _waf_issued_at = None, None, None
+        _waf_generation += 1
+        try:
+            if _WAF_COOKIE_FILE.exists():
+                _WAF_COOKIE_FILE.unlink()
+                logger.debug("Deleted WAF cookie cache file %s", _WAF_COOKIE_FILE)
+        except Exception as exc:
+            logger.debug("Could not delete WAF cookie cache file: %s", exc)
+
+
+@contextmanager
+def _waf_file_lock():
+    """Hold an exclusive advisory lock shared by every process using the cookie file."""
+    fd = None
+    if fcntl is not None:
+        try:
+            _WAF_COOKIE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(
+                _WAF_COOKIE_FILE.with_suffix(".lock"), os.O_RDWR | os.O_CREAT, 0o600
+            )
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except OSError as exc:
+            logger.debug("Could not lock WAF cookie file: %s", exc)
+            if fd is not None:
+                os.close(fd)
+                fd = None
     try:
-        _WAF_COOKIE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        _WAF_COOKIE_FILE.write_text(json.dumps(cookies), encoding="utf-8")
-        logger.debug("Saved WAF cookies to %s", _WAF_COOKIE_FILE)
-    except Exception as exc:
-        logger.debug("Could not save WAF cookies to cache file: %s", exc)
+        yield
+    finally:
+        if fd is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+def _refresh_waf_cookies(
+    generation: int, challenge: str, keep_on_failure: bool = False
+) -> Tuple[Optional[Dict], int]:
+    """Solve the WAF challenge once per expiry; return the cookies to retry with.
+
+    ``generation`` is the one the rejected request was sent with. Callers
+    queue on a lock; the first one runs the solver, the others find the
+    generation moved on and reuse its outcome (``None`` if it failed). The
+    solve also holds a file lock, and a token saved meanwhile by another
+    process is picked up instead of solving again. ``keep_on_failure``
+    leaves the current cookies in place when the solver fails. Waiting for
+    another caller's solve counts against the call's deadline.
+    """
+    remaining = check_deadline()
+    if not _waf_solve_lock.acquire(timeout=-1 if remaining is None else remaining):
+        raise deadline_exceeded()
+    try:
+        with _waf_file_lock():
+            return _solve_waf_challenge(generation, challenge, keep_on_failure)
+    finally:
+        _waf_solve_lock.release()
+
+
+def _solve_waf_challenge(
+    generation: int, challenge: str, keep_on_failure: bool
+) -> Tuple[Optional[Dict], int]:
+    """Body of :func:`_refresh_waf_cookies`, run with both locks held."""
+    _load_waf_cookies()
+    with _waf_lock:
+        if _waf_generation != generation:
+            logger.debug("WAF cookies already refreshed by another caller")
+            return _waf_cookies, _waf_generation
+    try:
+        cookies = get_cookies(challenge, USER_AGENT)
+    except Exception as waf_exc:
+        logger.debug(
+            "WAF solver failed, response will be evaluated upstream: %s", waf_exc
+        )
+        if keep_on_failure:
+            return None, _waf_generation
+        _delete_waf_cookie_file()
+        return None, _waf_generation
+    with _waf_lock:
+        _save_waf_cookies(cookies)
+        return cookies, _waf_generation
+
+
+def _schedule_waf_refresh(generation: int) -> None:
+    """Start a background solve if the current token is about to expire."""
+    global _waf_refresh_thread
+    if not _waf_proactive_refresh or _waf_issued_at is None:
+        return
+    now = time()
+    due = _waf_issued_at + _WAF_TOKEN_LIFETIME - _WAF_REFRESH_MARGIN
+    if now < max(due, _waf_retry_after):
+        return
+    with _waf_lock:
+        if _waf_refresh_thread is not None and _waf_refresh_thread.is_alive():
+            return
+        logger.debug("WAF token expires soon — refreshing in the background")
+        _waf_refresh_thread = threading.Thread(
+            target=_background_waf_refresh,
+            args=(generation,),
+            name="imdbinfo-waf-refresh",
+            daemon=True,
+        )
+        _waf_refresh_thread.start()
 
 
-def _delete_waf_cookie_file() -> None:
-    """Clear the in-memory cache and remove the on-disk file."""
-    global _waf_cookies
-    _waf_cookies = None
+def _background_waf_refresh(generation: int) -> None:
+    """Fetch a fresh challenge without cookies and solve it ahead of expiry."""
+    global _waf_retry_after
+    cookies = None
     try:
-        if _WAF_COOKIE_FILE.exists():
-            _WAF_COOKIE_FILE.unlink()
-            logger.debug("Deleted WAF cookie cache file %s", _WAF_COOKIE_FILE)
+        resp = _send("get", _WAF_REFRESH_URL, headers=HEADERS, stream=True)
+        try:
+            challenge = resp.text if resp.status_code != 200 else None
+        finally:
+            resp.close()
+        if challenge is None:
+            logger.debug("No WAF challenge served — keeping the current token")
+        else:
+            cookies, _ = _refresh_waf_cookies(
+                generation, challenge, keep_on_failure=True
+            )
     except Exception as exc:
-        logger.debug("Could not delete WAF cookie cache file: %s", exc)
+        logger.debug("Background WAF refresh failed: %s", exc)
+    if cookies is None:
+        # try again after another margin instead of on every request
+        _waf_retry_after = time() + _WAF_REFRESH_MARGIN
+
+
+# Shared HTTP session
+# -------------------
+# Every request goes through one process-wide niquests.Session so TCP/TLS
+# connections are pooled and kept alive across getters instead of being
+# re-established per call.
+_SESSION_OPTIONS: Dict[str, Any] = {
+    "pool_connections": 10,  # number of per-host pools kept around
+    "pool_maxsize": 10,  # max connections kept alive per host
+    "keepalive_delay": 600.0,  # seconds a connection may be kept alive
+    "keepalive_idle_window": 60.0,  # seconds between keep-alive pings
+    # WAF cookies are passed explicitly per request; a jar filled from
+    # Set-Cookie would keep sending tokens after they were discarded.
+    "allow_incoming_cookies": False,
+}
+_session: Optional[niquests.Session] = None
+_session_owned = True
+_session_lock = threading.Lock()
+
+
+def configure_session(**options) -> None:
+    """Set the options used to build the shared session.
+
+    Accepts any keyword understood by ``niquests.Session`` (e.g.
+    ``pool_connections``, ``pool_maxsize``, ``keepalive_delay``,
+    ``keepalive_idle_window``, ``proxies``). The current library-managed
+    session is closed and a new one is built lazily on the next request.
+    """
+    global _session
+    with _session_lock:
+        _SESSION_OPTIONS.update(options)
+        if _session is not None and _session_owned:
+            _session.close()
+            _session = None
+
+
+def set_session(session: Optional[niquests.Session]) -> None:
+    """Use a caller-owned ``niquests.Session`` for every request.
+
+    The caller stays responsible for closing it. Pass ``None`` to go back to
+    the library-managed session.
+    """
+    global _session, _session_owned
+    with _session_lock:
+        if _session is not None and _session_owned:
+            _session.close()
+        _session = session
+        _session_owned = session is None
+
+
+def get_session() -> niquests.Session:
+    """Return the shared session, creating it on first use."""
+    global _session, _session_owned
+    if _session is not None:
+        return _session
+    with _session_lock:
+        if _session is None:
+            logger.debug("Creating shared HTTP session with %s", _SESSION_OPTIONS)
+            _session = niquests.Session(**_SESSION_OPTIONS)
+            _session_owned = True
+        return _session
+
+
+def close_session() -> None:
+    """Close the library-managed session and release pooled connections.
+
+    An injected session is only detached, not closed.
+    """
+    global _session, _session_owned
+    with _session_lock:
+        if _session is not None and _session_owned:
+            _session.close()
+            logger.debug("Closed shared HTTP session")
+        _session = None
+        _session_owned = True
+
+
+atexit.register(close_session)
+
+
+# Request pacing
+# --------------
+# Every fetch waits for a token from its host's bucket (see imdbinfo.throttle);
+# the bucket's rate backs off on WAF challenges, 429s and 5xx and ramps up
+# again on successes.
+
+
+def configure_rate_limit(
+    host: Optional[str] = None,
+    enabled: Optional[bool] = None,
+    rate: Optional[float] = None,
+    burst: Optional[float] = None,
+    min_rate: Optional[float] = None,
+    max_rate: Optional[float] = None,
+    increase: Optional[float] = None,
+    decrease: Optional[float] = None,
+) -> None:
+    """Tune client-side rate limiting.
+
+    ``rate`` is the starting number of requests per second and ``burst`` the
+    bucket size. The rate is multiplied by ``decrease`` on 202/429/5xx
+    responses and grows by ``increase`` on every success, staying between
+    ``min_rate`` and ``max_rate``. Options apply to ``host`` (e.g.
+    ``"api.graphql.imdb.com"``) or to every host when omitted;
+    ``enabled=False`` turns pacing off.
+    """
+    if enabled is not None:
+        rate_limiter.enabled = enabled
+    rate_limiter.configure(
+        host,
+        rate=rate,
+        burst=burst,
+        min_rate=min_rate,
+        max_rate=max_rate,
+        increase=increase,
+        decrease=decrease,
+    )
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, float]]:
+    """Return the current rate, request, back-off and wait totals per host."""
+    return rate_limiter.stats()
+
+
+def transfer_stats() -> Dict[str, Dict[str, Any]]:
+    """Return wire vs decompressed byte counts per host.
+
+    ``wire_bytes`` is what was received (compressed), ``decoded_bytes``
+    what the parsers consumed; ``requests_<encoding>`` counts responses
+    per ``Content-Encoding``. Streamed pages only count the bytes read
+    before ``__NEXT_DATA__`` was found.
+    """
+    return transfer_meter.stats()
+
+
+def reset_transfer_stats() -> None:
+    transfer_meter.reset()
+
+
+# Timeouts
+# --------
+# Every request gets connect/read timeouts: the global ones below, or the
+# ``timeout=`` passed to the getter, shortened to what is left of the
+# getter's ``deadline=``.
+_TIMEOUTS: Dict[str, float] = {"connect": 5.0, "read": 30.0}
+
+
+def configure_timeouts(
+    connect: Optional[float] = None, read: Optional[float] = None
+) -> None:
+    """Set the default connect and read timeouts (seconds) of every request.
+
+    Getters also accept ``timeout=`` (seconds, or a ``(connect, read)``
+    tuple) for one call and ``deadline=`` to bound the whole call,
+    including WAF solving, rate-limit waits and retries; both raise
+    :class:`~imdbinfo.exceptions.RequestTimeoutError` when exceeded.
+    """
+    if connect is not None:
+        _TIMEOUTS["connect"] = connect
+    if read is not None:
+        _TIMEOUTS["read"] = read
+
+
+def _request_timeout(url: str) -> Tuple[float, float]:
+    """Return the ``(connect, read)`` timeouts for a request sent now."""
+    timeout: Optional[Timeout] = call_timeout()
+    if timeout is None:
+        connect, read = _TIMEOUTS["connect"], _TIMEOUTS["read"]
+    elif isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    remaining = check_deadline(url)
+    if remaining is not None:
+        connect, read = min(connect, remaining), min(read, remaining)
+    return connect, read
+
+
+def _send(method: str, url: str, **kwargs) -> Any:
+    """Send one request through the rate limiter with timeouts applied."""
+    if not rate_limiter.wait(url, check_deadline(url)):
+        raise deadline_exceeded(url)
+    timeout = _request_timeout(url)
+    try:
+        resp = getattr(get_session(), method)(url, timeout=timeout, **kwargs)
+    except niquests.Timeout as exc:
+        raise RequestTimeoutError(
+            f"Request to {url} timed out", url=url, timeout=max(timeout)
+        ) from exc
+    rate_limiter.record(url, resp)
+    if not kwargs.get("stream"):
+        transfer_meter.record(url, resp)
+    return resp
+
+
+def configure_retries(
+    max_attempts: Optional[int] = None,
+    backoff: Optional[float] = None,
+    max_backoff: Optional[float] = None,
+    jitter: Optional[bool] = None,
+    retry_on: Optional[Iterable[int]] = None,
+    deadline: Optional[float] = None,
+) -> None:
+    """Tune retries of page and GraphQL requests.
+
+    A request failing with a status in ``retry_on`` (default 429, 500, 502,
+    503, 504) or a connection error is attempted up to ``max_attempts``
+    times in total, waiting ``backoff * 2 ** n`` seconds (at most
+    ``max_backoff``, randomized when ``jitter`` is on) in between, as long
+    as the next attempt starts within ``deadline`` seconds of the first.
+    ``max_attempts=1`` disables retries. The exception finally raised
+    records the retries made in its ``retries`` attribute.
+    """
+    retry_policy.configure(
+        max_attempts=max_attempts,
+        backoff=backoff,
+        max_backoff=max_backoff,
+        jitter=jitter,
+        retry_on=retry_on,
+        deadline=deadline,
+    )
+
+
+# In-memory result cache
+# ----------------------
+# Getters are memoized in one shared, TTL-aware cache (see imdbinfo.cache)
+# instead of independent fixed-size LRUs.
+
+
+def configure_cache(
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    ttls: Optional[Dict[str, float]] = None,
+) -> None:
+    """Tune the in-memory result cache.
+
+    ``ttls`` maps data types (``title``, ``title_extended``, ``name``,
+    ``season``, ``episodes``, ``search``) to seconds; ``0`` disables caching
+    for that type. Entries over the new limits are evicted immediately.
+    """
+    memory_cache.configure(max_entries=max_entries, max_bytes=max_bytes, ttls=ttls)
+
+
+def invalidate(imdb_id: str, kind: Optional[str] = None) -> int:
+    """Forget cached results for one title or person and return how many were dropped.
+
+    Both the in-memory cache and, when enabled, the persistent cache are
+    purged, so the next call fetches fresh data.
+    """
+    removed = memory_cache.invalidate(imdb_id, kind)
+    if _disk_cache is not None:
+        removed += _disk_cache.invalidate_id(imdb_id, kind)
+    logger.debug("Invalidated %d cached entries for %s", removed, imdb_id)
+    return removed
+
+
+def clear_cache() -> None:
+    """Empty the in-memory result cache and reset its statistics."""
+    memory_cache.clear()
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Return hits, misses, evictions, entry count and size of the in-memory cache.
+
+    ``coalesced`` counts calls that waited for an identical in-flight fetch
+    instead of issuing their own.
+    """
+    return {
+        **memory_cache.stats(),
+        "coalesced": flights.shared + aio_flights.shared,
+    }
+
+
+# Persistent response cache
+# -------------------------
+# Opt-in: when enabled, raw JSON payloads are looked up on disk before any
+# request is made, so restarts and sibling worker processes reuse warm data.
+_disk_cache: Optional[DiskCache] = None
+
+
+def enable_disk_cache(
+    path: Optional[Union[str, Path]] = None,
+    ttls: Optional[Dict[str, float]] = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> DiskCache:
+    """Turn on the persistent response cache and return it.
+
+    ``path`` defaults to ``.cache/imdbinfo/responses.sqlite3``; ``ttls`` maps
+    endpoint names (``title``, ``name``, ``season``, ``episodes``, ``search``,
+    ``title_extended``, ``name_extended``) to seconds.
+    """
+    global _disk_cache
+    disable_disk_cache()
+    _disk_cache = DiskCache(path, ttls=ttls, max_bytes=max_bytes)
+    return _disk_cache
+
+
+def disable_disk_cache() -> None:
+    """Turn off the persistent response cache; stored entries are kept."""
+    global _disk_cache
+    if _disk_cache is not None:
+        _disk_cache.close()
+        _disk_cache = None
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """Return the active persistent cache, or ``None`` when disabled."""
+    return _disk_cache
+
+
+def _cached_raw(endpoint: str, key: str, lang: str, fetch, *args, **kwargs) -> Any:
+    """Return the raw payload for ``(endpoint, key, lang)``, fetching on a miss.
+
+    Concurrent calls for the same key share one in-flight request.
+    """
+    return flights.do(
+        ("raw", endpoint, key, lang),
+        _load_raw,
+        endpoint,
+        key,
+        lang,
+        fetch,
+        *args,
+        **kwargs,
+    )
+
+
+def _load_raw(endpoint: str, key: str, lang: str, fetch, *args, **kwargs) -> Any:
+    cache = _disk_cache
+    if cache is None:
+        return fetch(*args, **kwargs)
+    raw_json = cache.get(endpoint, key, lang)
+    if raw_json is None:
+        raw_json = fetch(*args, **kwargs)
+        cache.set(endpoint, key, lang, raw_json)
+    return raw_json
+
+
+def _cached_page(
+    endpoint: str, key: str, lang: str, url: str, parse: Callable[[Any], Any]
+) -> Any:
+    """Return ``parse`` applied to the page at ``url``, cached on disk.
+
+    An expired entry stored with validators is revalidated with a
+    conditional request; on ``304 Not Modified`` the entry is renewed and
+    the model parsed from it earlier is reused without parsing again.
+    """
+    return flights.do(
+        ("page", endpoint, key, lang), _load_page, endpoint, key, lang, url, parse
+    )
+
+
+def _load_page(endpoint: str, key: str, lang: str, url: str, parse) -> Any:
+    cache = _disk_cache
+    if cache is None:
+        return parse(request_json_url(url, stream=_stream_pages))
+    raw_json = cache.get(endpoint, key, lang)
+    if raw_json is not None:
+        return parse(raw_json)
+    stale = cache.get_stale(endpoint, key, lang)
+    validators = stale[1] if stale else None
+    raw_json, validators = retry_policy.call(
+        _request_json_url, url, _stream_pages, validators
+    )
+    model_key = _validated_key(endpoint, key, lang, validators)
+    if raw_json is None:
+        cache.refresh(endpoint, key, lang)
+        model = memory_cache.get(model_key, "validated")
+        if model is not _MISSING:
+            return model
+        raw_json = stale[0]
+    else:
+        cache.set(endpoint, key, lang, raw_json, validators)
+    model = parse(raw_json)
+    if validators:
+        memory_cache.set(model_key, model, "validated", _id_tag(key))
+    return model
+
+
+def _validated_key(
+    endpoint: str, key: str, lang: str, validators: Optional[Dict[str, str]]
+) -> Tuple:
+    validators = validators or {}
+    return (
+        "validated",
+        endpoint,
+        key,
+        lang,
+        validators.get("etag"),
+        validators.get("last_modified"),
+    )
+
+
+def _search_cache_key(headers: Dict[str, str], payload: Dict[str, str]) -> str:
+    query = headers.get("x-imdb-user-country", "") + payload["query"]
+    return hashlib.sha1(query.encode("utf-8")).hexdigest()
 
 
 class TitleType(Enum):
@@ -160,27 +811,80 @@ def get_cookies(text, user_agent, force=False):
         raise
 
 
-def request_json_url(url: str) -> Any:
-    resp = request_handler(url)
-    if resp.status_code != 200:
-        logger.error("Error fetching %s: %s", url, resp.status_code)
-        response_text = (resp.text or "")[:500]
-        if resp.status_code == 202:
-            raise WAFError(
-                f"AWS WAF enforcement blocked the request to {url} (HTTP 202). "
-                "Try again later, or use a different IP / proxy.",
-                status_code=202,
-                url=url,
-                response_text=response_text,
-            )
-        raise HTTPError(
-            f"Error fetching {url}: HTTP {resp.status_code}",
-            status_code=resp.status_code,
+def _check_page_response(resp: Any, url: str) -> None:
+    """Raise :class:`WAFError` / :class:`HTTPError` for a non-200 page response."""
+    if resp.status_code == 200:
+        return
+    logger.error("Error fetching %s: %s", url, resp.status_code)
+    response_text = (resp.text or "")[:500]
+    if resp.status_code == 202:
+        raise WAFError(
+            f"AWS WAF enforcement blocked the request to {url} (HTTP 202). "
+            "Try again later, or use a different IP / proxy.",
+            status_code=202,
             url=url,
             response_text=response_text,
         )
+    raise HTTPError(
+        f"Error fetching {url}: HTTP {resp.status_code}",
+        status_code=resp.status_code,
+        url=url,
+        response_text=response_text,
+    )
+
+
+_NEXT_DATA_MARKER = b"__NEXT_DATA__"
+_NEXT_DATA_TAG = re.compile(
+    rb"<script\b[^>]*\bid\s*=\s*[\"']?__NEXT_DATA__(?![\w-])[^>]*>", re.IGNORECASE
+)
+
+
+def _next_data_start(content, start: int = 0) -> Optional[int]:
+    """Return the offset right after the ``<script id="__NEXT_DATA__">`` tag."""
+    pos = content.find(_NEXT_DATA_MARKER, start)
+    while pos != -1:
+        tag_start = content.rfind(b"<", 0, pos)
+        match = _NEXT_DATA_TAG.match(content, tag_start) if tag_start != -1 else None
+        if match and match.end() > pos:
+            return match.end()
+        pos = content.find(_NEXT_DATA_MARKER, pos + len(_NEXT_DATA_MARKER))
+    return None
+
 
-    tree = html.fromstring(resp.content or b"")
+def _script_end(content, start: int) -> int:
+    """Return the offset of the next ``</script`` (any case), or -1."""
+    end = content.find(b"</", start)
+    while end != -1 and content[end : end + 8].lower() != b"</script":
+        end = content.find(b"</", end + 2)
+    return end
+
+
+def _find_next_data(content: bytes) -> Optional[bytes]:
+    """Locate the ``__NEXT_DATA__`` script body by scanning the raw bytes.
+
+    Avoids building a DOM for multi-megabyte pages. Returns ``None`` when the
+    tag cannot be located, so callers can fall back to the lxml path.
+    """
+    body_start = _next_data_start(content)
+    if body_start is None:
+        return None
+    end = _script_end(content, body_start)
+    return content[body_start:end] if end != -1 else None
+
+
+def _parse_next_data(content: Union[bytes, bytearray], url: str) -> Any:
+    """Return the decoded ``__NEXT_DATA__`` JSON embedded in an IMDb page."""
+    script_body = _find_next_data(content or b"")
+    if script_body is not None:
+        try:
+            return decoder.loads(script_body)
+        except ValueError:
+            logger.debug(
+                "Fast '__NEXT_DATA__' extraction failed for %s, falling back to lxml",
+                url,
+            )
+    # document_fromstring also takes the bytearray of a streamed page as is
+    tree = html.document_fromstring(content or b"")
     script = tree.xpath('//script[@id="__NEXT_DATA__"]/text()')
     if not script or type(script) is not list:
         logger.error("No script found with id '__NEXT_DATA__'")
@@ -188,13 +892,119 @@ def request_json_url(url: str) -> Any:
             f"No '__NEXT_DATA__' script tag found in the response from {url}",
             url=url,
         )
-    raw_json = json.loads(str(script[0]))
+    raw_json = decoder.loads(str(script[0]))
     return raw_json
 
 
+# Streaming mode: pages are read chunk by chunk and the download stops as
+# soon as the ``__NEXT_DATA__`` script is complete.
+_stream_pages = True
+_stream_chunk_size = 64 * 1024
+# bytes re-scanned from the previous chunk so a split tag is still found
+_STREAM_OVERLAP = 1024
+
+
+def set_streaming(enabled: bool, chunk_size: Optional[int] = None) -> None:
+    """Enable or disable streaming downloads for ``__NEXT_DATA__`` pages."""
+    global _stream_pages, _stream_chunk_size
+    _stream_pages = bool(enabled)
+    if chunk_size:
+        _stream_chunk_size = int(chunk_size)
+
+
+def _stream_next_data(resp: Any, url: str) -> Any:
+    """Decode ``__NEXT_DATA__`` from a streamed response without reading it all.
+
+    Chunks are appended to one buffer and only the new bytes are scanned;
+    the response is closed as soon as the closing tag is seen, so the rest
+    of the page is not downloaded. The call's deadline is checked between
+    chunks. Should the byte scan miss the tag (or its
+    body not decode), the same buffer goes through :func:`_parse_next_data`
+    and its lxml path.
+    """
+    buf = bytearray()
+    body_start = None
+    try:
+        for chunk in resp.iter_content(chunk_size=_stream_chunk_size):
+            check_deadline(url)  # a slow body must not outlive the call's budget
+            search_from = max(0, len(buf) - _STREAM_OVERLAP)
+            buf += chunk
+            if body_start is None:
+                body_start = _next_data_start(buf, search_from)
+                if body_start is None:
+                    continue
+                search_from = body_start
+            end = _script_end(buf, max(body_start, search_from - 8))
+            if end != -1:
+                logger.debug(
+                    "Found '__NEXT_DATA__' after %d bytes of %s", len(buf), url
+                )
+                try:
+                    return decoder.loads(buf[body_start:end])
+                except ValueError:
+                    break
+    finally:
+        resp.close()
+        transfer_meter.record(url, resp, len(buf))
+    logger.debug(
+        "Streaming '__NEXT_DATA__' extraction failed for %s, falling back to lxml",
+        url,
+    )
+    return _parse_next_data(buf, url)
+
+
+def request_json_url(url: str, stream: bool = False) -> Any:
+    return retry_policy.call(_request_json_url, url, stream)[0]
+
+
+def _request_json_url(
+    url: str, stream: bool, validators: Optional[Dict[str, str]] = None
+) -> Tuple[Any, Dict[str, str]]:
+    """Return the page's ``__NEXT_DATA__`` and the response's validators.
+
+    With ``validators`` the request is conditional and a ``304 Not
+    Modified`` answer returns ``(None, validators)``.
+    """
+    resp = request_handler(url, stream=stream, validators=validators)
+    if validators and resp.status_code == 304:
+        logger.debug("Not modified: %s", url)
+        _close(resp)
+        return None, validators
+    _check_page_response(resp, url)
+    if stream:
+        return _stream_next_data(resp, url), _response_validators(resp)
+    return _parse_next_data(resp.content, url), _response_validators(resp)
+
+
+def _conditional_headers(validators: Optional[Dict[str, str]]) -> Dict[str, str]:
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["if-none-match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["if-modified-since"] = validators["last_modified"]
+    return headers
+
+
+def _response_validators(resp: Any) -> Dict[str, str]:
+    headers = getattr(resp, "headers", None) or {}
+    validators = {
+        "etag": headers.get("ETag") or headers.get("etag"),
+        "last_modified": headers.get("Last-Modified") or headers.get("last-modified"),
+    }
+    return {name: value for name, value in validators.items() if value}
+
+
+def _close(resp: Any) -> None:
+    close = getattr(resp, "close", None)
+    if close is not None:
+        close()
+
+
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/145.0.0.0 Safari/537.36"
 HEADERS = {
     "connection": "keep-alive",
+    "accept-encoding": ACCEPT_ENCODING,
     "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
     "cache-control": "no-cache",
     "pragma": "no-cache",
@@ -210,42 +1020,46 @@ HEADERS = {
 }
 
 
-def request_handler(url: str) -> Any:
-    waf_cookies = _load_waf_cookies()
-    resp = niquests.get(url, headers=HEADERS, cookies=waf_cookies)
-    if resp.status_code == 200:
+def request_handler(
+    url: str, stream: bool = False, validators: Optional[Dict[str, str]] = None
+) -> Any:
+    conditional = _conditional_headers(validators)
+    headers = {**HEADERS, **conditional} if conditional else HEADERS
+    waf_cookies, generation = _waf_cookie_state()
+    _schedule_waf_refresh(generation)
+    resp = _send("get", url, headers=headers, cookies=waf_cookies, stream=stream)
+    if resp.status_code == 200 or (conditional and resp.status_code == 304):
         return resp
-    # Non-200: invalidate cached cookies and request fresh ones
+    # Non-200: request fresh cookies (solved once for all concurrent callers)
     logger.debug(
         "Non-200 response (%s) for %s — invalidating cached WAF cookies and refreshing",
         resp.status_code,
         url,
     )
-    _delete_waf_cookie_file()
-    try:
-        waf_cookies = get_cookies(resp.text, USER_AGENT)
-        _save_waf_cookies(waf_cookies)
-        logger.debug("WAF cookies refreshed — retrying %s", url)
-        resp = niquests.get(url, headers=HEADERS, cookies=waf_cookies)
-        if resp.status_code != 200:
-            logger.warning(
-                "Request still non-200 (%s) after WAF cookie refresh for %s — "
-                "discarding cookies, will retry fresh on next call",
-                resp.status_code,
-                url,
-            )
-            _delete_waf_cookie_file()
-    except Exception as waf_exc:
-        logger.debug(
-            "WAF solver failed, response will be evaluated upstream: %s", waf_exc
+    waf_cookies, generation = _refresh_waf_cookies(generation, resp.text)
+    if waf_cookies is None:
+        return resp
+    logger.debug("WAF cookies refreshed — retrying %s", url)
+    resp = _send("get", url, headers=headers, cookies=waf_cookies, stream=stream)
+    if resp.status_code != 200 and not (conditional and resp.status_code == 304):
+        logger.warning(
+            "Request still non-200 (%s) after WAF cookie refresh for %s — "
+            "discarding cookies, will retry fresh on next call",
+            resp.status_code,
+            url,
         )
-        _delete_waf_cookie_file()
-
+        _delete_waf_cookie_file(generation)
     return resp
 
 
-def request_graphql_url(headers, search_term, payload, url) -> Any:
-    resp = niquests.post(url, headers=headers, json=payload)
+def _check_graphql_response(
+    resp: Any, search_term: str, url: str, partial: bool = False
+) -> Any:
+    """Return the decoded GraphQL body, raising :class:`GraphQLError` on failure.
+
+    With ``partial`` a body carrying both ``data`` and ``errors`` is returned
+    as is, for callers that can tell which parts of the query failed.
+    """
     if resp.status_code != 200:
         logger.error("GraphQL request failed: %s", resp.status_code)
         raise GraphQLError(
@@ -255,8 +1069,10 @@ def request_graphql_url(headers, search_term, payload, url) -> Any:
             status_code=resp.status_code,
             response_text=(resp.text or "")[:500],
         )
-    data = resp.json()
-    if "errors" in data:
+    data = decoder.loads(resp.content)
+    if "errors" in data and partial and data.get("data"):
+        logger.warning("GraphQL partial error: %s", data["errors"])
+    elif "errors" in data:
         logger.error("GraphQL error: %s", data["errors"])
         raise GraphQLError(
             f"GraphQL error for {search_term!r}: {data['errors']}",
@@ -267,28 +1083,72 @@ def request_graphql_url(headers, search_term, payload, url) -> Any:
     return data
 
 
-@lru_cache(maxsize=128)
+def request_graphql_url(headers, search_term, payload, url, partial=False) -> Any:
+    return retry_policy.call(
+        _request_graphql_url, headers, search_term, payload, url, partial
+    )
+
+
+def _request_graphql_url(headers, search_term, payload, url, partial=False) -> Any:
+    resp = _send("post", url, headers=headers, json=payload)
+    return _check_graphql_response(resp, search_term, url, partial)
+
+
+def _graphql_headers(locale=None) -> Dict[str, str]:
+    return {
+        "Content-Type": "application/json",
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "x-imdb-user-country": _get_country_code_from_lang_locale(locale),
+    }
+
+
+def _movie_url(imdb_id: str, lang: str) -> str:
+    return f"https://www.imdb.com/{lang}/title/tt{imdb_id}/reference"
+
+
+def _name_url(person_id: str, lang: str) -> str:
+    return f"https://www.imdb.com/{lang}/name/nm{person_id}/"
+
+
+def _season_episodes_url(imdb_id: str, season, lang: str) -> str:
+    return f"https://www.imdb.com/{lang}/title/tt{imdb_id}/episodes/?season={season}"
+
+
+# Episodes per bulk search page (the largest ``count`` IMDb accepts).
+_ALL_EPISODES_PAGE_SIZE = 250
+
+
+def _all_episodes_url(
+    series_id: str, lang: str, start: int = 1, after: str = ""
+) -> str:
+    url = f"https://www.imdb.com/{lang}/search/title/?count={_ALL_EPISODES_PAGE_SIZE}&series=tt{series_id}&sort=release_date,asc"
+    if after:
+        return f"{url}&after={quote(after)}"
+    return f"{url}&start={start}" if start > 1 else url
+
+
+@with_deadline
+@memoize("title")
 def get_movie(imdb_id: str, locale: Optional[str] = None) -> Optional[MovieDetail]:
     """Fetch movie details from IMDb using the provided IMDb ID as string,
     preserve the 'tt' prefix or not, it will be stripped in the function.
     """
     imdb_id, lang = normalize_imdb_id(imdb_id, locale)
-    url = f"https://www.imdb.com/{lang}/title/tt{imdb_id}/reference"
+    url = _movie_url(imdb_id, lang)
     logger.info("Fetching movie %s", imdb_id)
-    raw_json = request_json_url(url)
-    movie = parse_json_movie(raw_json)
+    movie = _cached_page("title", f"tt{imdb_id}", lang, url, parse_json_movie)
     logger.debug("Fetched url %s", url)
     return movie
 
 
-@lru_cache(maxsize=128)
-def search_title(
+def _search_payload(
     search_term: str,
     year: int | None = None,
     exact_match: bool = False,
     locale: Optional[str] = None,
     title_type: Optional[TitleFilter] = None,
-) -> Optional[SearchResult]:
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Build the headers and GraphQL payload used by :func:`search_title`."""
     lang = _retrieve_url_lang(locale)
     country_code = _get_country_code_from_lang_locale(lang)
 
@@ -380,9 +1240,86 @@ query {
     )
     payload = {"query": query}
     headers = {"Content-Type": "application/json", "x-imdb-user-country": country_code}
+    return headers, payload
+
+
+def _dedupe_ids(ids: Iterable[str], locale: Optional[str] = None) -> Iterator[str]:
+    """Yield ids whose normalized form has not been seen yet (first spelling wins)."""
+    seen = set()
+    for imdb_id in ids:
+        try:
+            key = normalize_imdb_id(imdb_id, locale)
+        except ValueError:
+            key = imdb_id  # let the getter report the invalid id
+        if key in seen:
+            continue
+        seen.add(key)
+        yield imdb_id
+
+
+@with_deadline
+def get_movies(
+    imdb_ids: Iterable[str],
+    locale: Optional[str] = None,
+    max_workers: int = 8,
+) -> Iterator[Tuple[str, Union[MovieDetail, Exception]]]:
+    """Fetch many titles concurrently with a bounded thread pool.
+
+    Ids are de-duplicated after normalization and results are yielded as
+    ``(imdb_id, MovieDetail | exception)`` in completion order, so a failing
+    title never aborts the batch. At most ``2 * max_workers`` fetches are
+    queued at once, which keeps memory flat for very large inputs and lets
+    callers stop early.
+    """
+    pending = {}
+    ids = _dedupe_ids(imdb_ids, locale)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for imdb_id in ids:
+                pending[executor.submit(in_context(get_movie), imdb_id, locale)] = (
+                    imdb_id
+                )
+                if len(pending) < 2 * max_workers:
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _batch_result(pending.pop(future), future)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _batch_result(pending.pop(future), future)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _batch_result(imdb_id: str, future) -> Tuple[str, Any]:
+    try:
+        return imdb_id, future.result()
+    except Exception as exc:
+        logger.warning("Batch fetch failed for %s: %s", imdb_id, exc)
+        return imdb_id, exc
+
+
+@with_deadline
+@memoize("search", by_id=False)
+def search_title(
+    search_term: str,
+    year: int | None = None,
+    exact_match: bool = False,
+    locale: Optional[str] = None,
+    title_type: Optional[TitleFilter] = None,
+) -> Optional[SearchResult]:
+    headers, payload = _search_payload(
+        search_term, year, exact_match, locale, title_type
+    )
 
     logger.info("Searching for '%s' using GraphQL API", search_term)
-    data = request_graphql_url(
+    data = _cached_raw(
+        "search",
+        _search_cache_key(headers, payload),
+        _retrieve_url_lang(locale),
+        request_graphql_url,
         headers=headers,
         search_term=search_term,
         payload=payload,
@@ -393,51 +1330,178 @@ query {
     return result
 
 
-@lru_cache(maxsize=128)
+@with_deadline
+@memoize("name")
 def get_name(person_id: str, locale: Optional[str] = None) -> Optional[PersonDetail]:
     """Fetch person details from IMDb using the provided IMDb ID.
     Preserve the 'nm' prefix or not, it will be stripped in the function.
     """
     person_id, lang = normalize_imdb_id(person_id, locale)
-    url = f"https://www.imdb.com/{lang}/name/nm{person_id}/"
+    url = _name_url(person_id, lang)
     t0 = time()
     logger.info("Fetching person %s", person_id)
-    raw_json = request_json_url(url)
-    t1 = time()
-    logger.debug("Fetched person %s in %.2f seconds", person_id, t1 - t0)
-    t0 = time()
-    person = parse_json_person_detail(raw_json)
+    person = _cached_page("name", f"nm{person_id}", lang, url, parse_json_person_detail)
     t1 = time()
-    logger.debug("Parsed person %s in %.2f seconds", person_id, t1 - t0)
+    logger.debug("Fetched and parsed person %s in %.2f seconds", person_id, t1 - t0)
     return person
 
 
-@lru_cache(maxsize=128)
+@with_deadline
+@memoize("season")
 def get_season_episodes(
     imdb_id: str, season=1, locale: Optional[str] = None
 ) -> SeasonEpisodesList:
     """Fetch episodes for a movie or series using the provided IMDb ID."""
     imdb_id, lang = normalize_imdb_id(imdb_id, locale)
-    url = f"https://www.imdb.com/{lang}/title/tt{imdb_id}/episodes/?season={season}"
+    url = _season_episodes_url(imdb_id, season, lang)
     logger.info("Fetching episodes for movie %s", imdb_id)
-    raw_json = request_json_url(url)
-    episodes = parse_json_season_episodes(raw_json)
+    episodes = _cached_page(
+        "season", f"tt{imdb_id}:{season}", lang, url, parse_json_season_episodes
+    )
     logger.debug("Fetched %d episodes for movie %s", len(episodes.episodes), imdb_id)
     return episodes
 
 
-@lru_cache(maxsize=128)
-def get_all_episodes(imdb_id: str, locale: Optional[str] = None):
+@with_deadline
+def get_series_episodes(
+    imdb_id: str, locale: Optional[str] = None, max_workers: int = 8
+) -> List[SeasonEpisodesList]:
+    """Fetch every season of a series, ordered by season number.
+
+    The first season page lists the series' season numbers
+    (``season_numbers``, which need not start at 1 or be contiguous); the
+    remaining seasons are then fetched concurrently with at most
+    ``max_workers`` requests in flight, so the whole series costs about two
+    round trips instead of one per season.
+    """
+    first = get_season_episodes(imdb_id, 1, locale)
+    remaining = _remaining_seasons(first)
+    logger.info("Fetching %d more seasons for series %s", len(remaining), imdb_id)
+    if not remaining:
+        return [first]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        seasons = executor.map(
+            in_context(lambda season: get_season_episodes(imdb_id, season, locale)),
+            remaining,
+        )
+        return sorted([first, *seasons], key=lambda season: season.season_number)
+
+
+def _remaining_seasons(first: SeasonEpisodesList) -> List[int]:
+    """Season numbers listed on the ``first`` page, other than its own."""
+    numbers = first.season_numbers or ()
+    return [number for number in numbers if number != first.season_number]
+
+
+def _all_episodes_page(
+    series_id: str, lang: str, start: int = 1, after: str = ""
+) -> Any:
+    key = _all_episodes_key(series_id, start, after)
+    url = _all_episodes_url(series_id, lang, start, after)
+    return _cached_raw("episodes", key, lang, request_json_url, url)
+
+
+def _all_episodes_key(series_id: str, start: int = 1, after: str = "") -> str:
+    if after:
+        return f"tt{series_id}:after:{after}"
+    return f"tt{series_id}" if start == 1 else f"tt{series_id}:{start}"
+
+
+def _remaining_episode_pages(raw_json: Any) -> range:
+    """Offsets (1-based) of the search pages after the first one."""
+    total = parse_json_bulked_episodes_total(raw_json) or 0
+    page_size = _ALL_EPISODES_PAGE_SIZE
+    return range(1 + page_size, total + 1, page_size)
+
+
+def _episode_shortfall(imdb_id: str, first: Any, seen: set) -> None:
+    """Warn when fewer episodes were collected than the search reported."""
+    total = parse_json_bulked_episodes_total(first) or 0
+    if len(seen) < total:
+        logger.warning(
+            "Collected %d of %d episodes for series %s", len(seen), total, imdb_id
+        )
+
+
+def _fresh_episodes(raw_json: Any, seen: set) -> List[BulkedEpisode]:
+    """Parse a search page, dropping episodes a previous page already returned."""
+    fresh = []
+    for episode in parse_json_bulked_episodes(raw_json):
+        if episode.imdbId not in seen:
+            seen.add(episode.imdbId)
+            fresh.append(episode)
+    return fresh
+
+
+@with_deadline
+def iter_all_episodes(
+    imdb_id: str, locale: Optional[str] = None, max_workers: int = 4
+) -> Iterator[BulkedEpisode]:
+    """Yield every episode of a series in release order, page by page.
+
+    The first search page reports the total number of episodes; the
+    following pages of 250 are then fetched concurrently (at most
+    ``max_workers`` at once) and yielded in order as they complete.
+    Should the search ignore ``start`` (a page repeating episodes already
+    seen), the pages' continuation cursor is followed one page at a time
+    instead. A warning is logged when fewer episodes than the reported
+    total could be collected.
+    """
     series_id, lang = normalize_imdb_id(imdb_id, locale)
-    url = f"https://www.imdb.com/{lang}/search/title/?count=250&series=tt{series_id}&sort=release_date,asc"
     logger.info("Fetching bulk episodes for series %s", imdb_id)
-    raw_json = request_json_url(url)
-    episodes = parse_json_bulked_episodes(raw_json)
+    first = last = _all_episodes_page(series_id, lang)
+    seen: set = set()
+    yield from _fresh_episodes(first, seen)
+    starts = _remaining_episode_pages(first)
+    if starts:
+        logger.debug(
+            "Fetching %d more episode pages for series %s", len(starts), imdb_id
+        )
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        try:
+            pages = executor.map(
+                in_context(lambda start: _all_episodes_page(series_id, lang, start)),
+                starts,
+            )
+            for raw_json in pages:
+                fresh = _fresh_episodes(raw_json, seen)
+                if not fresh:
+                    if not parse_json_bulked_episodes(raw_json):
+                        last = None  # past the end: nothing left to follow
+                    break
+                last = raw_json
+                yield from fresh
+            else:
+                last = None
+        finally:
+            # a caller that stops early does not wait for the remaining pages
+            executor.shutdown(wait=False, cancel_futures=True)
+        if last is not None:
+            logger.warning(
+                "Episode search ignored start= for series %s, following its cursor",
+                imdb_id,
+            )
+            cursor = parse_json_bulked_episodes_cursor(last)
+            while cursor:
+                raw_json = _all_episodes_page(series_id, lang, after=cursor)
+                fresh = _fresh_episodes(raw_json, seen)
+                if not fresh:
+                    break
+                yield from fresh
+                cursor = parse_json_bulked_episodes_cursor(raw_json)
+    _episode_shortfall(imdb_id, first, seen)
+
+
+@with_deadline
+@memoize("episodes")
+def get_all_episodes(imdb_id: str, locale: Optional[str] = None):
+    episodes = list(iter_all_episodes(imdb_id, locale))
     logger.debug("Fetched %d episodes for series %s", len(episodes), imdb_id)
     return episodes
 
 
-@lru_cache(maxsize=128)
+@with_deadline
+@memoize("season")
 def get_episodes(
     imdb_id: str, season=1, locale: Optional[str] = None
 ) -> SeasonEpisodesList:
@@ -450,9 +1514,10 @@ def get_episodes(
     return get_season_episodes(imdb_id, season, locale)
 
 
+@with_deadline
 def get_akas(imdb_id: str, locale: Optional[str] = None) -> Union[AkasData, list]:
     imdb_id, lang = normalize_imdb_id(imdb_id, locale)
-    raw_json = _get_extended_title_info(imdb_id, lang)
+    raw_json = _get_extended_title_info(imdb_id, lang, ("akas",))
     if not raw_json:
         logger.warning("No AKAs found for title %s", imdb_id)
         return []
@@ -461,6 +1526,7 @@ def get_akas(imdb_id: str, locale: Optional[str] = None) -> Union[AkasData, list
     return akas
 
 
+@with_deadline
 def get_all_interests(imdb_id: str, locale: Optional[str] = None):
     """
         Fetch all 'interests' for a title using the provided IMDb ID.
@@ -474,24 +1540,19 @@ def get_all_interests(imdb_id: str, locale: Optional[str] = None):
     beyond what is available in movie.genres, as it can impact performance.
     """
     imdb_id, lang = normalize_imdb_id(imdb_id, locale)
-    raw_json = _get_extended_title_info(imdb_id, lang)
+    raw_json = _get_extended_title_info(imdb_id, lang, ("interests",))
     if not raw_json:
         logger.warning("No interests found for title %s", imdb_id)
         return []
-    interests = []
-    interests_edges = raw_json.get("interests", {}).get("edges", [])
-    for edge in interests_edges:
-        node = edge.get("node", {})
-        primary_text = node.get("primaryText", {}).get("text", "")
-        if primary_text:
-            interests.append(primary_text)
+    interests = parse_json_interests(raw_json)
     logger.debug("Fetched %d interests for title %s", len(interests), imdb_id)
     return interests
 
 
+@with_deadline
 def get_trivia(imdb_id: str, locale: Optional[str] = None) -> List[Dict]:
     imdb_id, lang = normalize_imdb_id(imdb_id, locale)
-    raw_json = _get_extended_title_info(imdb_id, lang)
+    raw_json = _get_extended_title_info(imdb_id, lang, ("trivia",))
     if not raw_json:
         logger.warning("No trivia found for title %s", imdb_id)
         return []
@@ -500,9 +1561,10 @@ def get_trivia(imdb_id: str, locale: Optional[str] = None) -> List[Dict]:
     return trivia_list
 
 
+@with_deadline
 def get_reviews(imdb_id: str, locale: Optional[str] = None) -> List[Dict]:
     imdb_id, lang = normalize_imdb_id(imdb_id, locale)
-    raw_json = _get_extended_title_info(imdb_id, lang)
+    raw_json = _get_extended_title_info(imdb_id, lang, ("reviews",))
     if not raw_json:
         logger.warning("No reviews found for title %s", imdb_id)
         return []
@@ -511,9 +1573,10 @@ def get_reviews(imdb_id: str, locale: Optional[str] = None) -> List[Dict]:
     return reviews_list
 
 
+@with_deadline
 def get_parental_guide(imdb_id: str, locale: Optional[str] = None) -> Dict:
     imdb_id, lang = normalize_imdb_id(imdb_id, locale)
-    raw_json = _get_extended_title_info(imdb_id, lang)
+    raw_json = _get_extended_title_info(imdb_id, lang, ("parentsGuide",))
     if not raw_json:
         logger.warning("No parental guide found for title %s", imdb_id)
         return {}
@@ -522,6 +1585,7 @@ def get_parental_guide(imdb_id: str, locale: Optional[str] = None) -> Dict:
     return parental_guide
 
 
+@with_deadline
 def get_filmography(imdb_id, locale: Optional[str] = None) -> dict:
     """
     Fetch full filmography for a person using the provided IMDb ID.
@@ -536,31 +1600,11 @@ def get_filmography(imdb_id, locale: Optional[str] = None) -> dict:
     return full_credits_list
 
 
-@lru_cache(maxsize=128)
-def _get_extended_title_info(imdb_id, locale=None) -> dict:
-    """
-    Fetch extended info using IMDb's GraphQL API:
-    including akas, trivia, reviews, interests, and parental guide.
-    """
-    imdbId = "tt" + imdb_id
-    country = _get_country_code_from_lang_locale(locale)
-    url = GRAPHQL_URL
-    headers = {
-        "Content-Type": "application/json",
-        "x-imdb-user-country": country,
-    }
-    query = (
-        """
-        query {
-          title(id: "%s") {
-            id
-            titleText {
-              text
-            }
-            originalTitle: originalTitleText {
-              text
-            }
-            images(first: 50) {
+# Selections of the extended title query, one per section so each getter
+# only asks for the fields it parses.
+_TITLE_SECTION_FIELDS: Dict[str, str] = {
+    "images": """
+            images(__ARGS__) {
               total
               pageInfo {
                 endCursor
@@ -601,8 +1645,13 @@ def _get_extended_title_info(imdb_id, locale=None) -> dict:
                   }
                 }
               }
-            }
-            interests(first: 20) {
+            }""",
+    "interests": """
+            interests(__ARGS__) {
+              pageInfo {
+                endCursor
+                hasNextPage
+              }
               edges {
                 node {
                   primaryText {
@@ -610,8 +1659,13 @@ def _get_extended_title_info(imdb_id, locale=None) -> dict:
                   }
                 }
               }
-            }
-            akas(first: 200) {
+            }""",
+    "akas": """
+            akas(__ARGS__) {
+              pageInfo {
+                endCursor
+                hasNextPage
+              }
               edges {
                 node {
                   country {
@@ -625,8 +1679,13 @@ def _get_extended_title_info(imdb_id, locale=None) -> dict:
                   title: text
                 }
               }
-            }
-            trivia(first: 50) {
+            }""",
+    "trivia": """
+            trivia(__ARGS__) {
+              pageInfo {
+                endCursor
+                hasNextPage
+              }
               edges {
                 node {
                   id
@@ -641,8 +1700,13 @@ def _get_extended_title_info(imdb_id, locale=None) -> dict:
                   }
                 }
               }
-            }
-            reviews(first: 50) {
+            }""",
+    "reviews": """
+            reviews(__ARGS__) {
+              pageInfo {
+                endCursor
+                hasNextPage
+              }
               edges {
                 node {
                   id
@@ -667,50 +1731,438 @@ def _get_extended_title_info(imdb_id, locale=None) -> dict:
                   __typename
                 }
               }
-            }
-             parentsGuide {
-                  categories {
-                    category {
-                      id
-                      text
-                    }
-                    guideItems(first: 10) {
-                      edges {
-                        node {
-                          isSpoiler
-                          text {
-                            plaidHtml
-                          }
-                        }
+            }""",
+    "parentsGuide": """
+            parentsGuide {
+              categories {
+                category {
+                  id
+                  text
+                }
+                guideItems(first: 10) {
+                  edges {
+                    node {
+                      isSpoiler
+                      text {
+                        plaidHtml
                       }
                     }
-                    severity{id,votedFor}
-                    severityBreakdown {
-                      votedFor
-                      voteType
-                    }
                   }
                 }
-          }
+                severity{id,votedFor}
+                severityBreakdown {
+                  votedFor
+                  voteType
+                }
+              }
+            }""",
+}
+TITLE_SECTIONS = tuple(_TITLE_SECTION_FIELDS)
+# Items requested per section; paginated sections expose ``pageInfo``.
+_TITLE_SECTION_PAGE_SIZE: Dict[str, int] = {
+    "images": 50,
+    "interests": 20,
+    "akas": 200,
+    "trivia": 50,
+    "reviews": 50,
+}
+
+
+def _title_section(section: str, first: Optional[int] = None, after: str = "") -> str:
+    fields = _TITLE_SECTION_FIELDS[section]
+    if section not in _TITLE_SECTION_PAGE_SIZE:
+        return fields
+    args = f"first: {first or _TITLE_SECTION_PAGE_SIZE[section]}"
+    if after:
+        args += f", after: {json.dumps(after)}"
+    return fields.replace("__ARGS__", args, 1)
+
+
+def _title_selection(imdbId: str, sections: Iterable[str], alias: str = "") -> str:
+    return """
+          %stitle(id: "%s") {
+            id
+            titleText {
+              text
+            }
+            originalTitle: originalTitleText {
+              text
+            }%s
+          }""" % (
+        f"{alias}: " if alias else "",
+        imdbId,
+        "".join(_title_section(section) for section in sections),
+    )
+
+
+def _extended_title_query(imdbId: str, sections: Iterable[str] = TITLE_SECTIONS) -> str:
+    return """
+        query {%s
         }
-        """
-        % imdbId
+        """ % _title_selection(imdbId, sections)
+
+
+def _extended_titles_query(imdbIds: List[str], sections: Iterable[str]) -> str:
+    """Select several titles in one query, aliased ``t0``, ``t1``, ..."""
+    sections = tuple(sections)
+    return """
+        query {%s
+        }
+        """ % "".join(
+        _title_selection(imdbId, sections, f"t{n}") for n, imdbId in enumerate(imdbIds)
     )
-    payload = {"query": query}
-    logger.info("Fetching title %s from GraphQL API", imdb_id)
-    data = request_graphql_url(headers, imdbId, payload, url)
-    raw_json = data.get("data", {}).get("title", {})
+
+
+def _lookup_sections(
+    kind: str, key: str, lang: str, sections: Iterable[str]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Split ``sections`` into cached payloads and the ones still to fetch.
+
+    Each section is cached on its own (in memory and, when enabled, on disk)
+    so getters needing different parts of the same entity only download
+    what is not cached yet, and a combined fetch warms every part.
+    """
+    found: Dict[str, Any] = {}
+    missing = []
+    for section in sections:
+        section_key = f"{key}:{section}"
+        value = memory_cache.get((kind, section_key, lang), kind)
+        if value is _MISSING and _disk_cache is not None:
+            stored = _disk_cache.get(kind, section_key, lang)
+            if stored is not None:
+                value = stored[section]
+                memory_cache.set((kind, section_key, lang), value, kind, _id_tag(key))
+        if value is _MISSING:
+            missing.append(section)
+        else:
+            found[section] = value
+    return found, missing
+
+
+def _store_sections(
+    kind: str, key: str, lang: str, sections: Iterable[str], fetched: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Cache each of ``sections`` from a freshly ``fetched`` payload."""
+    stored = {}
+    for section in sections:
+        value = stored[section] = fetched.get(section)
+        section_key = f"{key}:{section}"
+        memory_cache.set((kind, section_key, lang), value, kind, _id_tag(key))
+        if _disk_cache is not None:
+            _disk_cache.set(kind, section_key, lang, {section: value})
+    return stored
+
+
+def _title_sections_json(imdbId: str, fetched: Dict, found: Dict) -> dict:
+    if not fetched and not any(found.values()):
+        return {}
+    return {"id": imdbId, **fetched, **found}
+
+
+def _get_extended_title_info(
+    imdb_id, locale=None, sections: Iterable[str] = TITLE_SECTIONS
+) -> dict:
+    """
+    Fetch extended info using IMDb's GraphQL API:
+    including akas, trivia, reviews, interests, and parental guide.
+    Only the requested ``sections`` (see :data:`TITLE_SECTIONS`) are queried;
+    sections fetched earlier are served from the cache.
+    """
+    imdbId = "tt" + imdb_id
+    found, missing = _lookup_sections("title_extended", imdbId, locale, sections)
+    title = {}
+    if missing:
+        # getters needing the same sections at once share one request
+        missing = tuple(missing)
+        title = flights.do(
+            ("title_sections", imdbId, locale, missing),
+            _fetch_title_sections,
+            imdb_id,
+            locale,
+            missing,
+        )
+        found.update((section, title.get(section)) for section in missing)
+    raw_json = _title_sections_json(imdbId, title, found)
     return raw_json
 
 
-def _get_extended_name_info(person_id, locale=None) -> dict:
+def _fetch_title_sections(imdb_id: str, locale, missing: Tuple[str, ...]) -> dict:
+    """Query the ``missing`` sections of one title and cache them."""
+    imdbId = "tt" + imdb_id
+    headers = _graphql_headers(locale)
+    payload = {"query": _extended_title_query(imdbId, missing)}
+    logger.info("Fetching title %s (%s) from GraphQL API", imdb_id, ", ".join(missing))
+    data = request_graphql_url(headers, imdbId, payload, GRAPHQL_URL)
+    title = data.get("data", {}).get("title") or {}
+    _store_sections("title_extended", imdbId, locale, missing, title)
+    return title
+
+
+def _plan_title_batches(
+    imdb_ids: List[str], lang: str, sections: Tuple[str, ...], batch_size: int
+) -> Tuple[Dict[str, dict], List[List[str]]]:
+    """Serve cached titles and split the rest into batches of ``batch_size``."""
+    results: Dict[str, dict] = {}
+    todo = []
+    for imdb_id in imdb_ids:
+        imdbId = "tt" + imdb_id
+        found, missing = _lookup_sections("title_extended", imdbId, lang, sections)
+        if missing:
+            todo.append(imdb_id)
+        else:
+            results[imdb_id] = _title_sections_json(imdbId, {}, found)
+    batch_size = max(1, batch_size)
+    return results, [todo[i : i + batch_size] for i in range(0, len(todo), batch_size)]
+
+
+def _collect_title_batch(
+    batch: List[str], data: Dict, lang: str, sections: Tuple[str, ...]
+) -> Dict[str, Union[dict, GraphQLError]]:
+    """Split an aliased batch response back per title and cache its sections.
+
+    Titles that came back without data because of a GraphQL error map to a
+    :class:`GraphQLError` and are not cached, so the next call asks for
+    them again.
     """
-    Fetch extended person info using IMDb's GraphQL API.
+    titles = data.get("data") or {}
+    failed = _failed_aliases(data.get("errors"), titles)
+    results: Dict[str, Union[dict, GraphQLError]] = {}
+    for n, imdb_id in enumerate(batch):
+        imdbId = "tt" + imdb_id
+        errors = failed.get(f"t{n}")
+        if errors:
+            logger.warning("GraphQL error for title %s: %s", imdbId, errors)
+            results[imdb_id] = GraphQLError(
+                f"GraphQL error for {imdbId!r}: {errors}",
+                url=GRAPHQL_URL,
+                query_term=imdbId,
+                errors=errors,
+            )
+            continue
+        title = titles.get(f"t{n}") or {}
+        found = _store_sections("title_extended", imdbId, lang, sections, title)
+        results[imdb_id] = _title_sections_json(imdbId, title, found)
+    return results
+
+
+def _failed_aliases(
+    errors: Optional[List[Dict]], titles: Dict
+) -> Dict[str, List[Dict]]:
+    """Map each alias of a batched query that came back null to its GraphQL errors.
+
+    Errors about a field nested in an alias that did return data (say one
+    review's author) leave the alias alone. Errors without a ``path`` are
+    charged to every alias that came back without data.
     """
-    person_id = "nm" + person_id
-    country = _get_country_code_from_lang_locale(locale)
+    failed: Dict[str, List[Dict]] = {}
+    empty = [alias for alias, title in titles.items() if title is None]
+    for error in errors or ():
+        path = error.get("path") or []
+        for alias in [path[0]] if path else empty:
+            if titles.get(alias) is None:
+                failed.setdefault(alias, []).append(error)
+    return failed
+
+
+def _get_extended_titles_info(
+    imdb_ids: List[str], lang: str, sections: Tuple[str, ...], batch_size: int
+) -> Dict[str, dict]:
+    """Batched :func:`_get_extended_title_info` for already normalized ids."""
+    results, batches = _plan_title_batches(imdb_ids, lang, sections, batch_size)
+    for batch in batches:
+        results.update(
+            flights.do(
+                ("title_sections", tuple(batch), lang, sections),
+                _fetch_title_batch,
+                batch,
+                lang,
+                sections,
+            )
+        )
+    return results
 
-    query = (
+
+def _fetch_title_batch(
+    batch: List[str], lang: str, sections: Tuple[str, ...]
+) -> Dict[str, dict]:
+    imdbIds = ["tt" + imdb_id for imdb_id in batch]
+    payload = {"query": _extended_titles_query(imdbIds, sections)}
+    logger.info(
+        "Fetching %d titles (%s) from GraphQL API", len(batch), ", ".join(sections)
+    )
+    data = request_graphql_url(
+        _graphql_headers(lang), ",".join(imdbIds), payload, GRAPHQL_URL, partial=True
+    )
+    return _collect_title_batch(batch, data, lang, sections)
+
+
+def _normalize_many(
+    imdb_ids: Iterable[str], locale: Optional[str]
+) -> Tuple[Dict[str, str], str]:
+    """Map each given id to its normalized form; also return the url language."""
+    lang = _retrieve_url_lang(locale)
+    normalized = {
+        imdb_id: normalize_imdb_id(imdb_id, locale)[0] for imdb_id in imdb_ids
+    }
+    return normalized, lang
+
+
+def _parse_many(
+    normalized: Dict[str, str], raw: Dict[str, Union[dict, GraphQLError]], parse, empty
+) -> Dict[str, Any]:
+    results = {}
+    for imdb_id, num in normalized.items():
+        title = raw[num]
+        if isinstance(title, GraphQLError):
+            results[imdb_id] = title
+        else:
+            results[imdb_id] = parse(title) if title else empty
+    return results
+
+
+@with_deadline
+def get_akas_many(
+    imdb_ids: Iterable[str], locale: Optional[str] = None, batch_size: int = 25
+) -> Dict[str, Union[AkasData, list, GraphQLError]]:
+    """Fetch AKAs for many titles, packing ``batch_size`` titles per GraphQL request.
+
+    Returns a dict keyed by the ids as given; titles without AKAs map to ``[]``
+    and titles whose part of the query failed to the :class:`GraphQLError`.
+    """
+    normalized, lang = _normalize_many(imdb_ids, locale)
+    raw = _get_extended_titles_info(
+        list(dict.fromkeys(normalized.values())), lang, ("akas",), batch_size
+    )
+    return _parse_many(normalized, raw, parse_json_akas, [])
+
+
+@with_deadline
+def get_reviews_many(
+    imdb_ids: Iterable[str], locale: Optional[str] = None, batch_size: int = 25
+) -> Dict[str, Union[List[Dict], GraphQLError]]:
+    """Fetch reviews for many titles, packing ``batch_size`` titles per GraphQL request.
+
+    Returns a dict keyed by the ids as given; titles without reviews map to ``[]``
+    and titles whose part of the query failed to the :class:`GraphQLError`.
+    """
+    normalized, lang = _normalize_many(imdb_ids, locale)
+    raw = _get_extended_titles_info(
+        list(dict.fromkeys(normalized.values())), lang, ("reviews",), batch_size
+    )
+    return _parse_many(normalized, raw, parse_json_reviews, [])
+
+
+@with_deadline
+def prefetch_title_sections(
+    imdb_id: str,
+    sections: Iterable[str] = TITLE_SECTIONS,
+    locale: Optional[str] = None,
+) -> None:
+    """Fetch several extended sections of a title in a single GraphQL request.
+
+    Use it before calling e.g. :func:`get_akas` and :func:`get_reviews` for
+    the same title: both are then served from the cache.
+    """
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    _get_extended_title_info(imdb_id, lang, tuple(sections))
+
+
+def _paged_title_query(imdbId: str, section: str, first: int, after: str = "") -> str:
+    return """
+        query {
+          title(id: "%s") {
+            id%s
+          }
+        }
+        """ % (
+        imdbId,
+        _title_section(section, first, after),
+    )
+
+
+def _section_page(title: Dict, section: str) -> Tuple[List[Any], str]:
+    """Parse one page of ``section`` and return its items and the next cursor."""
+    parse = _SECTION_ITEM_PARSERS[section]
+    page = title.get(section) or {}
+    items = parse(title) if page else []
+    info = page.get("pageInfo") or {}
+    return items, info.get("endCursor") if info.get("hasNextPage") else ""
+
+
+def _gallery_items(title: Dict) -> List[MediaItem]:
+    gallery = parse_json_media_gallery(title)  # None for a title without images
+    return gallery.items if gallery is not None else []
+
+
+_SECTION_ITEM_PARSERS = {
+    "reviews": parse_json_reviews,
+    "trivia": parse_json_trivia,
+    "akas": lambda title: parse_json_akas(title).akas,
+    "images": _gallery_items,
+}
+
+
+def _iter_title_section(
+    imdb_id: str, section: str, locale: Optional[str], page_size: Optional[int]
+) -> Iterator[Any]:
+    """Follow ``section``'s cursor page by page, yielding parsed items lazily.
+
+    Only one page is held at a time and no further request is made once the
+    caller stops iterating.
+    """
+    imdb_id, lang = normalize_imdb_id(imdb_id, locale)
+    imdbId = "tt" + imdb_id
+    first = page_size or _TITLE_SECTION_PAGE_SIZE[section]
+    headers = _graphql_headers(lang)
+    cursor = ""
+    page = 0
+    while True:
+        page += 1
+        logger.info("Fetching %s page %d for title %s", section, page, imdb_id)
+        payload = {"query": _paged_title_query(imdbId, section, first, cursor)}
+        data = request_graphql_url(headers, imdbId, payload, GRAPHQL_URL)
+        title = data.get("data", {}).get("title") or {}
+        items, cursor = _section_page(title, section)
+        yield from items
+        if not cursor:
+            return
+
+
+@with_deadline
+def iter_reviews(
+    imdb_id: str, locale: Optional[str] = None, page_size: int = 50
+) -> Iterator[Dict]:
+    """Yield every review of a title, following the GraphQL cursor page by page."""
+    return _iter_title_section(imdb_id, "reviews", locale, page_size)
+
+
+@with_deadline
+def iter_trivia(
+    imdb_id: str, locale: Optional[str] = None, page_size: int = 50
+) -> Iterator[Dict]:
+    """Yield every trivia item of a title, following the GraphQL cursor page by page."""
+    return _iter_title_section(imdb_id, "trivia", locale, page_size)
+
+
+@with_deadline
+def iter_akas(
+    imdb_id: str, locale: Optional[str] = None, page_size: int = 200
+) -> Iterator[AkaInfo]:
+    """Yield every alternate title, following the GraphQL cursor page by page."""
+    return _iter_title_section(imdb_id, "akas", locale, page_size)
+
+
+@with_deadline
+def iter_images(
+    imdb_id: str, locale: Optional[str] = None, page_size: int = 50
+) -> Iterator[MediaItem]:
+    """Yield every image of a title's media gallery, following the cursor page by page."""
+    return _iter_title_section(imdb_id, "images", locale, page_size)
+
+
+def _extended_name_query(person_id: str, first: int = 250, after: str = "") -> str:
+    args = f"first: {first}" + (f", after: {json.dumps(after)}" if after else "")
+    return (
         """
             query {
               name(id: "%s") {
@@ -718,7 +2170,7 @@ def _get_extended_name_info(person_id, locale=None) -> dict:
                   text
                 }
 
-                credits(first: 250
+                credits(%s
                 filter: {
             categories: [
               "production_designer"
@@ -807,27 +2259,87 @@ def _get_extended_name_info(person_id, locale=None) -> dict:
             }
 
         """
-        % person_id
+        % (person_id, args)
     )
+
+
+def _get_extended_name_info(person_id, locale=None) -> dict:
+    """
+    Fetch extended person info using IMDb's GraphQL API.
+    """
+    person_id = "nm" + person_id
+    query = _extended_name_query(person_id)
     url = GRAPHQL_URL
-    headers = {
-        "Content-Type": "application/json",
-        "x-imdb-user-country": country,
-    }
+    headers = _graphql_headers(locale)
     payload = {"query": query}
     logger.info("Fetching person %s from GraphQL API", person_id)
-    data = request_graphql_url(headers, person_id, payload, url)
+    data = _cached_raw(
+        "name_extended",
+        person_id,
+        locale,
+        request_graphql_url,
+        headers,
+        person_id,
+        payload,
+        url,
+    )
     raw_json = data.get("data", {}).get("name", {})
     return raw_json
 
 
-@lru_cache(maxsize=128)
+@with_deadline
+def iter_filmography(
+    imdb_id: str,
+    locale: Optional[str] = None,
+    max_items: Optional[int] = None,
+    page_size: int = 250,
+) -> Iterator[Tuple[str, MovieBriefInfo]]:
+    """Yield a person's complete filmography as ``(category, MovieBriefInfo)`` pairs.
+
+    Unlike :func:`get_filmography`, which stops at the first 250 credits,
+    this follows the GraphQL cursor page by page. Credits arrive grouped by
+    category within each page; at most ``max_items`` are yielded and no
+    further page is requested once the caller stops iterating.
+    """
+    person_id, lang = normalize_imdb_id(imdb_id, locale)
+    person_id = "nm" + person_id
+    headers = _graphql_headers(lang)
+    yielded = 0
+    cursor = ""
+    while max_items is None or yielded < max_items:
+        logger.info("Fetching filmography page for person %s", person_id)
+        payload = {"query": _extended_name_query(person_id, page_size, cursor)}
+        data = request_graphql_url(headers, person_id, payload, GRAPHQL_URL)
+        credits, cursor = _filmography_page(data)
+        for category, title in credits:
+            if max_items is not None and yielded >= max_items:
+                return
+            yielded += 1
+            yield category, title
+        if not cursor:
+            return
+
+
+def _filmography_page(data: Dict) -> Tuple[List[Tuple[str, MovieBriefInfo]], str]:
+    """Parse one filmography page into ``(category, title)`` pairs and the next cursor."""
+    name = data.get("data", {}).get("name") or {}
+    credits = [
+        (category, title)
+        for category, titles in parse_json_filmography(name).items()
+        for title in titles
+    ]
+    info = (name.get("credits") or {}).get("pageInfo") or {}
+    return credits, info.get("endCursor") if info.get("hasNextPage") else ""
+
+
+@with_deadline
+@memoize("title_extended")
 def get_media_gallery(
     imdb_id: str,
     locale: Optional[str] = None,
 ) -> Optional[MediaGallery]:
     imdb_id, lang = normalize_imdb_id(imdb_id, locale)
-    raw_json = _get_extended_title_info(imdb_id, lang)
+    raw_json = _get_extended_title_info(imdb_id, lang, ("images",))
     if not raw_json:
         logger.warning("No media_gallery found for title %s", imdb_id)
         return []
@@ -0,0 +1,224 @@
+# MIT License
+# Copyright (c) 2025 tveronesi+imdbinfo@gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Client-side request pacing per host.
+
+Every fetch first takes a token from its host's :class:`HostLimiter`, a
+token bucket whose refill rate is steered by an AIMD controller: each
+successful response adds ``increase`` requests/second (up to ``max_rate``),
+while a WAF challenge (202), a 429 or a 5xx multiplies the rate by
+``decrease`` (down to ``min_rate``) and empties the bucket. Sustained
+throughput therefore settles just below what the host tolerates.
+
+Tokens are handed out as reservations (:meth:`HostLimiter.reserve` returns
+how long to wait), so the same limiter paces threads and coroutines alike.
+"""
+
+import asyncio
+import logging
+import threading
+from time import monotonic, sleep
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMITS: Dict[str, Dict[str, float]] = {
+    # host -> HostLimiter keyword arguments; other hosts use "*"
+    "www.imdb.com": {"rate": 5.0, "burst": 10},
+    "api.graphql.imdb.com": {"rate": 10.0, "burst": 20},
+    "*": {"rate": 5.0, "burst": 10},
+}
+
+BACKOFF_STATUSES = frozenset({202, 429})
+
+
+class HostLimiter:
+    """Token bucket for one host with an AIMD-controlled refill rate."""
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: float = 10,
+        min_rate: float = 0.5,
+        max_rate: float = 50.0,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.backoffs = 0
+        self.waited = 0.0
+
+    def configure(self, **options: float) -> None:
+        with self._lock:
+            for name, value in options.items():
+                if value is not None:
+                    setattr(self, name, value)
+            self._tokens = min(self._tokens, self.burst)
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            delay = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+            self.requests += 1
+            self.waited += delay
+            return delay
+
+    def release(self, delay: float) -> None:
+        """Give back a token from :meth:`reserve` that will not be used."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+            self.requests -= 1
+            self.waited -= delay
+
+    def record(self, status_code: int, retry_after: Optional[float] = None) -> None:
+        """Feed a response status back into the controller."""
+        with self._lock:
+            if status_code in BACKOFF_STATUSES or status_code >= 500:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._tokens = min(self._tokens, 0.0)
+                self.backoffs += 1
+                if retry_after:
+                    self._blocked_until = max(
+                        self._blocked_until, monotonic() + retry_after
+                    )
+                logger.debug(
+                    "HTTP %s: backing off to %.2f requests/s", status_code, self.rate
+                )
+            elif 200 <= status_code < 300:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "requests": self.requests,
+                "backoffs": self.backoffs,
+                "waited": self.waited,
+            }
+
+
+class RateLimiter:
+    """Registry of :class:`HostLimiter` objects keyed by host name."""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.enabled = True
+        self.limits = {
+            host: dict(opts) for host, opts in (limits or DEFAULT_LIMITS).items()
+        }
+        self._hosts: Dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host: Optional[str] = None, **options: Any) -> None:
+        """Update the options of ``host`` (all hosts when ``None``)."""
+        options = {k: v for k, v in options.items() if v is not None}
+        with self._lock:
+            hosts = [host] if host else list(self.limits)
+            for name in hosts:
+                self.limits.setdefault(name, dict(self.limits["*"])).update(options)
+            if host is None:
+                limiters = list(self._hosts.values())
+            else:
+                limiters = [self._hosts[host]] if host in self._hosts else []
+        for limiter in limiters:
+            limiter.configure(**options)
+
+    def host(self, url: str) -> HostLimiter:
+        name = urlsplit(url).hostname or ""
+        limiter = self._hosts.get(name)
+        if limiter is None:
+            with self._lock:
+                limiter = self._hosts.get(name)
+                if limiter is None:
+                    limiter = HostLimiter(**self.limits.get(name, self.limits["*"]))
+                    self._hosts[name] = limiter
+        return limiter
+
+    def wait(self, url: str, timeout: Optional[float] = None) -> bool:
+        """Block until a request to ``url`` may be sent.
+
+        Returns ``False`` without waiting when that would take longer than
+        ``timeout`` seconds.
+        """
+        if self.enabled:
+            limiter = self.host(url)
+            delay = limiter.reserve()
+            if timeout is not None and delay > timeout:
+                limiter.release(delay)  # rejected calls must not slow the others
+                return False
+            if delay:
+                sleep(delay)
+        return True
+
+    async def wait_async(self, url: str, timeout: Optional[float] = None) -> bool:
+        """Async version of :meth:`wait`."""
+        if self.enabled:
+            limiter = self.host(url)
+            delay = limiter.reserve()
+            if timeout is not None and delay > timeout:
+                limiter.release(delay)  # rejected calls must not slow the others
+                return False
+            if delay:
+                await asyncio.sleep(delay)
+        return True
+
+    def record(self, url: str, resp: Any) -> None:
+        """Adjust the rate of ``url``'s host from the response ``resp``."""
+        if not self.enabled:
+            return
+        retry_after = None
+        if resp.status_code == 429:
+            headers = getattr(resp, "headers", None) or {}
+            try:
+                retry_after = float(headers.get("Retry-After", ""))
+            except ValueError:
+                pass
+        self.host(url).record(resp.status_code, retry_after)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {name: limiter.stats() for name, limiter in hosts.items()}
+
+    def reset(self) -> None:
+        """Forget learned rates; limiters are rebuilt from :attr:`limits`."""
+        with self._lock:
+            self._hosts.clear()
+
+
+rate_limiter = RateLimiter()
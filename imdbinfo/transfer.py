@@ -0,0 +1,140 @@
+# MIT License
+# Copyright (c) 2025 tveronesi+imdbinfo@gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Content-encoding negotiation and transfer accounting.
+
+Requests advertise every encoding the HTTP stack can decode, best first:
+``zstd`` when ``zstandard`` is installed, ``br`` when ``brotli`` (or
+``brotlicffi``) is, then ``gzip`` and ``deflate``. :class:`TransferMeter`
+counts, per host and encoding, the bytes received over the wire next to
+the decompressed bytes handed to the parser.
+"""
+
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+def _installed(*modules: str) -> bool:
+    for module in modules:
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        return True
+    return False
+
+
+# Same decoder modules the HTTP stack (urllib3) looks for: advertising an
+# encoding it cannot decode would hand compressed bytes to the parser.
+ENCODINGS: List[str] = [
+    name
+    for name, modules in (
+        ("zstd", ("zstandard",)),
+        ("br", ("brotlicffi", "brotli")),
+        ("gzip", ("zlib",)),
+        ("deflate", ("zlib",)),
+    )
+    if _installed(*modules)
+]
+
+ACCEPT_ENCODING = ", ".join(ENCODINGS) or "identity"
+
+
+def wire_bytes(resp: Any, body_bytes: int) -> int:
+    """Bytes of ``resp`` read from the network, before decompression.
+
+    Uses the connection's read counter when available, then the
+    ``Content-Length`` header, and assumes an uncompressed body otherwise.
+    """
+    raw = getattr(resp, "raw", None)
+    tell = getattr(raw, "tell", None)
+    if tell is not None:
+        try:
+            read = tell()
+        except (OSError, ValueError):
+            read = 0
+        if isinstance(read, int) and read > 0:
+            return read
+    headers = getattr(resp, "headers", None) or {}
+    try:
+        return int(headers.get("Content-Length") or headers.get("content-length"))
+    except (TypeError, ValueError):
+        return body_bytes
+
+
+class TransferMeter:
+    """Per-host counters of compressed (wire) vs decompressed bytes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Counter] = {}
+
+    def record(self, url: str, resp: Any, body_bytes: Optional[int] = None) -> None:
+        """Account one response whose decompressed body was ``body_bytes`` long.
+
+        ``body_bytes`` defaults to the length of ``resp.content``; pass it for
+        streamed responses, whose body is consumed by the caller.
+        """
+        if body_bytes is None:
+            body_bytes = len(getattr(resp, "content", None) or b"")
+        wire = wire_bytes(resp, body_bytes)
+        headers = getattr(resp, "headers", None) or {}
+        encoding = (
+            headers.get("Content-Encoding") or headers.get("content-encoding") or ""
+        ).lower() or "identity"
+        logger.debug(
+            "%s: %d bytes on the wire (%s), %d decompressed",
+            url,
+            wire,
+            encoding,
+            body_bytes,
+        )
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            counts = self._hosts.setdefault(host, Counter())
+            counts["requests"] += 1
+            counts["wire_bytes"] += wire
+            counts["decoded_bytes"] += body_bytes
+            counts[f"requests_{encoding}"] += 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Counters per host plus ``compression_ratio`` (decoded / wire)."""
+        with self._lock:
+            hosts = {host: dict(counts) for host, counts in self._hosts.items()}
+        for counts in hosts.values():
+            wire = counts["wire_bytes"]
+            counts["compression_ratio"] = (
+                counts["decoded_bytes"] / wire if wire else 0.0
+            )
+        return hosts
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+
+transfer_meter = TransferMeter()
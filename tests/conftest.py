@@ -1,6 +1,91 @@
 import sys
 from types import SimpleNamespace
 
+import pytest
+
+
+class _StubSession:
+    """Minimal stand-in for ``niquests.Session``; tests patch ``get``/``post``."""
+
+    def __init__(self, **kwargs):
+        self.options = kwargs
+        self.closed = False
+
+    def get(self, *args, **kwargs):
+        return None
+
+    def post(self, *args, **kwargs):
+        return None
+
+    def close(self):
+        self.closed = True
+
+
+class _StubAsyncSession(_StubSession):
+    """Minimal stand-in for ``niquests.AsyncSession``."""
+
+    async def get(self, *args, **kwargs):
+        return None
+
+    async def post(self, *args, **kwargs):
+        return None
+
+    async def close(self):
+        self.closed = True
+
+
 # Provide a minimal stub for the 'niquests' module so that the package can be imported
 # in environments where the real dependency is unavailable.
-sys.modules.setdefault("niquests", SimpleNamespace(get=lambda *args, **kwargs: None))
+sys.modules.setdefault(
+    "niquests",
+    SimpleNamespace(
+        get=lambda *args, **kwargs: None,
+        Session=_StubSession,
+        AsyncSession=_StubAsyncSession,
+        Timeout=type("Timeout", (OSError,), {}),
+    ),
+)
+
+
+@pytest.fixture(autouse=True)
+def _fast_rate_limit(monkeypatch):
+    """Keep request pacing active but effectively unlimited for stubbed responses.
+
+    The limiter is still consulted and fed on every fetch; tests/test_throttle.py
+    covers the actual pacing and AIMD behaviour.
+    """
+    from imdbinfo.throttle import rate_limiter
+
+    fast = {"rate": 1e6, "burst": 1e6, "min_rate": 1e6, "max_rate": 1e6}
+    monkeypatch.setattr(rate_limiter, "limits", {"*": fast})
+    rate_limiter.reset()
+    yield
+    rate_limiter.reset()
+
+
+@pytest.fixture(autouse=True)
+def _instant_retries(monkeypatch):
+    """Retry as configured, but without sleeping between attempts."""
+    from imdbinfo.retry import retry_policy
+
+    monkeypatch.setattr(retry_policy, "backoff", 0.0)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_waf_cookie_file(monkeypatch, tmp_path):
+    """Keep the WAF cookie file and its lock out of the working tree."""
+    from imdbinfo import services
+
+    monkeypatch.setattr(services, "_WAF_COOKIE_FILE", tmp_path / "waf_cookies.json")
+
+
+@pytest.fixture(autouse=True)
+def _async_session(monkeypatch):
+    """Route aio requests through one stub session that tests can patch.
+
+    Library-managed async sessions are per event loop, so ``aio.get_session()``
+    only works outside a loop when a session has been injected.
+    """
+    from imdbinfo import aio
+
+    monkeypatch.setattr(aio, "_session", _StubAsyncSession())
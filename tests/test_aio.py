@@ -0,0 +1,452 @@
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
+import niquests
+import pytest
+
+from imdbinfo import aio, services
+from imdbinfo.exceptions import WAFError, GraphQLError
+from tests.test_services import TITLE_SECTIONS_SAMPLE
+
+SAMPLE_DIR = os.path.join(os.path.dirname(__file__), "sample_json_source")
+
+
+def load_sample_text(filename: str) -> str:
+    with open(os.path.join(SAMPLE_DIR, filename), encoding="utf-8") as f:
+        return f.read()
+
+
+def async_get_factory(filename: str):
+    json_text = load_sample_text(filename)
+    html = f'<html><script id="__NEXT_DATA__">{json_text}</script></html>'.encode(
+        "utf-8"
+    )
+
+    async def mock_get(*args, **kwargs):
+        return SimpleNamespace(status_code=200, content=html)
+
+    return mock_get
+
+
+def async_post_factory(filename: str):
+    json_text = load_sample_text(filename)
+
+    async def mock_post(*args, **kwargs):
+        return SimpleNamespace(
+            status_code=200, content=json_text, json=lambda: json.loads(json_text)
+        )
+
+    return mock_post
+
+
+def test_aio_session_ignores_incoming_cookies():
+    assert aio._SESSION_OPTIONS["allow_incoming_cookies"] is False
+
+
+def test_aio_session_per_event_loop(monkeypatch):
+    class LoopBoundSession(niquests.AsyncSession):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.loop = asyncio.get_running_loop()
+
+        async def get(self, *args, **kwargs):
+            assert asyncio.get_running_loop() is self.loop, "session used across loops"
+            return SimpleNamespace(status_code=200, content=b"")
+
+    monkeypatch.setattr(aio, "_session", None)
+    monkeypatch.setattr(aio.niquests, "AsyncSession", LoopBoundSession)
+
+    async def fetch_twice():
+        await aio._send("get", "https://www.imdb.com/title/tt0133093/reference")
+        await aio._send("get", "https://www.imdb.com/title/tt0133093/reference")
+        return aio.get_session()
+
+    first = asyncio.run(fetch_twice())
+    second = asyncio.run(fetch_twice())
+    assert first is not second
+    assert first.loop is not second.loop
+
+
+def test_aio_get_movie(monkeypatch):
+    monkeypatch.setattr(
+        aio.get_session(), "get", async_get_factory("sample_resource.json")
+    )
+    movie = asyncio.run(aio.get_movie("tt0133093"))
+    assert movie.title == "The Matrix"
+    assert movie.duration == 136
+
+
+def test_aio_get_name(monkeypatch):
+    monkeypatch.setattr(
+        aio.get_session(), "get", async_get_factory("sample_person.json")
+    )
+    person = asyncio.run(aio.get_name("nm0000126"))
+    assert person.name == "Kevin Costner"
+
+
+def test_aio_search_title(monkeypatch):
+    monkeypatch.setattr(
+        aio.get_session(), "post", async_post_factory("sample_search.json")
+    )
+    result = asyncio.run(aio.search_title("matrix"))
+    assert result.titles[0].title == "The Matrix"
+
+
+def test_aio_get_media_gallery(monkeypatch):
+    monkeypatch.setattr(
+        aio.get_session(), "post", async_post_factory("sample_media_gallery.json")
+    )
+    gallery = asyncio.run(aio.get_media_gallery("tt0133093"))
+    assert gallery.total == 557
+
+
+def test_aio_requests_run_concurrently(monkeypatch):
+    in_flight = 0
+    peak = 0
+    mock_get = async_get_factory("sample_resource.json")
+
+    async def slow_get(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await mock_get()
+
+    monkeypatch.setattr(aio.get_session(), "get", slow_get)
+
+    async def run():
+        return await asyncio.gather(*(aio.get_movie(i) for i in range(1, 6)))
+
+    movies = asyncio.run(run())
+    assert len(movies) == 5
+    assert peak == 5
+
+
+def test_aio_waf_error(monkeypatch):
+    async def stub_get(*args, **kwargs):
+        return SimpleNamespace(status_code=202, text="waf challenge", content=b"")
+
+    def failing_solver(text, ua):
+        raise RuntimeError("no solver in tests")
+
+    monkeypatch.setattr(aio.get_session(), "get", stub_get)
+    monkeypatch.setattr(aio.services, "get_cookies", failing_solver)
+    with pytest.raises(WAFError):
+        asyncio.run(aio.get_movie("tt9999998"))
+
+
+def test_aio_graphql_error(monkeypatch):
+    async def stub_post(*args, **kwargs):
+        return SimpleNamespace(status_code=503, text="unavailable", json=lambda: {})
+
+    monkeypatch.setattr(aio.get_session(), "post", stub_post)
+    with pytest.raises(GraphQLError):
+        asyncio.run(aio.get_akas("tt0133093"))
+
+
+def test_aio_get_movies(monkeypatch):
+    async def fake_get_movie(imdb_id, locale=None):
+        if imdb_id == "tt2":
+            raise WAFError("blocked", status_code=202, url=imdb_id)
+        return imdb_id
+
+    monkeypatch.setattr(aio, "get_movie", fake_get_movie)
+
+    async def run():
+        ids = ["tt1", "tt2", "1", "tt3"]
+        return [r async for r in aio.get_movies(ids, max_concurrency=2)]
+
+    results = dict(asyncio.run(run()))
+    assert set(results) == {"tt1", "tt2", "tt3"}
+    assert isinstance(results["tt2"], WAFError)
+
+
+def test_aio_get_name_uses_disk_cache(monkeypatch, tmp_path):
+    from imdbinfo import services
+
+    calls = []
+    fetch = async_get_factory("sample_person.json")
+
+    async def counting_get(*args, **kwargs):
+        calls.append(args)
+        return await fetch(*args, **kwargs)
+
+    monkeypatch.setattr(aio.get_session(), "get", counting_get)
+    services.clear_cache()
+    services.enable_disk_cache(tmp_path / "responses.sqlite3")
+    try:
+        for _ in range(2):
+            aio.get_name.cache_clear()  # served by the disk tier, not memory
+            person = asyncio.run(aio.get_name("nm0000126"))
+            assert person.name == "Kevin Costner"
+        assert len(calls) == 1
+    finally:
+        services.disable_disk_cache()
+
+
+def test_aio_get_reviews_many_batches(monkeypatch):
+    from imdbinfo import services
+
+    queries = []
+    title = {
+        "id": "tt1",
+        "reviews": {"edges": [{"node": {"id": "rw1", "spoiler": True}}]},
+    }
+
+    async def post(*args, json=None, **kwargs):
+        queries.append(json["query"])
+        data = {f"t{n}": title for n in range(json["query"].count("title(id:"))}
+        text = services.decoder.dumps({"data": data})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(aio.get_session(), "post", post)
+    services.clear_cache()
+    ids = ["tt0000011", "tt0000012", "tt0000013"]
+    result = asyncio.run(aio.get_reviews_many(ids, batch_size=2))
+    assert len(queries) == 2
+    assert [r[0]["spoiler"] for r in result.values()] == [True, True, True]
+    services.clear_cache()
+
+
+def test_aio_iter_images_follows_cursor(monkeypatch):
+    from imdbinfo import services
+
+    queries = []
+
+    async def post(*args, json=None, **kwargs):
+        queries.append(json["query"])
+        last = "after:" in json["query"]
+        images = {
+            "total": 2,
+            "pageInfo": {"endCursor": "next", "hasNextPage": not last},
+            "edges": [{"node": {"id": f"rm{len(queries)}", "url": "https://x/y.jpg"}}],
+        }
+        text = services.decoder.dumps(
+            {"data": {"title": {"id": "tt1", "images": images}}}
+        )
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(aio.get_session(), "post", post)
+
+    async def collect():
+        return [item.id async for item in aio.iter_images("tt0133093", page_size=1)]
+
+    assert asyncio.run(collect()) == ["rm1", "rm2"]
+    assert 'images(first: 1, after: "next")' in queries[1]
+
+
+def test_aio_iter_images_without_images(monkeypatch):
+    from imdbinfo import services
+
+    async def post(*args, **kwargs):
+        title = {"id": "tt0133093", "images": {"total": 0, "edges": []}}
+        text = services.decoder.dumps({"data": {"title": title}})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(aio.get_session(), "post", post)
+
+    async def collect():
+        return [item async for item in aio.iter_images("tt0133093")]
+
+    assert asyncio.run(collect()) == []
+
+
+def test_aio_get_series_episodes_uses_listed_season_numbers(monkeypatch):
+    from imdbinfo import services
+    from tests.test_services import _gapped_seasons_get
+
+    seasons_seen = []
+    season_get = _gapped_seasons_get(seasons_seen)
+
+    async def get(url, **kwargs):
+        return season_get(url, **kwargs)
+
+    monkeypatch.setattr(aio.get_session(), "get", get)
+    services.clear_cache()
+    seasons = asyncio.run(aio.get_series_episodes("tt0944947"))
+    assert [s.season_number for s in seasons] == [2, 3, 5]
+    assert sorted(seasons_seen) == [1, 3, 5]
+    services.clear_cache()
+
+
+def test_aio_iter_filmography_max_items(monkeypatch):
+    from imdbinfo import services
+
+    queries = []
+
+    async def post(*args, json=None, **kwargs):
+        queries.append(json["query"])
+        edges = [
+            {
+                "node": {
+                    "category": {"id": "composer"},
+                    "title": {"id": f"tt{len(queries)}{i}"},
+                }
+            }
+            for i in range(2)
+        ]
+        name = {
+            "credits": {
+                "edges": edges,
+                "pageInfo": {"endCursor": "x", "hasNextPage": True},
+            }
+        }
+        text = services.decoder.dumps({"data": {"name": name}})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(aio.get_session(), "post", post)
+
+    async def collect():
+        return [
+            title.imdbId
+            async for _, title in aio.iter_filmography("nm1", max_items=3, page_size=2)
+        ]
+
+    assert asyncio.run(collect()) == ["tt10", "tt11", "tt20"]
+    assert len(queries) == 2
+
+
+def test_aio_get_all_episodes_paginates(monkeypatch):
+    import re
+
+    from imdbinfo import services
+
+    async def get(url, **kwargs):
+        match = re.search(r"&start=(\d+)", url)
+        start = int(match.group(1)) if match else 1
+        items = [
+            {"titleId": f"tt{n:07d}", "titleText": f"E{n}", "releaseDate": None}
+            for n in range(start, min(start + 250, 301))
+        ]
+        raw = {
+            "props": {
+                "pageProps": {
+                    "searchResults": {
+                        "titleResults": {"titleListItems": items, "total": 300}
+                    }
+                }
+            }
+        }
+        html = f'<script id="__NEXT_DATA__">{json.dumps(raw)}</script>'.encode()
+        return SimpleNamespace(status_code=200, content=html)
+
+    monkeypatch.setattr(aio.get_session(), "get", get)
+    services.clear_cache()
+    episodes = asyncio.run(aio.get_all_episodes("tt0000001"))
+    assert [e.imdbId for e in episodes] == [f"tt{n:07d}" for n in range(1, 301)]
+
+
+def test_aio_concurrent_identical_requests_are_coalesced(monkeypatch):
+    calls = []
+    fetch = async_get_factory("sample_resource.json")
+
+    async def slow_get(*args, **kwargs):
+        calls.append(args)
+        await asyncio.sleep(0.01)
+        return await fetch(*args, **kwargs)
+
+    monkeypatch.setattr(aio.get_session(), "get", slow_get)
+
+    async def run():
+        return await asyncio.gather(
+            *(aio.get_movie("tt0133093") for _ in range(5)),
+            aio.get_movie("tt0133093", locale="it"),
+        )
+
+    movies = asyncio.run(run())
+    assert len(calls) == 2  # one per locale
+    assert all(movie.title == "The Matrix" for movie in movies)
+
+
+def test_aio_concurrent_section_fetches_are_coalesced(monkeypatch):
+    queries = []
+
+    async def post(*args, json=None, **kwargs):
+        queries.append(json["query"])
+        await asyncio.sleep(0.01)
+        text = services.decoder.dumps({"data": {"title": TITLE_SECTIONS_SAMPLE}})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(aio.get_session(), "post", post, raising=False)
+    services.clear_cache()
+
+    async def run():
+        await asyncio.gather(
+            aio.get_akas("tt0133093"),
+            aio.prefetch_title_sections("tt0133093", ("akas",)),
+            aio.prefetch_title_sections("tt0133093", ("akas",)),
+        )
+
+    asyncio.run(run())
+    services.clear_cache()
+    assert len(queries) == 1
+
+
+def test_aio_getters_use_memory_cache(monkeypatch):
+    calls = []
+    fetch = async_get_factory("sample_resource.json")
+
+    async def counting_get(*args, **kwargs):
+        calls.append(args)
+        return await fetch(*args, **kwargs)
+
+    monkeypatch.setattr(aio.get_session(), "get", counting_get)
+    services.clear_cache()
+    movie = asyncio.run(aio.get_movie("tt0133093"))
+    assert asyncio.run(aio.get_movie("tt0133093")) is movie
+    assert len(calls) == 1
+
+    assert services.invalidate("nm0133093") == 0  # same digits, other kind of id
+    assert services.invalidate("tt0133093") == 1
+    asyncio.run(aio.get_movie("tt0133093"))
+    assert len(calls) == 2
+    services.clear_cache()
+
+
+def test_aio_iter_all_episodes_follows_cursor_when_start_is_ignored(monkeypatch):
+    from tests.test_services import _episode_search_get
+
+    requested = []
+    get = _episode_search_get(600, requested, ignore_start=True, cursor=True)
+
+    async def async_get(url, **kwargs):
+        return get(url, **kwargs)
+
+    monkeypatch.setattr(aio.get_session(), "get", async_get)
+    services.clear_cache()
+    episodes = asyncio.run(aio.get_all_episodes("tt0000001"))
+    assert len({e.imdbId for e in episodes}) == len(episodes) == 600
+    assert requested[-2:] == ["c251", "c501"]
+    services.clear_cache()
+
+
+def test_aio_section_cache_runs_off_the_event_loop(monkeypatch, tmp_path):
+    import threading
+
+    threads = []
+    for name in ("_lookup_sections", "_store_sections"):
+        helper = getattr(aio, name)
+
+        def recording(*args, _helper=helper):
+            threads.append(threading.current_thread())
+            return _helper(*args)
+
+        monkeypatch.setattr(aio, name, recording)
+
+    async def post(*args, json=None, **kwargs):
+        text = services.decoder.dumps({"data": {"title": TITLE_SECTIONS_SAMPLE}})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(aio.get_session(), "post", post, raising=False)
+    services.clear_cache()
+    services.enable_disk_cache(tmp_path / "responses.sqlite3")
+    try:
+        asyncio.run(aio.prefetch_title_sections("tt0133093", ("akas",)))
+    finally:
+        services.disable_disk_cache()
+        services.clear_cache()
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
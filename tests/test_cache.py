@@ -0,0 +1,429 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from imdbinfo import cache, services
+from tests.test_services import mock_get_factory
+
+PAYLOAD = {"props": {"pageProps": {"title": "The Matrix", "votes": [1, 2, 3]}}}
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    store = cache.DiskCache(tmp_path / "responses.sqlite3")
+    yield store
+    store.close()
+
+
+def test_disk_cache_roundtrip_and_counters(disk_cache):
+    assert disk_cache.get("title", "tt0133093", "en") is None
+    disk_cache.set("title", "tt0133093", "en", PAYLOAD)
+    assert disk_cache.get("title", "tt0133093", "en") == PAYLOAD
+    assert disk_cache.get("title", "tt0133093", "it") is None
+
+    stats = disk_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["stores"] == 1
+    assert stats["entries"] == 1
+    assert stats["bytes"] > 0
+    assert stats["endpoints"]["title"] == {"misses": 2, "stores": 1, "hits": 1}
+
+
+def test_disk_cache_expires_per_endpoint_ttl(disk_cache, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(cache, "time", lambda: now)
+    disk_cache.ttls.update(search=10, title=100)
+    disk_cache.set("search", "abc", "en", PAYLOAD)
+    disk_cache.set("title", "tt1", "en", PAYLOAD)
+
+    now += 50
+    assert disk_cache.get("search", "abc", "en") is None
+    assert disk_cache.get("title", "tt1", "en") == PAYLOAD
+    assert disk_cache.stats()["expired"] == 1
+
+
+def test_disk_cache_zero_ttl_disables_endpoint(disk_cache):
+    disk_cache.ttls["search"] = 0
+    disk_cache.set("search", "abc", "en", PAYLOAD)
+    assert disk_cache.stats()["entries"] == 0
+
+
+def test_disk_cache_evicts_least_recently_used(disk_cache, monkeypatch):
+    clock = iter(range(1_000_000, 2_000_000))
+    monkeypatch.setattr(cache, "time", lambda: float(next(clock)))
+    blob_size = len(cache.decoder.dumps(PAYLOAD))
+    disk_cache.max_bytes = blob_size * 2
+
+    disk_cache.set("title", "tt1", "en", PAYLOAD)
+    disk_cache.set("title", "tt2", "en", PAYLOAD)
+    assert disk_cache.get("title", "tt1", "en") == PAYLOAD  # tt2 is now the LRU
+    disk_cache.set("title", "tt3", "en", PAYLOAD)
+
+    assert disk_cache.get("title", "tt2", "en") is None
+    assert disk_cache.get("title", "tt1", "en") == PAYLOAD
+    assert disk_cache.get("title", "tt3", "en") == PAYLOAD
+    assert disk_cache.stats()["evictions"] == 1
+
+
+def test_disk_cache_invalidate_and_clear(disk_cache):
+    disk_cache.set("title", "tt1", "en", PAYLOAD)
+    disk_cache.set("title", "tt1", "it", PAYLOAD)
+    disk_cache.set("name", "nm1", "en", PAYLOAD)
+
+    disk_cache.invalidate("title", "tt1", "it")
+    assert disk_cache.get("title", "tt1", "it") is None
+    assert disk_cache.get("title", "tt1", "en") == PAYLOAD
+    disk_cache.invalidate("title", "tt1")
+    assert disk_cache.get("title", "tt1", "en") is None
+
+    disk_cache.clear()
+    assert disk_cache.stats()["entries"] == 0
+    assert disk_cache.stats()["hits"] == 0
+
+
+def test_disk_cache_is_shared_between_instances(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    writer, reader = cache.DiskCache(path), cache.DiskCache(path)
+    try:
+        writer.set("name", "nm0000126", "en", PAYLOAD)
+        assert reader.get("name", "nm0000126", "en") == PAYLOAD
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_get_movie_is_served_from_disk_cache(monkeypatch, tmp_path):
+    calls = []
+    fetch = mock_get_factory("sample_resource.json")
+
+    def counting_get(*args, **kwargs):
+        calls.append(args)
+        return fetch(*args, **kwargs)
+
+    monkeypatch.setattr(services.get_session(), "get", counting_get)
+    store = services.enable_disk_cache(tmp_path / "responses.sqlite3")
+    try:
+        for _ in range(2):
+            services.get_movie.cache_clear()  # simulate a fresh process
+            assert services.get_movie("tt0133093").title == "The Matrix"
+        assert len(calls) == 1
+        assert store.stats()["endpoints"]["title"]["hits"] == 1
+        assert os.path.exists(tmp_path / "responses.sqlite3")
+    finally:
+        services.disable_disk_cache()
+        services.get_movie.cache_clear()
+    assert services.get_disk_cache() is None
+
+
+def test_disk_cache_invalidate_id_drops_all_endpoints(disk_cache):
+    disk_cache.set("title", "tt0133093", "en", PAYLOAD)
+    disk_cache.set("season", "tt0133093:2", "it", PAYLOAD)
+    disk_cache.set("title", "tt0234215", "en", PAYLOAD)
+    disk_cache.set("name", "nm0133093", "en", PAYLOAD)
+    assert disk_cache.invalidate_id("0133093") == 2
+    assert disk_cache.get("title", "tt0234215", "en") == PAYLOAD
+    assert disk_cache.get("name", "nm0133093", "en") == PAYLOAD
+    assert disk_cache.invalidate_id("nm0133093") == 1
+
+
+@pytest.fixture
+def memory():
+    return cache.MemoryCache(max_entries=3, max_bytes=10_000)
+
+
+def test_memory_cache_hits_misses_and_lru_order(memory):
+    assert memory.get("a", "title") is cache._MISSING
+    for key in "abc":
+        memory.set(key, {"key": key}, "title")
+    assert memory.get("a", "title") == {"key": "a"}  # b is now the LRU
+    memory.set("d", {"key": "d"}, "title")
+
+    assert memory.get("b", "title") is cache._MISSING
+    stats = memory.stats()
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 1
+    assert stats["kinds"]["title"] == {"misses": 2, "hits": 1, "evictions": 1}
+
+
+def test_memory_cache_respects_max_bytes(memory):
+    memory.max_bytes = 3 * len('{"x": "..."}')
+    memory.set("a", {"x": "a" * 5}, "title")
+    memory.set("b", {"x": "b" * 5}, "title")
+    memory.set("c", {"x": "c" * 500}, "title")
+    assert memory.stats()["bytes"] <= memory.max_bytes
+    assert memory.get("a", "title") is cache._MISSING
+
+
+def test_memory_cache_ttl_per_kind(memory, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(cache, "time", lambda: now)
+    memory.configure(ttls={"search": 10, "name": 100, "episodes": 0})
+    memory.set("s", 1, "search")
+    memory.set("n", 2, "name")
+    memory.set("e", 3, "episodes")
+
+    now += 50
+    assert memory.get("s", "search") is cache._MISSING
+    assert memory.get("n", "name") == 2
+    assert memory.get("e", "episodes") is cache._MISSING
+    assert memory.stats()["expired"] == 1
+
+
+def test_memory_cache_invalidate_by_id_and_clear(memory):
+    memory.set(1, "movie", "title", tag="tt0133093")
+    memory.set(2, "gallery", "title_extended", tag="tt0133093")
+    memory.set(3, "person", "name", tag="nm0133093")
+
+    assert memory.invalidate("tt0133093", kind="title") == 1
+    assert memory.invalidate("0133093") == 1  # bare digits: a title
+    assert memory.get(3, "name") == "person"
+    assert memory.invalidate("nm0133093") == 1
+    memory.clear("title")
+    assert memory.stats()["entries"] == 0
+
+
+def test_memoized_getters_share_one_cache(monkeypatch):
+    calls = []
+    fetch = mock_get_factory("sample_resource.json")
+
+    def counting_get(*args, **kwargs):
+        calls.append(args)
+        return fetch(*args, **kwargs)
+
+    monkeypatch.setattr(services.get_session(), "get", counting_get)
+    services.clear_cache()
+    assert services.get_movie("tt0133093") is services.get_movie("tt0133093")
+    assert len(calls) == 1
+    assert services.cache_stats()["kinds"]["title"]["hits"] == 1
+
+    assert services.invalidate("tt0133093") == 1
+    services.get_movie("tt0133093")
+    assert len(calls) == 2
+    services.clear_cache()
+    assert services.cache_stats()["entries"] == 0
+
+
+def test_configure_cache_ttl_zero_disables_kind(monkeypatch):
+    calls = []
+    fetch = mock_get_factory("sample_resource.json")
+
+    def counting_get(*args, **kwargs):
+        calls.append(args)
+        return fetch(*args, **kwargs)
+
+    monkeypatch.setattr(services.get_session(), "get", counting_get)
+    previous = dict(services.memory_cache.ttls)
+    services.clear_cache()
+    services.configure_cache(ttls={"title": 0})
+    try:
+        services.get_movie("tt0133093")
+        services.get_movie("tt0133093")
+        assert len(calls) == 2
+    finally:
+        services.memory_cache.ttls = previous
+
+
+def test_single_flight_shares_result_and_errors():
+    flight = cache.SingleFlight()
+    release, calls = threading.Event(), []
+
+    def slow(value):
+        calls.append(value)
+        release.wait(5)
+        if value == "boom":
+            raise ValueError(value)
+        return {"value": value}
+
+    def run(key, value, results):
+        try:
+            results.append(flight.do(key, slow, value))
+        except ValueError as exc:
+            results.append(exc)
+
+    ok, failed = [], []
+    threads = [threading.Thread(target=run, args=("a", "x", ok)) for _ in range(4)]
+    threads += [
+        threading.Thread(target=run, args=("b", "boom", failed)) for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    while flight.shared < 5:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(calls) == ["boom", "x"]
+    assert len(ok) == 4 and all(result is ok[0] for result in ok)
+    assert len(failed) == 3 and all(isinstance(e, ValueError) for e in failed)
+    assert flight.do("a", lambda: "fresh") == "fresh"  # nothing is remembered
+
+
+def test_concurrent_get_movie_issues_one_request(monkeypatch):
+    calls = []
+    fetch = mock_get_factory("sample_resource.json")
+    barrier = threading.Barrier(6)
+
+    def slow_get(*args, **kwargs):
+        calls.append(args)
+        time.sleep(0.05)
+        return fetch(*args, **kwargs)
+
+    def run(results):
+        barrier.wait()
+        results.append(services.get_movie("tt0133093"))
+
+    monkeypatch.setattr(services.get_session(), "get", slow_get)
+    services.clear_cache()
+    results = []
+    threads = [threading.Thread(target=run, args=(results,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    services.clear_cache()
+
+    assert len(calls) == 1
+    assert len(results) == 6 and all(movie is results[0] for movie in results)
+
+
+def test_async_single_flight_waiter_takes_over_from_cancelled_leader():
+    import asyncio
+
+    flight = cache.AsyncSingleFlight()
+    calls = []
+
+    async def fetch(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    async def run():
+        leader = asyncio.create_task(flight.do("k", fetch, "x"))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(flight.do("k", fetch, "x")) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*waiters)
+
+    assert asyncio.run(run()) == ["x", "x", "x"]
+    assert calls == ["x", "x"]  # the cancelled attempt and one takeover
+
+
+def test_disk_cache_keeps_expired_entries_with_validators(disk_cache, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(cache, "time", lambda: now)
+    validators = {"etag": '"v1"', "last_modified": "Tue, 01 Jul 2025 10:00:00 GMT"}
+    disk_cache.set("title", "tt1", "en", PAYLOAD, validators)
+    disk_cache.set("title", "tt2", "en", PAYLOAD)
+
+    now += disk_cache.ttl("title") + 1
+    assert disk_cache.get("title", "tt1", "en") is None
+    assert disk_cache.get("title", "tt2", "en") is None
+    assert disk_cache.get_stale("title", "tt1", "en") == (PAYLOAD, validators)
+    assert disk_cache.get_stale("title", "tt2", "en") is None  # dropped, no validators
+
+    disk_cache.refresh("title", "tt1", "en")
+    assert disk_cache.get("title", "tt1", "en") == PAYLOAD
+    stats = disk_cache.stats()
+    assert stats["revalidations"] == 1
+    assert stats["not_modified"] == 1
+    assert stats["revalidation_hit_rate"] == 1.0
+
+
+def test_disk_cache_adds_validator_columns_to_old_databases(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "responses.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        cache._SCHEMA.replace("etag TEXT,", "").replace("last_modified TEXT,", "")
+    )
+    conn.close()
+
+    store = cache.DiskCache(path)
+    try:
+        store.set("title", "tt1", "en", PAYLOAD, {"etag": '"v1"'})
+        assert store.get_stale("title", "tt1", "en") == (PAYLOAD, {"etag": '"v1"'})
+    finally:
+        store.close()
+
+
+def test_unchanged_page_is_revalidated_without_parsing(monkeypatch, tmp_path):
+    now = 1_000_000.0
+    monkeypatch.setattr(cache, "time", lambda: now)
+    page = mock_get_factory("sample_resource.json")()
+    sent = []
+
+    def conditional_get(url, headers=None, **kwargs):
+        sent.append(headers.get("if-none-match"))
+        if headers.get("if-none-match") == '"v1"':
+            return SimpleNamespace(
+                status_code=304, text="", headers={}, close=lambda: None
+            )
+        page.headers = {"ETag": '"v1"'}
+        return page
+
+    parsed = []
+    parse = services.parse_json_movie
+
+    def counting_parse(raw_json):
+        parsed.append(1)
+        return parse(raw_json)
+
+    monkeypatch.setattr(services.get_session(), "get", conditional_get)
+    monkeypatch.setattr(services, "parse_json_movie", counting_parse)
+    services.clear_cache()
+    store = services.enable_disk_cache(tmp_path / "responses.sqlite3")
+    try:
+        movie = services.get_movie("tt0133093")
+        now += store.ttl("title") + 1  # disk and memory entries are stale
+        assert services.get_movie("tt0133093") is movie
+        assert sent == [None, '"v1"']
+        assert len(parsed) == 1
+        stats = store.stats()
+        assert stats["revalidations"] == stats["not_modified"] == 1
+        assert stats["revalidation_hit_rate"] == 1.0
+
+        now += 10  # renewed by the 304: served from disk again
+        services.get_movie.cache_clear()
+        assert services.get_movie("tt0133093").title == "The Matrix"
+        assert len(sent) == 2
+    finally:
+        services.disable_disk_cache()
+        services.clear_cache()
+
+
+def test_aio_revalidates_changed_page(monkeypatch, tmp_path):
+    import asyncio
+
+    from imdbinfo import aio
+
+    now = 1_000_000.0
+    monkeypatch.setattr(cache, "time", lambda: now)
+    page = mock_get_factory("sample_resource.json")()
+    sent = []
+
+    async def conditional_get(url, headers=None, **kwargs):
+        sent.append(headers.get("if-none-match"))
+        page.headers = {"ETag": f'"v{len(sent)}"'}  # changed every time
+        return page
+
+    monkeypatch.setattr(aio.get_session(), "get", conditional_get)
+    store = services.enable_disk_cache(tmp_path / "responses.sqlite3")
+    try:
+        asyncio.run(aio.get_movie("tt0133093"))
+        now += store.ttl("title") + 1
+        assert asyncio.run(aio.get_movie("tt0133093")).title == "The Matrix"
+        assert sent == [None, '"v1"']
+        assert store.get_stale("title", "tt0133093", None)[1] == {"etag": '"v2"'}
+        assert store.stats()["revalidation_hit_rate"] == 0.0  # changed: no 304
+    finally:
+        services.disable_disk_cache()
+        services.clear_cache()
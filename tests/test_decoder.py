@@ -0,0 +1,60 @@
+import json
+import os
+
+import pytest
+
+from imdbinfo import decoder
+
+SAMPLE = os.path.join(
+    os.path.dirname(__file__), "sample_json_source", "sample_resource.json"
+)
+
+
+@pytest.fixture
+def restore_backend():
+    active = decoder.get_json_backend()
+    yield
+    decoder.set_json_backend(active)
+
+
+def _installed_backends():
+    installed = []
+    for name in decoder.BACKENDS:
+        try:
+            decoder._FACTORIES[name]()
+        except ImportError:
+            continue
+        installed.append(name)
+    return installed
+
+
+def test_default_backend_is_first_installed():
+    assert decoder.get_json_backend() == _installed_backends()[0]
+
+
+@pytest.mark.parametrize("backend", _installed_backends())
+def test_backends_decode_bytes_like_stdlib(backend, restore_backend):
+    with open(SAMPLE, "rb") as f:
+        raw = f.read()
+    assert decoder.set_json_backend(backend) == backend
+    assert decoder.loads(raw) == json.loads(raw)
+    assert decoder.loads(bytearray(raw)) == json.loads(raw)
+    assert decoder.loads(raw.decode("utf-8")) == json.loads(raw)
+
+
+@pytest.mark.parametrize("backend", _installed_backends())
+def test_backends_raise_value_error_on_invalid_json(backend, restore_backend):
+    decoder.set_json_backend(backend)
+    with pytest.raises(ValueError):
+        decoder.loads(b"{broken")
+
+
+def test_unknown_or_missing_backend_falls_back_to_stdlib(monkeypatch, restore_backend):
+    assert decoder.set_json_backend("nope") == "json"
+
+    def missing():
+        raise ImportError("not installed")
+
+    monkeypatch.setitem(decoder._FACTORIES, "orjson", missing)
+    assert decoder.set_json_backend("orjson") == "json"
+    assert decoder.get_json_backend() == "json"
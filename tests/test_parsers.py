@@ -1,5 +1,9 @@
 import json
 import os
+
+import jmespath
+import pytest
+
 from imdbinfo import parsers
 from imdbinfo.models import ParentalGuideList, MediaItem, MediaGallery
 
@@ -385,3 +389,99 @@ def test_parse_json_media_gallery_nullable_fields():
 
     some_have_titles = any(len(item.titles) > 0 for item in gallery.items)
     assert some_have_titles
+
+
+def test_pjmespatch_reuses_compiled_expressions():
+    from imdbinfo.parsers import pjmespatch, _compile_jmespath
+
+    _compile_jmespath.cache_clear()
+    assert pjmespatch("a.b", {"a": {"b": 1}}) == 1
+    assert pjmespatch("a.b", {"a": {"b": 2}}, lambda x: x * 10) == 20
+    info = _compile_jmespath.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+# ── direct lookups vs the JMESPath interpreter ───────────────────────────────
+
+
+def _sparse(raw_json):
+    page = raw_json["props"]["pageProps"]
+    # drop whole sections to exercise the missing-data paths
+    for key in ("runtime", "primaryImage", "releaseYear"):
+        page["aboveTheFoldData"].pop(key, None)
+    for key in ("certificates", "categories", "crewV2", "technicalSpecifications"):
+        page["mainColumnData"].pop(key, None)
+    return raw_json
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize(
+    "filename",
+    ["sample_resource.json", "sample_series.json", "sample_episode.json"],
+)
+def test_parse_json_movie_matches_jmespath_interpreter(monkeypatch, filename, sparse):
+    raw_json = load_sample(filename)
+    if sparse:
+        raw_json = _sparse(raw_json)
+    direct = parsers.parse_json_movie(raw_json)
+    monkeypatch.setattr(
+        parsers, "_compile_lookup", lambda query: jmespath.compile(query).search
+    )
+    interpreted = parsers.parse_json_movie(raw_json)
+    assert type(direct) is type(interpreted)
+    assert direct.model_dump() == interpreted.model_dump()
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["sample_resource.json", "sample_series.json", "sample_episode.json"],
+)
+def test_movie_field_helpers_match_jmespath(filename):
+    main = load_sample(filename)["props"]["pageProps"]["mainColumnData"]
+    edges = main["certificates"]["edges"]
+    assert parsers._certificate_rows(edges) == jmespath.search(
+        "[].node.[id,country.id,country.text,rating,ratingReason,attributes[].text]",
+        edges,
+    )
+    assert parsers._mpaa_edges(edges) == jmespath.search(
+        "[?node.ratingsBody.id=='MPAA']", edges
+    )
+    for category in main.get("companyCreditCategories") or []:
+        for edge in category["companyCredits"]["edges"]:
+            for field in ("attributes", "countries"):
+                value = edge["node"].get(field)
+                assert parsers._texts(value) == jmespath.search("[].text", value)
+    for value in (None, "x", [], [[{"text": "a"}], {"text": None}, {"text": "b"}]):
+        assert parsers._texts(value) == jmespath.search("[].text", value)
+        assert parsers._mpaa_edges(value) == jmespath.search(
+            "[?node.ratingsBody.id=='MPAA']", value
+        )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "a",
+        "a.b.c",
+        "a.list[]",
+        "a.list[].x",
+        "a.list[].x.y",
+        "a.nested[].items[].x",
+        "a.nested[].items[]",
+        "missing.list[].x",
+        "a.b.c.d",
+        "a.list[].missing",
+    ],
+)
+def test_compile_lookup_matches_jmespath(query):
+    import jmespath
+
+    data = {
+        "a": {
+            "b": {"c": 0},
+            "list": [{"x": {"y": 1}}, None, [{"x": 2}, {"x": None}], {"z": 3}],
+            "nested": [{"items": [{"x": 1}, {"x": 2}]}, {"items": None}, {}],
+        }
+    }
+    assert parsers._compile_lookup(query)(data) == jmespath.search(query, data)
@@ -0,0 +1,128 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from imdbinfo import retry, services
+from imdbinfo.exceptions import GraphQLError, HTTPError, WAFError
+from tests.test_services import _make_response, mock_get_factory
+
+
+def _failing(*errors, result="ok"):
+    """Return a callable raising ``errors`` in turn, then returning ``result``."""
+    pending = list(errors)
+    calls = []
+
+    def func():
+        calls.append(1)
+        if pending:
+            raise pending.pop(0)
+        return result
+
+    func.calls = calls
+    return func
+
+
+def _http(status):
+    return HTTPError(f"HTTP {status}", status_code=status, url="https://www.imdb.com/")
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    monkeypatch.setattr(retry, "sleep", lambda seconds: None)
+    return retry.RetryPolicy(max_attempts=3, jitter=False)
+
+
+def test_retries_transient_errors_until_success(policy):
+    func = _failing(_http(503), ConnectionError("reset"))
+    assert policy.call(func) == "ok"
+    assert len(func.calls) == 3
+    assert policy.retries == 2
+
+
+def test_gives_up_after_max_attempts_and_records_retries(policy):
+    func = _failing(*(_http(502) for _ in range(5)))
+    with pytest.raises(HTTPError) as exc_info:
+        policy.call(func)
+    assert len(func.calls) == 3
+    assert exc_info.value.retries == 2
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        _http(404),
+        WAFError("blocked", status_code=202, url="https://www.imdb.com/"),
+        GraphQLError("bad query", url=services.GRAPHQL_URL, query_term="x"),
+        ValueError("not transient"),
+    ],
+)
+def test_non_retryable_errors_raise_immediately(policy, error):
+    func = _failing(error)
+    with pytest.raises(type(error)):
+        policy.call(func)
+    assert len(func.calls) == 1
+    assert getattr(error, "retries", 0) == 0
+
+
+def test_retry_on_is_configurable(policy):
+    policy.configure(retry_on=[202])
+    func = _failing(WAFError("blocked", status_code=202, url="u"))
+    assert policy.call(func) == "ok"
+    assert policy.retry_on == frozenset({202})
+
+
+def test_exponential_backoff_is_capped_and_jittered(monkeypatch):
+    policy = retry.RetryPolicy(backoff=0.5, max_backoff=3.0, jitter=False)
+    assert [policy.backoff_delay(n) for n in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 3.0]
+
+    policy.jitter = True
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: (low, high))
+    assert policy.backoff_delay(3) == (0, 2.0)
+
+
+def test_deadline_stops_retrying(monkeypatch):
+    now = SimpleNamespace(value=100.0)
+    monkeypatch.setattr(retry, "monotonic", lambda: now.value)
+    monkeypatch.setattr(
+        retry, "sleep", lambda seconds: setattr(now, "value", now.value + seconds)
+    )
+    policy = retry.RetryPolicy(max_attempts=10, backoff=1.0, jitter=False, deadline=5.0)
+
+    func = _failing(*(_http(503) for _ in range(10)))
+    with pytest.raises(HTTPError) as exc_info:
+        policy.call(func)
+    # waits of 1s and 2s fit in 5s, the next 4s wait would not
+    assert len(func.calls) == 3
+    assert exc_info.value.retries == 2
+
+
+def test_async_call_retries(monkeypatch):
+    async def no_sleep(seconds):
+        return None
+
+    monkeypatch.setattr(retry.asyncio, "sleep", no_sleep)
+    policy = retry.RetryPolicy(jitter=False)
+    errors = [_http(500)]
+
+    async def func():
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    assert asyncio.run(policy.call_async(func)) == "ok"
+    assert policy.retries == 1
+
+
+def test_get_movie_survives_a_transient_5xx(monkeypatch):
+    fetch = mock_get_factory("sample_resource.json")
+    responses = [_make_response(503, text="unavailable")]
+
+    def flaky_get(*args, **kwargs):
+        return responses.pop() if responses else fetch(*args, **kwargs)
+
+    monkeypatch.setattr(services.get_session(), "get", flaky_get)
+    monkeypatch.setattr(services, "_refresh_waf_cookies", lambda *a, **kw: (None, 0))
+    services.clear_cache()
+    assert services.get_movie("tt0133093").title == "The Matrix"
+    services.clear_cache()
@@ -19,11 +19,24 @@ def mock_get_factory(filename: str):
     )
 
     def mock_get(*args, **kwargs):
-        return SimpleNamespace(status_code=200, content=html)
+        return _make_response(200, content=html)
 
     return mock_get
 
 
+def _make_response(status_code: int, text: str = "", content: bytes = b""):
+    """Fake response usable both buffered (``.content``) and streamed."""
+    return SimpleNamespace(
+        status_code=status_code,
+        text=text,
+        content=content,
+        iter_content=lambda chunk_size=1: (
+            content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
+        ),
+        close=lambda: None,
+    )
+
+
 def mock_post_factory(filename: str):
     json_text = load_sample_text(filename)
 
@@ -38,7 +51,7 @@ def mock_post_factory(filename: str):
 
 def test_get_movie(monkeypatch):
     monkeypatch.setattr(
-        services.niquests, "get", mock_get_factory("sample_resource.json")
+        services.get_session(), "get", mock_get_factory("sample_resource.json")
     )
     movie = services.get_movie("tt0133093")
     assert movie.title == "The Matrix"
@@ -47,9 +60,9 @@ def test_get_movie(monkeypatch):
 
 def test_search_title(monkeypatch):
     # Use POST mock for GraphQL-style search responses
-    # allow setting 'post' even if the niquests stub doesn't define it by default
+    # allow setting 'post' even if the session stub doesn't define it by default
     monkeypatch.setattr(
-        services.niquests,
+        services.get_session(),
         "post",
         mock_post_factory("sample_search.json"),
         raising=False,
@@ -61,7 +74,7 @@ def test_search_title(monkeypatch):
 
 def test_search_title_includes_rating(monkeypatch):
     monkeypatch.setattr(
-        services.niquests,
+        services.get_session(),
         "post",
         mock_post_factory("sample_search.json"),
         raising=False,
@@ -74,7 +87,7 @@ def test_search_title_includes_rating(monkeypatch):
 
 def test_get_name(monkeypatch):
     monkeypatch.setattr(
-        services.niquests, "get", mock_get_factory("sample_person.json")
+        services.get_session(), "get", mock_get_factory("sample_person.json")
     )
     person = services.get_name("nm0000126")
     assert person.name == "Kevin Costner"
@@ -95,17 +108,15 @@ from imdbinfo.exceptions import (
 
 def _make_get_stub(status_code: int, text: str = "", content: bytes = b""):
     def stub(*args, **kwargs):
-        return SimpleNamespace(
-            status_code=status_code,
-            text=text,
-            content=content,
-        )
+        return _make_response(status_code, text=text, content=content)
 
     return stub
 
 
 def test_http_error_raised_on_non_200(monkeypatch):
-    monkeypatch.setattr(services.niquests, "get", _make_get_stub(404, text="not found"))
+    monkeypatch.setattr(
+        services.get_session(), "get", _make_get_stub(404, text="not found")
+    )
     with pytest.raises(HTTPError) as exc_info:
         services.get_movie.cache_clear()
         services.get_movie("tt9999999")
@@ -117,7 +128,7 @@ def test_http_error_raised_on_non_200(monkeypatch):
 
 def test_waf_error_raised_on_202(monkeypatch):
     monkeypatch.setattr(
-        services.niquests, "get", _make_get_stub(202, text="waf challenge")
+        services.get_session(), "get", _make_get_stub(202, text="waf challenge")
     )
     with pytest.raises(WAFError) as exc_info:
         services.get_movie.cache_clear()
@@ -140,7 +151,7 @@ def test_waf_error_is_subclass_of_http_error():
 def test_parse_error_raised_when_no_next_data(monkeypatch):
     # Return a 200 response whose HTML has no __NEXT_DATA__ script tag
     monkeypatch.setattr(
-        services.niquests,
+        services.get_session(),
         "get",
         _make_get_stub(200, content=b"<html><body>nothing here</body></html>"),
     )
@@ -158,13 +169,14 @@ def test_graphql_error_raised_on_non_200_post(monkeypatch):
             status_code=503, text="service unavailable", json=lambda: {}
         )
 
-    monkeypatch.setattr(services.niquests, "post", stub_post, raising=False)
+    monkeypatch.setattr(services.get_session(), "post", stub_post, raising=False)
     with pytest.raises(GraphQLError) as exc_info:
         services.search_title.cache_clear()
         services.search_title("matrix_test_error")
     err = exc_info.value
     assert err.status_code == 503
     assert err.query_term == "matrix_test_error"
+    assert err.retries == services.retry_policy.max_attempts - 1
     assert isinstance(err, ImdbinfoError)
 
 
@@ -177,10 +189,11 @@ def test_graphql_error_raised_on_errors_payload(monkeypatch):
         return SimpleNamespace(
             status_code=200,
             text=_json.dumps(payload),
+            content=_json.dumps(payload).encode(),
             json=lambda: payload,
         )
 
-    monkeypatch.setattr(services.niquests, "post", stub_post, raising=False)
+    monkeypatch.setattr(services.get_session(), "post", stub_post, raising=False)
     with pytest.raises(GraphQLError) as exc_info:
         services.search_title.cache_clear()
         services.search_title("matrix_test_gql_err")
@@ -232,7 +245,7 @@ def test_parse_error_metadata():
 
 def test_get_media_gallery(monkeypatch):
     monkeypatch.setattr(
-        services.niquests,
+        services.get_session(),
         "post",
         mock_post_factory("sample_media_gallery.json"),
         raising=False,
@@ -264,11 +277,767 @@ def test_get_media_gallery_caches(monkeypatch):
             json=lambda: json.loads(json_text),
         )
 
-    monkeypatch.setattr(services.niquests, "post", counting_post, raising=False)
-    services.get_media_gallery.cache_clear()
-    services._get_extended_title_info.cache_clear()
+    monkeypatch.setattr(services.get_session(), "post", counting_post, raising=False)
+    services.clear_cache()
 
     g1 = services.get_media_gallery("tt0133093")
     g2 = services.get_media_gallery("tt0133093")
     assert g1.total == g2.total
     assert call_count == 1
+
+
+def _graphql_title_post(queries, title):
+    def post(*args, json=None, **kwargs):
+        queries.append(json["query"])
+        text = services.decoder.dumps({"data": {"title": title}})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    return post
+
+
+TITLE_SECTIONS_SAMPLE = {
+    "id": "tt0133093",
+    "titleText": {"text": "The Matrix"},
+    "akas": {
+        "edges": [
+            {
+                "node": {
+                    "title": "Matrix",
+                    "country": {"code": "IT", "name": "Italy"},
+                    "language": {"code": "it", "name": "Italian"},
+                }
+            }
+        ]
+    },
+    "reviews": {"edges": [{"node": {"id": "rw1", "spoiler": False}}]},
+}
+
+
+def test_extended_getters_query_only_their_section(monkeypatch):
+    queries = []
+    monkeypatch.setattr(
+        services.get_session(),
+        "post",
+        _graphql_title_post(queries, TITLE_SECTIONS_SAMPLE),
+        raising=False,
+    )
+    services.clear_cache()
+    akas = services.get_akas("tt0133093")
+    assert akas.akas[0].title == "Matrix"
+    assert len(queries) == 1
+    assert "akas(first" in queries[0]
+    for other in ("reviews(", "trivia(", "images(", "parentsGuide", "interests("):
+        assert other not in queries[0]
+
+    services.get_akas("tt0133093")
+    assert len(queries) == 1  # section served from cache
+    services.get_reviews("tt0133093")
+    assert len(queries) == 2
+    assert "reviews(first" in queries[1] and "akas(" not in queries[1]
+    services.clear_cache()
+
+
+def _run_concurrently(*calls):
+    import threading
+
+    barrier = threading.Barrier(len(calls))
+
+    def run(call):
+        barrier.wait()
+        call()
+
+    threads = [threading.Thread(target=run, args=(call,)) for call in calls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda: services.prefetch_title_sections("tt0133093", ("akas",)),
+        lambda: services.get_akas_many(["tt0133093"], batch_size=5),
+    ],
+)
+def test_concurrent_section_fetches_are_coalesced(monkeypatch, call):
+    import time
+
+    queries = []
+    post = _graphql_title_post(queries, TITLE_SECTIONS_SAMPLE)
+
+    def slow_post(*args, **kwargs):
+        time.sleep(0.05)
+        return post(*args, **kwargs)
+
+    monkeypatch.setattr(services.get_session(), "post", slow_post, raising=False)
+    services.clear_cache()
+    _run_concurrently(*[call] * 4)
+    services.clear_cache()
+    assert len(queries) == 1
+
+
+def test_prefetch_title_sections_fetches_once(monkeypatch):
+    queries = []
+    monkeypatch.setattr(
+        services.get_session(),
+        "post",
+        _graphql_title_post(queries, TITLE_SECTIONS_SAMPLE),
+        raising=False,
+    )
+    services.clear_cache()
+    services.prefetch_title_sections("tt0133093", ("akas", "reviews"))
+    assert services.get_akas("tt0133093").akas[0].country_code == "IT"
+    assert services.get_reviews("tt0133093")[0]["spoiler"] is False
+    assert len(queries) == 1
+    services.clear_cache()
+
+
+def test_extended_getter_returns_empty_for_unknown_title(monkeypatch):
+    queries = []
+    monkeypatch.setattr(
+        services.get_session(),
+        "post",
+        _graphql_title_post(queries, None),
+        raising=False,
+    )
+    services.clear_cache()
+    assert services.get_trivia("tt9999999") == []
+    assert services.get_trivia("tt9999999") == []
+    assert len(queries) == 1
+    services.clear_cache()
+
+
+def test_get_akas_many_packs_titles_per_request(monkeypatch):
+    import re
+
+    queries = []
+
+    def post(*args, json=None, **kwargs):
+        queries.append(json["query"])
+        ids = re.findall(r'(t\d+): title\(id: "(tt\d+)"\)', json["query"])
+        data = {
+            alias: (
+                dict(TITLE_SECTIONS_SAMPLE, id=imdb_id)
+                if imdb_id != "tt0000404"
+                else None
+            )
+            for alias, imdb_id in ids
+        }
+        text = services.decoder.dumps({"data": data})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(services.get_session(), "post", post, raising=False)
+    services.clear_cache()
+    ids = [f"tt{n:07d}" for n in range(1, 8)] + ["0000003", "tt0000404"]
+    result = services.get_akas_many(ids, batch_size=3)
+
+    assert len(queries) == 3  # 8 distinct ids, 3 per request
+    assert list(result) == ids
+    assert result["tt0000001"].imdbId == "tt0000001"
+    assert result["0000003"].akas[0].title == "Matrix"
+    assert result["tt0000404"] == []
+    assert "reviews(" not in queries[0]
+
+    # cached per title: the single getter and a second batch make no request
+    services.get_akas("tt0000002")
+    assert services.get_akas_many(["tt0000001", "tt0000005"])["tt0000005"].akas
+    assert len(queries) == 3
+
+    reviews = services.get_reviews_many(["tt0000001", "tt0000002"])
+    assert len(queries) == 4
+    assert reviews["tt0000002"][0]["spoiler"] is False
+    services.clear_cache()
+
+
+def test_get_reviews_many_keeps_titles_around_partial_errors(monkeypatch):
+    import re
+
+    queries = []
+
+    def post(*args, json=None, **kwargs):
+        queries.append(json["query"])
+        ids = dict(re.findall(r'(t\d+): title\(id: "(tt\d+)"\)', json["query"]))
+        data = {
+            alias: dict(TITLE_SECTIONS_SAMPLE, id=imdb_id)
+            for alias, imdb_id in ids.items()
+        }
+        errors = []
+        if "tt0000002" in ids.values():
+            alias = next(a for a, imdb_id in ids.items() if imdb_id == "tt0000002")
+            data[alias] = None
+            errors.append({"message": "Internal error", "path": [alias, "reviews"]})
+        body = {"data": data, "errors": errors} if errors else {"data": data}
+        text = services.decoder.dumps(body)
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(services.get_session(), "post", post, raising=False)
+    services.clear_cache()
+    reviews = services.get_reviews_many(["tt0000001", "tt0000002", "tt0000003"])
+    assert reviews["tt0000001"][0]["spoiler"] is False
+    assert isinstance(reviews["tt0000002"], GraphQLError)
+    assert reviews["tt0000002"].errors[0]["message"] == "Internal error"
+    assert reviews["tt0000003"][0]["spoiler"] is False
+
+    # the failed title was not cached: only it is asked for again
+    services.get_reviews_many(["tt0000001", "tt0000002", "tt0000003"])
+    assert len(queries) == 2
+    assert re.findall(r'title\(id: "(tt\d+)"\)', queries[1]) == ["tt0000002"]
+    services.clear_cache()
+
+
+def test_get_reviews_many_keeps_titles_with_nested_errors(monkeypatch):
+    # an error inside a title that still returned data does not fail the title
+    def post(*args, json=None, **kwargs):
+        body = {
+            "data": {"t0": dict(TITLE_SECTIONS_SAMPLE, id="tt0000001")},
+            "errors": [
+                {
+                    "message": "Author unavailable",
+                    "path": ["t0", "reviews", "edges", 0, "node", "author"],
+                }
+            ],
+        }
+        text = services.decoder.dumps(body)
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(services.get_session(), "post", post, raising=False)
+    services.clear_cache()
+    reviews = services.get_reviews_many(["tt0000001"])
+    assert reviews["tt0000001"][0]["spoiler"] is False
+    services.clear_cache()
+
+
+def test_batched_query_errors_without_data_still_raise(monkeypatch):
+    def post(*args, **kwargs):
+        text = services.decoder.dumps({"errors": [{"message": "Bad query"}]})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    monkeypatch.setattr(services.get_session(), "post", post, raising=False)
+    services.clear_cache()
+    with pytest.raises(GraphQLError):
+        services.get_reviews_many(["tt0000001"])
+
+
+def _paged_reviews_post(queries, pages):
+    """GraphQL stub serving ``pages`` of reviews, chained by ``c<n>`` cursors."""
+    import re
+
+    def post(*args, json=None, **kwargs):
+        queries.append(json["query"])
+        after = re.search(r'after: "c(\d+)"', json["query"])
+        n = int(after.group(1)) if after else 0
+        title = {
+            "id": "tt0133093",
+            "reviews": {
+                "pageInfo": {"endCursor": f"c{n + 1}", "hasNextPage": n + 1 < pages},
+                "edges": [
+                    {"node": {"id": f"rw{n}-{i}", "spoiler": False}} for i in range(2)
+                ],
+            },
+        }
+        text = services.decoder.dumps({"data": {"title": title}})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    return post
+
+
+def test_iter_reviews_follows_cursor(monkeypatch):
+    queries = []
+    monkeypatch.setattr(
+        services.get_session(), "post", _paged_reviews_post(queries, 3), raising=False
+    )
+    reviews = list(services.iter_reviews("tt0133093", page_size=2))
+    assert len(reviews) == 6
+    assert len(queries) == 3
+    assert "reviews(first: 2)" in queries[0]
+    assert 'reviews(first: 2, after: "c1")' in queries[1]
+    assert "akas(" not in queries[0]
+
+
+def test_iter_reviews_is_lazy(monkeypatch):
+    queries = []
+    monkeypatch.setattr(
+        services.get_session(), "post", _paged_reviews_post(queries, 100), raising=False
+    )
+    reviews = services.iter_reviews("tt0133093", page_size=2)
+    assert queries == []
+    first_three = [next(reviews) for _ in range(3)]
+    assert len(first_three) == 3
+    assert len(queries) == 2
+    reviews.close()
+
+
+def test_iter_akas_stops_without_section(monkeypatch):
+    queries = []
+    monkeypatch.setattr(
+        services.get_session(),
+        "post",
+        _graphql_title_post(queries, None),
+        raising=False,
+    )
+    assert list(services.iter_akas("tt9999999")) == []
+    assert len(queries) == 1
+
+
+def test_iter_images_without_images(monkeypatch):
+    queries = []
+    title = {"id": "tt0133093", "images": {"total": 0, "edges": []}}
+    monkeypatch.setattr(
+        services.get_session(),
+        "post",
+        _graphql_title_post(queries, title),
+        raising=False,
+    )
+    assert list(services.iter_images("tt0133093")) == []
+    assert len(queries) == 1
+
+
+def _paged_credits_post(queries, pages, per_page=3):
+    import re
+
+    def post(*args, json=None, **kwargs):
+        queries.append(json["query"])
+        after = re.search(r'after: "c(\d+)"', json["query"])
+        n = int(after.group(1)) if after else 0
+        edges = [
+            {
+                "node": {
+                    "category": {"id": "actor" if i % 2 else "stunts"},
+                    "title": {
+                        "id": f"tt{n * per_page + i:07d}",
+                        "titleText": {"text": f"Title {n * per_page + i}"},
+                    },
+                }
+            }
+            for i in range(per_page)
+        ]
+        name = {
+            "nameText": {"text": "Busy Person"},
+            "credits": {
+                "edges": edges,
+                "pageInfo": {"endCursor": f"c{n + 1}", "hasNextPage": n + 1 < pages},
+            },
+        }
+        text = services.decoder.dumps({"data": {"name": name}})
+        return SimpleNamespace(status_code=200, content=text, text=text.decode())
+
+    return post
+
+
+def test_iter_filmography_follows_all_pages(monkeypatch):
+    queries = []
+    monkeypatch.setattr(
+        services.get_session(), "post", _paged_credits_post(queries, 4), raising=False
+    )
+    credits = list(services.iter_filmography("nm0000126", page_size=3))
+    assert len(credits) == 12
+    assert len(queries) == 4
+    assert "credits(first: 3" in queries[0]
+    assert 'credits(first: 3, after: "c3"' in queries[3]
+    # grouped by category within each page
+    assert [category for category, _ in credits[:3]] == ["stunts", "stunts", "actor"]
+    assert {title.imdbId for _, title in credits} == {f"tt{n:07d}" for n in range(12)}
+
+
+def test_iter_filmography_max_items_stops_paging(monkeypatch):
+    queries = []
+    monkeypatch.setattr(
+        services.get_session(), "post", _paged_credits_post(queries, 50), raising=False
+    )
+    credits = list(services.iter_filmography("nm0000126", max_items=5, page_size=3))
+    assert len(credits) == 5
+    assert len(queries) == 2
+
+
+def test_get_series_episodes_fetches_remaining_seasons_concurrently(monkeypatch):
+    import re
+    import threading
+    import time
+
+    json_text = load_sample_text("sample_episodes.json")
+    seasons_seen = []
+    in_flight = peak = 0
+    lock = threading.Lock()
+
+    def season_get(url, **kwargs):
+        nonlocal in_flight, peak
+        season = int(re.search(r"season=(\d+)", url).group(1))
+        with lock:
+            seasons_seen.append(season)
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        season_json = json_text.replace(
+            '"currentSeason": "1"', f'"currentSeason": "{season}"'
+        )
+        page = f'<script id="__NEXT_DATA__">{season_json}</script>'.encode()
+        with lock:
+            in_flight -= 1
+        return _make_response(200, content=page)
+
+    monkeypatch.setattr(services.get_session(), "get", season_get)
+    services.clear_cache()
+    seasons = services.get_series_episodes("tt0944947", max_workers=4)
+
+    assert [s.season_number for s in seasons] == list(range(1, 12))
+    assert seasons_seen[0] == 1
+    assert sorted(seasons_seen) == list(range(1, 12))
+    assert 1 < peak <= 4
+    services.clear_cache()
+
+
+def _gapped_seasons_get(seasons_seen, numbers=(2, 3, 5)):
+    """Season page stub for a series listing ``numbers`` (no season 1).
+
+    Asking for a season the series does not have serves its first one.
+    """
+    import re
+
+    raw = json.loads(load_sample_text("sample_episodes.json"))
+    title = raw["props"]["pageProps"]["contentData"]["data"]["title"]
+    title["episodes"]["seasons"] = [{"number": n} for n in numbers]
+
+    def season_get(url, **kwargs):
+        season = int(re.search(r"season=(\d+)", url).group(1))
+        seasons_seen.append(season)
+        section = raw["props"]["pageProps"]["contentData"]["section"]
+        section["currentSeason"] = str(season if season in numbers else numbers[0])
+        page = f'<script id="__NEXT_DATA__">{json.dumps(raw)}</script>'.encode()
+        return _make_response(200, content=page)
+
+    return season_get
+
+
+def test_get_series_episodes_uses_listed_season_numbers(monkeypatch):
+    seasons_seen = []
+    monkeypatch.setattr(
+        services.get_session(), "get", _gapped_seasons_get(seasons_seen)
+    )
+    services.clear_cache()
+    seasons = services.get_series_episodes("tt0944947", max_workers=1)
+    assert [s.season_number for s in seasons] == [2, 3, 5]
+    assert seasons[0].season_numbers == [2, 3, 5]
+    assert seasons_seen == [1, 3, 5]
+    services.clear_cache()
+
+
+def _episode_search_get(
+    total, requested, page_size=250, ignore_start=False, cursor=False
+):
+    """Bulk episode search stub honouring ``start`` (1-based) like IMDb.
+
+    With ``cursor`` each page also carries a ``pageInfo`` cursor (``c<start>``)
+    that is honoured through ``after=`` even when ``start`` is ignored.
+    """
+    import re
+
+    def get(url, **kwargs):
+        match = re.search(r"&start=(\d+)", url)
+        after = re.search(r"&after=c(\d+)", url)
+        start = 1 if ignore_start or not match else int(match.group(1))
+        if after:
+            start = int(after.group(1))
+        requested.append(f"c{start}" if after else start)
+        items = [
+            {
+                "titleId": f"tt{9000000 + n:07d}",
+                "titleText": f"Episode {n}",
+                "releaseDate": {"year": 2000, "month": 1, "day": 1},
+                "series": {"seasonNumber": 1, "episodeNumber": n},
+            }
+            for n in range(start, min(start + page_size, total + 1))
+        ]
+        results = {"titleListItems": items, "total": total}
+        if cursor:
+            next_start = start + page_size
+            results["pageInfo"] = {
+                "hasNextPage": next_start <= total,
+                "endCursor": f"c{next_start}",
+            }
+        raw = {"props": {"pageProps": {"searchResults": {"titleResults": results}}}}
+        page = f'<script id="__NEXT_DATA__">{json.dumps(raw)}</script>'.encode()
+        return _make_response(200, content=page)
+
+    return get
+
+
+def test_get_all_episodes_follows_every_page(monkeypatch):
+    requested = []
+    monkeypatch.setattr(
+        services.get_session(), "get", _episode_search_get(620, requested)
+    )
+    services.clear_cache()
+    episodes = services.get_all_episodes("tt0000001")
+    assert [e.episode_number for e in episodes] == list(range(1, 621))
+    assert requested[0] == 1
+    assert sorted(requested) == [1, 251, 501]
+    services.clear_cache()
+
+
+def test_iter_all_episodes_single_page(monkeypatch):
+    requested = []
+    monkeypatch.setattr(
+        services.get_session(), "get", _episode_search_get(12, requested)
+    )
+    assert len(list(services.iter_all_episodes("tt0000001"))) == 12
+    assert requested == [1]
+
+
+def test_iter_all_episodes_follows_cursor_when_start_is_ignored(monkeypatch):
+    requested = []
+    monkeypatch.setattr(
+        services.get_session(),
+        "get",
+        _episode_search_get(600, requested, ignore_start=True, cursor=True),
+    )
+    services.clear_cache()
+    episodes = list(services.iter_all_episodes("tt0000001"))
+    assert [e.imdbId for e in episodes] == [f"tt{9000000 + n}" for n in range(1, 601)]
+    assert requested[0] == 1 and requested[-2:] == ["c251", "c501"]
+    services.clear_cache()
+
+
+def test_iter_all_episodes_warns_on_shortfall(monkeypatch, caplog):
+    requested = []
+    monkeypatch.setattr(
+        services.get_session(),
+        "get",
+        _episode_search_get(400, requested, ignore_start=True),
+    )
+    services.clear_cache()
+    with caplog.at_level("WARNING", logger="imdbinfo.services"):
+        episodes = list(services.iter_all_episodes("tt0000001"))
+    assert len(episodes) == 250
+    assert len(requested) == 2
+    assert "Collected 250 of 400 episodes" in caplog.text
+    services.clear_cache()
+
+
+# ── Shared session ───────────────────────────────────────────────────────────
+
+
+def test_get_session_is_reused(monkeypatch):
+    monkeypatch.setattr(services, "_session", None)
+    s1 = services.get_session()
+    s2 = services.get_session()
+    assert s1 is s2
+
+
+def test_configure_session_rebuilds_with_options(monkeypatch):
+    monkeypatch.setattr(services, "_session", None)
+    monkeypatch.setattr(services, "_SESSION_OPTIONS", dict(services._SESSION_OPTIONS))
+    old = services.get_session()
+    services.configure_session(pool_maxsize=32)
+    new = services.get_session()
+    assert old.closed
+    assert new is not old
+    assert new.options["pool_maxsize"] == 32
+
+
+def test_session_ignores_incoming_cookies(monkeypatch):
+    # WAF tokens travel only through the explicit cookies= argument
+    monkeypatch.setattr(services, "_session", None)
+    assert services.get_session().options["allow_incoming_cookies"] is False
+
+
+def test_set_session_injects_caller_session(monkeypatch):
+    monkeypatch.setattr(services, "_session", None)
+    calls = []
+
+    class CallerSession:
+        def get(self, url, **kwargs):
+            calls.append(url)
+            return SimpleNamespace(status_code=200, content=b"")
+
+        def close(self):
+            raise AssertionError("caller-owned session must not be closed")
+
+    services.set_session(CallerSession())
+    try:
+        services.request_handler("https://www.imdb.com/title/tt0133093/reference")
+        assert calls == ["https://www.imdb.com/title/tt0133093/reference"]
+        services.close_session()
+        assert services._session is None
+    finally:
+        services.set_session(None)
+
+
+# ── Batch fetch ──────────────────────────────────────────────────────────────
+
+
+def test_get_movies_dedupes_and_reports_per_item_errors(monkeypatch):
+    requested = []
+
+    def fake_get_movie(imdb_id, locale=None):
+        requested.append(imdb_id)
+        if imdb_id == "tt0000002":
+            raise HTTPError("boom", status_code=500, url=imdb_id)
+        return SimpleNamespace(imdb_id=imdb_id)
+
+    monkeypatch.setattr(services, "get_movie", fake_get_movie)
+    ids = ["tt0000001", "0000001", 1, "tt0000002", "tt0000003"]
+    results = dict(services.get_movies(ids, max_workers=2))
+
+    assert sorted(requested) == ["tt0000001", "tt0000002", "tt0000003"]
+    assert results["tt0000001"].imdb_id == "tt0000001"
+    assert isinstance(results["tt0000002"], HTTPError)
+    assert results["tt0000003"].imdb_id == "tt0000003"
+
+
+def test_get_movies_bounds_in_flight_work(monkeypatch):
+    import threading
+    import time as _time
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_get_movie(imdb_id, locale=None):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        _time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return imdb_id
+
+    monkeypatch.setattr(services, "get_movie", slow_get_movie)
+    results = list(services.get_movies(range(1, 21), max_workers=4))
+    assert len(results) == 20
+    assert peak <= 4
+
+
+# ── __NEXT_DATA__ extraction ─────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "sample_resource.json",
+        "sample_series.json",
+        "sample_episode.json",
+        "sample_episodes.json",
+        "sample_person.json",
+    ],
+)
+def test_find_next_data_matches_lxml(filename):
+    from lxml import html as lxml_html
+
+    json_text = load_sample_text(filename)
+    page = (
+        '<html><head><meta charset="utf-8"></head><body>'
+        '<script>var x = "__NEXT_DATA__";</script>'
+        f'<script id="__NEXT_DATA__" type="application/json">{json_text}</script>'
+        "</body></html>"
+    ).encode("utf-8")
+    expected = lxml_html.fromstring(page).xpath('//script[@id="__NEXT_DATA__"]/text()')[
+        0
+    ]
+    assert services._find_next_data(page).decode("utf-8") == expected
+
+
+@pytest.mark.parametrize(
+    "page",
+    [
+        b'<script type="application/json" id="__NEXT_DATA__">{"a": 1}</script>',
+        b"<SCRIPT ID='__NEXT_DATA__'>{\"a\": 1}</SCRIPT>",
+        b'<script id=__NEXT_DATA__ nonce="x">{"a": 1}</script>',
+    ],
+)
+def test_find_next_data_tag_variants(page):
+    assert json.loads(services._find_next_data(page)) == {"a": 1}
+
+
+def test_find_next_data_ignores_lookalike_ids():
+    page = b'<script id="__NEXT_DATA__X">{"a": 1}</script>'
+    assert services._find_next_data(page) is None
+
+
+def test_parse_next_data_falls_back_to_lxml(monkeypatch):
+    # the fast path yields a body that is not valid JSON; lxml still wins
+    monkeypatch.setattr(services, "_find_next_data", lambda content: b"{broken")
+    page = b'<html><script id="__NEXT_DATA__">{"a": 1}</script></html>'
+    assert services._parse_next_data(page, "https://example.com") == {"a": 1}
+
+
+# ── Streaming __NEXT_DATA__ ──────────────────────────────────────────────────
+
+
+class _StreamedResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.sent = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            self.sent = i + chunk_size
+            yield self.content[i : i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 4096])
+def test_stream_next_data_stops_after_closing_tag(monkeypatch, chunk_size):
+    monkeypatch.setattr(services, "_stream_chunk_size", chunk_size)
+    page = (
+        b"<html><body>"
+        + b"<p>head</p>" * 200
+        + b'<script id="__NEXT_DATA__" type="application/json">{"a": [1, 2]}</script>'
+        + b"<p>tail</p>" * 2000
+        + b"</body></html>"
+    )
+    resp = _StreamedResponse(page)
+    assert services._stream_next_data(resp, "https://example.com") == {"a": [1, 2]}
+    assert resp.closed
+    assert resp.sent < len(page) // 2
+
+
+def test_stream_next_data_falls_back_to_lxml_when_scan_misses_tag():
+    # entity-encoded attribute: invisible to the byte scan, decoded by lxml
+    page = (
+        b'<html><body><script id="&#95;&#95;NEXT_DATA&#95;&#95;">{"a": 1}</script>'
+        + b"<p>tail</p>" * 50
+        + b"</body></html>"
+    )
+    resp = _StreamedResponse(page)
+    assert services._stream_next_data(resp, "https://example.com") == {"a": 1}
+    assert resp.closed
+
+
+def test_stream_next_data_fallback_reuses_stream_buffer(monkeypatch):
+    monkeypatch.setattr(services, "_stream_chunk_size", 16)
+    page = b'<html><body><script id="__NEXT_DATA__">{"a": </script></body></html>'
+    seen = []
+    monkeypatch.setattr(
+        services, "_parse_next_data", lambda content, url: seen.append(content)
+    )
+    services._stream_next_data(_StreamedResponse(page), "https://example.com")
+    # the undecodable body goes to the fallback in the buffer it was read into
+    assert type(seen[0]) is bytearray
+    assert b"</script>" in seen[0] and page.startswith(seen[0])
+
+
+def test_stream_next_data_raises_parse_error_without_tag():
+    resp = _StreamedResponse(b"<html><body>nothing here</body></html>")
+    with pytest.raises(ParseError):
+        services._stream_next_data(resp, "https://example.com")
+    assert resp.closed
+
+
+def test_get_movie_uses_buffered_path_when_streaming_disabled(monkeypatch):
+    received = {}
+
+    def mock_get(url, **kwargs):
+        received.update(kwargs)
+        return mock_get_factory("sample_resource.json")()
+
+    monkeypatch.setattr(services.get_session(), "get", mock_get)
+    monkeypatch.setattr(services, "_stream_pages", True)  # restored after the test
+    services.set_streaming(False)
+    services.get_movie.cache_clear()
+    assert services.get_movie("tt0133093").title == "The Matrix"
+    assert received["stream"] is False
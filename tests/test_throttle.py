@@ -0,0 +1,127 @@
+from types import SimpleNamespace
+
+import pytest
+
+from imdbinfo import services, throttle
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(throttle, "monotonic", lambda: now.value)
+    return now
+
+
+def test_token_bucket_paces_after_burst(clock):
+    limiter = throttle.HostLimiter(rate=2.0, burst=2)
+    assert [limiter.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    clock.value += 10  # bucket refills up to the burst size only
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+    assert limiter.stats()["requests"] == 7
+
+
+@pytest.mark.parametrize("status", [202, 429, 500, 503])
+def test_backoff_statuses_decrease_rate_and_drain_bucket(clock, status):
+    limiter = throttle.HostLimiter(rate=8.0, burst=5, min_rate=3.0, decrease=0.5)
+    limiter.record(status)
+    assert limiter.rate == 4.0
+    assert limiter.reserve() == pytest.approx(0.25)  # no burst left after a back-off
+
+    limiter.record(status)
+    assert limiter.rate == 3.0  # clamped to min_rate
+    assert limiter.stats()["backoffs"] == 2
+
+
+def test_success_increases_rate_up_to_max(clock):
+    limiter = throttle.HostLimiter(rate=1.0, max_rate=1.25, increase=0.1)
+    limiter.record(200)
+    assert limiter.rate == pytest.approx(1.1)
+    limiter.record(404)  # neither a success nor a throttling signal
+    assert limiter.rate == pytest.approx(1.1)
+    for _ in range(5):
+        limiter.record(200)
+    assert limiter.rate == 1.25
+
+
+def test_retry_after_blocks_host(clock):
+    limiter = throttle.RateLimiter()
+    url = "https://www.imdb.com/title/tt0133093/"
+    resp = SimpleNamespace(status_code=429, headers={"Retry-After": "3"})
+    limiter.record(url, resp)
+    assert limiter.host(url).reserve() == pytest.approx(3.0)
+
+    clock.value += 3
+    limiter.record(url, SimpleNamespace(status_code=429, headers={"Retry-After": "x"}))
+    assert limiter.host(url).reserve() < 1.0  # unparsable header is ignored
+
+
+def test_limits_are_per_host():
+    limiter = throttle.RateLimiter()
+    www = limiter.host("https://www.imdb.com/name/nm0000126/")
+    graphql = limiter.host(services.GRAPHQL_URL)
+    other = limiter.host("https://m.imdb.com/")
+    assert www.rate == throttle.DEFAULT_LIMITS["www.imdb.com"]["rate"]
+    assert graphql.rate == throttle.DEFAULT_LIMITS["api.graphql.imdb.com"]["rate"]
+    assert other.rate == throttle.DEFAULT_LIMITS["*"]["rate"]
+
+    limiter.configure("api.graphql.imdb.com", rate=1.0, burst=1)
+    assert graphql.rate == 1.0 and graphql.burst == 1
+    assert www.rate == throttle.DEFAULT_LIMITS["www.imdb.com"]["rate"]
+
+    www.record(202)
+    assert graphql.stats()["backoffs"] == 0
+    limiter.configure(max_rate=20.0)
+    assert www.max_rate == graphql.max_rate == 20.0
+
+
+def test_rejected_wait_gives_its_token_back(clock, monkeypatch):
+    limiter = throttle.RateLimiter({"*": {"rate": 1.0, "burst": 1}})
+    url = "https://www.imdb.com/"
+    monkeypatch.setattr(throttle, "sleep", lambda s: pytest.fail("slept"))
+    assert limiter.wait(url, timeout=0.5)  # uses the burst token
+    for _ in range(3):  # each would wait about a second: rejected
+        assert not limiter.wait(url, timeout=0.5)
+    assert limiter.host(url).reserve() == pytest.approx(1.0)  # no debt left
+    assert limiter.stats()["www.imdb.com"]["requests"] == 2
+
+
+def test_disabled_limiter_never_waits(clock, monkeypatch):
+    limiter = throttle.RateLimiter({"*": {"rate": 1.0, "burst": 1}})
+    limiter.enabled = False
+    monkeypatch.setattr(throttle, "sleep", lambda s: pytest.fail("slept"))
+    for _ in range(3):
+        limiter.wait("https://www.imdb.com/")
+    assert limiter.stats() == {}
+
+
+def test_fetches_go_through_the_host_limiters(monkeypatch):
+    monkeypatch.setattr(services, "_waf_cookies", services._UNSET)
+    monkeypatch.setattr(
+        services.get_session(),
+        "get",
+        lambda *a, **kw: SimpleNamespace(status_code=202, text="challenge"),
+    )
+    monkeypatch.setattr(
+        services.get_session(),
+        "post",
+        lambda *a, **kw: SimpleNamespace(status_code=200, content=b'{"data": {}}'),
+        raising=False,
+    )
+
+    def failing_solver(text, ua):
+        raise RuntimeError("no solver in tests")
+
+    monkeypatch.setattr(services, "get_cookies", failing_solver)
+
+    services.request_handler("https://www.imdb.com/title/tt0133093/reference")
+    services.request_graphql_url({}, "matrix", {}, services.GRAPHQL_URL)
+
+    stats = services.rate_limit_stats()
+    assert stats["www.imdb.com"]["requests"] == 1
+    assert stats["www.imdb.com"]["backoffs"] == 1
+    assert stats["api.graphql.imdb.com"] == {
+        **stats["api.graphql.imdb.com"],
+        "requests": 1,
+        "backoffs": 0,
+    }
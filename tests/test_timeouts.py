@@ -0,0 +1,229 @@
+import asyncio
+import threading
+import time
+
+import niquests
+import pytest
+
+from imdbinfo import aio, cache, retry, services
+from imdbinfo.exceptions import RequestTimeoutError
+from tests.test_aio import async_get_factory
+from tests.test_services import _make_response, mock_get_factory
+
+
+@pytest.fixture
+def recorded_get(monkeypatch):
+    fetch = mock_get_factory("sample_resource.json")
+    timeouts = []
+
+    def get(*args, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        return fetch(*args, **kwargs)
+
+    monkeypatch.setattr(services.get_session(), "get", get)
+    services.clear_cache()
+    yield timeouts
+    services.clear_cache()
+
+
+def test_default_and_configured_timeouts_are_sent(recorded_get, monkeypatch):
+    services.get_movie("tt0133093")
+    assert recorded_get == [(5.0, 30.0)]
+
+    monkeypatch.setitem(services._TIMEOUTS, "connect", 5.0)
+    monkeypatch.setitem(services._TIMEOUTS, "read", 30.0)
+    services.configure_timeouts(connect=2.0, read=10.0)
+    services.clear_cache()
+    services.get_movie("tt0133093")
+    assert recorded_get[-1] == (2.0, 10.0)
+
+
+def test_per_call_timeout_overrides_defaults(recorded_get):
+    services.get_movie("tt0133093", timeout=3.0)
+    services.clear_cache()
+    services.get_movie("tt0133093", timeout=(1.0, 4.0))
+    assert recorded_get == [(3.0, 3.0), (1.0, 4.0)]
+
+
+def test_deadline_shortens_timeouts_and_stays_out_of_cache_key(recorded_get):
+    movie = services.get_movie("tt0133093", deadline=2.0)
+    connect, read = recorded_get[0]
+    assert 0 < connect <= 2.0 and 0 < read <= 2.0
+    assert services.get_movie("tt0133093") is movie  # same cache entry
+    assert len(recorded_get) == 1
+
+
+def test_expired_deadline_raises_before_requesting(recorded_get):
+    with pytest.raises(RequestTimeoutError) as exc_info:
+        services.get_movie("tt0133093", deadline=0)
+    assert exc_info.value.deadline_exceeded
+    assert isinstance(exc_info.value, TimeoutError)
+    assert recorded_get == []
+
+
+def test_transport_timeout_is_retried_then_raised(monkeypatch):
+    calls = []
+
+    def stalled_get(*args, **kwargs):
+        calls.append(kwargs["timeout"])
+        raise niquests.Timeout("read timed out")
+
+    monkeypatch.setattr(services.get_session(), "get", stalled_get)
+    services.clear_cache()
+    with pytest.raises(RequestTimeoutError) as exc_info:
+        services.get_movie("tt0133093")
+    err = exc_info.value
+    assert not err.deadline_exceeded
+    assert err.timeout == 30.0
+    assert err.retries == len(calls) - 1 == services.retry_policy.max_attempts - 1
+
+
+def test_deadline_covers_retries(monkeypatch):
+    monkeypatch.setattr(services.retry_policy, "backoff", 10.0)
+    monkeypatch.setattr(
+        services.get_session(), "get", lambda *a, **kw: _make_response(503)
+    )
+    monkeypatch.setattr(services, "_refresh_waf_cookies", lambda *a, **kw: (None, 0))
+    services.clear_cache()
+    started = time.monotonic()
+    with pytest.raises(RequestTimeoutError) as exc_info:
+        services.get_movie("tt0133093", deadline=1.0)
+    assert time.monotonic() - started < 1.0  # gave up instead of sleeping
+    assert exc_info.value.deadline_exceeded
+    assert exc_info.value.__cause__.status_code == 503
+
+
+def test_deadline_bounds_waiting_for_another_waf_solve():
+    services._waf_solve_lock.acquire()
+    try:
+        with retry.request_scope(time.monotonic() + 0.05):
+            with pytest.raises(RequestTimeoutError):
+                services._refresh_waf_cookies(-1, "challenge")
+    finally:
+        services._waf_solve_lock.release()
+
+
+def test_deadline_bounds_waiting_for_an_in_flight_call():
+    flight, release = cache.SingleFlight(), threading.Event()
+    leader = threading.Thread(target=flight.do, args=("k", release.wait, 5))
+    leader.start()
+    while not flight._calls:
+        time.sleep(0.001)
+    try:
+        with retry.request_scope(time.monotonic() + 0.05):
+            with pytest.raises(RequestTimeoutError):
+                flight.do("k", lambda: "never runs")
+    finally:
+        release.set()
+        leader.join()
+
+
+def test_leader_deadline_does_not_fail_waiters(monkeypatch):
+    page = mock_get_factory("sample_resource.json")
+
+    def slow_get(url, timeout, **kwargs):
+        if timeout[1] < 0.3:  # the short-deadline caller's read times out
+            time.sleep(timeout[1])
+            raise niquests.Timeout("read timed out")
+        time.sleep(0.05)
+        return page(url, **kwargs)
+
+    monkeypatch.setattr(services.get_session(), "get", slow_get)
+    services.clear_cache()
+    results = {}
+
+    def fetch(name, **kwargs):
+        try:
+            results[name] = services.get_movie("tt0133093", **kwargs)
+        except Exception as exc:
+            results[name] = exc
+
+    leader = threading.Thread(target=fetch, args=("a",), kwargs={"deadline": 0.2})
+    leader.start()
+    while not cache.flights._calls:
+        time.sleep(0.001)
+    waiter = threading.Thread(target=fetch, args=("b",))
+    waiter.start()
+    leader.join()
+    waiter.join()
+    assert isinstance(results["a"], RequestTimeoutError)
+    assert results["a"].deadline_exceeded
+    assert results["b"].title == "The Matrix"
+    services.clear_cache()
+
+
+def test_aio_leader_deadline_hands_the_call_over():
+    flight = cache.AsyncSingleFlight()
+    runs = []
+
+    async def work(who):
+        runs.append(who)
+        await asyncio.sleep(0.01)
+        if who == "leader":
+            raise retry.deadline_exceeded()
+        return who
+
+    async def main():
+        leader = asyncio.create_task(flight.do("k", work, "leader"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("k", work, "waiter"))
+        return await asyncio.gather(leader, waiter, return_exceptions=True)
+
+    leader, waiter = asyncio.run(main())
+    assert isinstance(leader, RequestTimeoutError)
+    assert waiter == "waiter"
+    assert runs == ["leader", "waiter"]
+
+
+def test_streamed_page_respects_the_deadline():
+    class SlowResponse:
+        closed = False
+        sent = 0
+
+        def iter_content(self, chunk_size):
+            for _ in range(100):
+                time.sleep(0.01)
+                self.sent += 1
+                yield b"<p>slow</p>"
+
+        def close(self):
+            self.closed = True
+
+    resp = SlowResponse()
+    with retry.request_scope(time.monotonic() + 0.05):
+        with pytest.raises(RequestTimeoutError) as exc_info:
+            services._stream_next_data(resp, "https://www.imdb.com/title/tt0133093/")
+    assert exc_info.value.deadline_exceeded
+    assert resp.closed
+    assert resp.sent < 100
+
+
+def test_generators_check_the_deadline_at_every_step():
+    @retry.with_deadline
+    def steps():
+        for _ in range(3):
+            yield retry.remaining_time()
+
+    budgets = list(steps(deadline=60))
+    assert all(0 < budget <= 60 for budget in budgets)
+    assert list(steps()) == [None, None, None]
+
+
+def test_aio_timeouts_and_deadline(monkeypatch):
+    fetch = async_get_factory("sample_resource.json")
+    timeouts = []
+
+    async def get(*args, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        return await fetch(*args, **kwargs)
+
+    monkeypatch.setattr(aio.get_session(), "get", get)
+    aio.get_movie.cache_clear()
+    movie = asyncio.run(aio.get_movie("tt0133093", timeout=(1.0, 2.0)))
+    assert movie.title == "The Matrix"
+    assert timeouts == [(1.0, 2.0)]
+
+    aio.get_movie.cache_clear()
+    with pytest.raises(RequestTimeoutError):
+        asyncio.run(aio.get_movie("tt0133093", deadline=0))
+    assert len(timeouts) == 1
@@ -0,0 +1,69 @@
+import gzip
+from types import SimpleNamespace
+
+import pytest
+
+from imdbinfo import services, transfer
+from tests.test_services import mock_get_factory
+
+
+@pytest.fixture(autouse=True)
+def _fresh_meter():
+    services.reset_transfer_stats()
+    yield
+    services.reset_transfer_stats()
+
+
+def test_accept_encoding_lists_only_installed_decoders():
+    assert services.HEADERS["accept-encoding"] == transfer.ACCEPT_ENCODING
+    assert services._graphql_headers()["Accept-Encoding"] == transfer.ACCEPT_ENCODING
+    assert "gzip" in transfer.ENCODINGS
+    assert ("br" in transfer.ENCODINGS) == transfer._installed("brotlicffi", "brotli")
+    assert ("zstd" in transfer.ENCODINGS) == transfer._installed("zstandard")
+    # best first: zstd, then br, then gzip/deflate
+    order = ["zstd", "br", "gzip", "deflate"]
+    assert transfer.ENCODINGS == [name for name in order if name in transfer.ENCODINGS]
+
+
+def test_wire_bytes_prefers_connection_counter_then_content_length():
+    raw = SimpleNamespace(tell=lambda: 120)
+    headers = {"Content-Length": "300"}
+    assert transfer.wire_bytes(SimpleNamespace(raw=raw, headers=headers), 900) == 120
+    assert transfer.wire_bytes(SimpleNamespace(headers=headers), 900) == 300
+    assert transfer.wire_bytes(SimpleNamespace(headers={}), 900) == 900
+
+
+def test_meter_counts_wire_and_decoded_bytes_per_host():
+    body = b"<html>" + b"x" * 5000 + b"</html>"
+    wire = len(gzip.compress(body))
+    resp = SimpleNamespace(
+        content=body, headers={"Content-Encoding": "gzip", "Content-Length": str(wire)}
+    )
+    meter = transfer.TransferMeter()
+    meter.record("https://www.imdb.com/title/tt1/reference", resp)
+    meter.record(
+        "https://www.imdb.com/title/tt2/reference", SimpleNamespace(content=body)
+    )
+
+    stats = meter.stats()["www.imdb.com"]
+    assert stats["requests"] == 2
+    assert stats["requests_gzip"] == stats["requests_identity"] == 1
+    assert stats["wire_bytes"] == wire + len(body)
+    assert stats["decoded_bytes"] == 2 * len(body)
+    assert stats["compression_ratio"] == pytest.approx(
+        2 * len(body) / (wire + len(body))
+    )
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_page_requests_are_metered(monkeypatch, stream):
+    monkeypatch.setattr(
+        services.get_session(), "get", mock_get_factory("sample_resource.json")
+    )
+    monkeypatch.setattr(services, "_stream_pages", stream)
+    services.get_movie.cache_clear()
+    services.get_movie("tt0133093")
+
+    stats = services.transfer_stats()["www.imdb.com"]
+    assert stats["requests"] == 1
+    assert stats["decoded_bytes"] == stats["wire_bytes"] > 0
@@ -16,9 +16,19 @@ Covered behaviours
    calls the WAF solver, saves fresh cookies, and retries.
 8. request_handler — if the retry after WAF solve also fails the cookies
    are discarded (memory = None, file deleted).
+9. request_handler — concurrent callers rejected with the same cookies run
+   the WAF solver once and all retry with its token.
+10. _delete_waf_cookie_file — a stale generation never drops newer cookies.
+11. _load_waf_cookies — a cookie file replaced by another process is
+    reloaded, and a refresh reuses it instead of solving again.
+12. _save_waf_cookies — writes go through a temporary file and a rename.
+13. request_handler — a token close to expiry is replaced by a background
+    solve while the foreground request goes ahead with the current one.
 """
 
 import json
+import threading
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -34,10 +44,14 @@ def _reset_cookie_state(monkeypatch, cookie_file: Path):
     """Point the module at a temp file path and reset the in-memory cache."""
     monkeypatch.setattr(services, "_WAF_COOKIE_FILE", cookie_file)
     monkeypatch.setattr(services, "_waf_cookies", services._UNSET)
+    monkeypatch.setattr(services, "_waf_cookie_stamp", None)
+    monkeypatch.setattr(services, "_waf_issued_at", None)
 
 
 def _make_response(status_code: int, text: str = "", content: bytes = b""):
-    return SimpleNamespace(status_code=status_code, text=text, content=content)
+    return SimpleNamespace(
+        status_code=status_code, text=text, content=content, close=lambda: None
+    )
 
 
 # ── _load_waf_cookies ─────────────────────────────────────────────────────────
@@ -57,17 +71,34 @@ def test_load_reads_disk_on_first_call(monkeypatch, tmp_path):
 
 
 def test_load_uses_memory_on_subsequent_calls(monkeypatch, tmp_path):
-    """Once the cache is warm the file is never read again."""
+    """Once the cache is warm the file is not read again while it is unchanged."""
     cookie_file = tmp_path / "waf_cookies.json"
-    # Pre-warm the in-memory cache — file contents deliberately differ
-    monkeypatch.setattr(services, "_WAF_COOKIE_FILE", cookie_file)
-    monkeypatch.setattr(services, "_waf_cookies", {"aws-waf-token": "from-memory"})
     cookie_file.write_text(json.dumps({"aws-waf-token": "from-disk"}), encoding="utf-8")
+    _reset_cookie_state(monkeypatch, cookie_file)
+    services._load_waf_cookies()
+
+    def no_read(*args, **kwargs):
+        raise AssertionError("cookie file read again")
 
+    monkeypatch.setattr(type(cookie_file), "read_text", no_read)
     result = services._load_waf_cookies()
 
-    # Must return the in-memory value, not the disk value
-    assert result == {"aws-waf-token": "from-memory"}
+    assert result == {"aws-waf-token": "from-disk"}
+
+
+def test_load_picks_up_file_replaced_by_another_process(monkeypatch, tmp_path):
+    """A token saved by a sibling worker replaces the in-memory one."""
+    cookie_file = tmp_path / "waf_cookies.json"
+    _reset_cookie_state(monkeypatch, cookie_file)
+    services._save_waf_cookies({"aws-waf-token": "mine"})
+    _, generation = services._waf_cookie_state()
+
+    sibling = tmp_path / "sibling.json"
+    sibling.write_text(json.dumps({"aws-waf-token": "sibling"}), encoding="utf-8")
+    sibling.replace(cookie_file)
+
+    assert services._load_waf_cookies() == {"aws-waf-token": "sibling"}
+    assert services._waf_cookie_state()[1] > generation
 
 
 def test_load_returns_none_when_no_file(monkeypatch, tmp_path):
@@ -117,7 +148,7 @@ def test_delete_clears_memory_and_removes_file(monkeypatch, tmp_path):
 
 
 def test_request_handler_sends_cached_cookies_on_200(monkeypatch, tmp_path):
-    """Cached cookies are forwarded to niquests.get; a 200 leaves them intact."""
+    """Cached cookies are forwarded to session.get; a 200 leaves them intact."""
     cookie_file = tmp_path / "waf_cookies.json"
     cached = {"aws-waf-token": "valid-token"}
     monkeypatch.setattr(services, "_WAF_COOKIE_FILE", cookie_file)
@@ -125,11 +156,11 @@ def test_request_handler_sends_cached_cookies_on_200(monkeypatch, tmp_path):
 
     received_cookies = {}
 
-    def stub_get(url, headers=None, cookies=None):
+    def stub_get(url, headers=None, cookies=None, **kwargs):
         received_cookies.update(cookies or {})
         return _make_response(200)
 
-    monkeypatch.setattr(services.niquests, "get", stub_get)
+    monkeypatch.setattr(services.get_session(), "get", stub_get)
 
     resp = services.request_handler("https://www.imdb.com/title/tt0133093/reference")
 
@@ -148,13 +179,13 @@ def test_request_handler_refreshes_cookies_on_non_200(monkeypatch, tmp_path):
     fresh_cookies = {"aws-waf-token": "fresh-token"}
     call_count = {"n": 0}
 
-    def stub_get(url, headers=None, cookies=None):
+    def stub_get(url, headers=None, cookies=None, **kwargs):
         call_count["n"] += 1
         if call_count["n"] == 1:
             return _make_response(403, text="forbidden")
         return _make_response(200)
 
-    monkeypatch.setattr(services.niquests, "get", stub_get)
+    monkeypatch.setattr(services.get_session(), "get", stub_get)
     monkeypatch.setattr(services, "get_cookies", lambda text, ua: fresh_cookies)
 
     resp = services.request_handler("https://www.imdb.com/title/tt0133093/reference")
@@ -173,7 +204,7 @@ def test_request_handler_clears_cookies_when_retry_also_fails(monkeypatch, tmp_p
     monkeypatch.setattr(services, "_waf_cookies", {"aws-waf-token": "old-token"})
 
     monkeypatch.setattr(
-        services.niquests,
+        services.get_session(),
         "get",
         lambda *a, **kw: _make_response(403, text="still blocked"),
     )
@@ -186,3 +217,145 @@ def test_request_handler_clears_cookies_when_retry_also_fails(monkeypatch, tmp_p
     assert resp.status_code == 403
     assert services._waf_cookies is None
     assert not cookie_file.exists()
+
+
+def test_concurrent_rejections_solve_the_challenge_once(monkeypatch, tmp_path):
+    """32 threads hitting the WAF at once share one solver run."""
+    cookie_file = tmp_path / "waf_cookies.json"
+    monkeypatch.setattr(services, "_WAF_COOKIE_FILE", cookie_file)
+    monkeypatch.setattr(services, "_waf_cookies", {"aws-waf-token": "expired"})
+
+    fresh_cookies = {"aws-waf-token": "fresh-token"}
+    solves = []
+    barrier = threading.Barrier(32)
+
+    def stub_get(url, headers=None, cookies=None, **kwargs):
+        if cookies == fresh_cookies:
+            return _make_response(200)
+        return _make_response(202, text="challenge")
+
+    def slow_solver(text, ua):
+        solves.append(text)
+        time.sleep(0.05)
+        return fresh_cookies
+
+    monkeypatch.setattr(services.get_session(), "get", stub_get)
+    monkeypatch.setattr(services, "get_cookies", slow_solver)
+
+    statuses = []
+
+    def run():
+        barrier.wait()
+        statuses.append(services.request_handler("https://www.imdb.com/").status_code)
+
+    threads = [threading.Thread(target=run) for _ in range(32)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(solves) == 1
+    assert statuses == [200] * 32
+    assert services._waf_cookies == fresh_cookies
+    assert json.loads(cookie_file.read_text(encoding="utf-8")) == fresh_cookies
+
+
+def test_stale_generation_does_not_delete_newer_cookies(monkeypatch, tmp_path):
+    cookie_file = tmp_path / "waf_cookies.json"
+    _reset_cookie_state(monkeypatch, cookie_file)
+    services._save_waf_cookies({"aws-waf-token": "first"})
+    _, stale = services._waf_cookie_state()
+    services._save_waf_cookies({"aws-waf-token": "second"})
+
+    services._delete_waf_cookie_file(stale)
+
+    assert services._waf_cookies == {"aws-waf-token": "second"}
+    assert cookie_file.exists()
+
+
+def test_refresh_reuses_token_saved_by_another_process(monkeypatch, tmp_path):
+    cookie_file = tmp_path / "waf_cookies.json"
+    _reset_cookie_state(monkeypatch, cookie_file)
+    services._save_waf_cookies({"aws-waf-token": "expired"})
+    _, generation = services._waf_cookie_state()
+
+    sibling = tmp_path / "sibling.json"
+    sibling.write_text(json.dumps({"aws-waf-token": "sibling"}), encoding="utf-8")
+    sibling.replace(cookie_file)
+
+    def no_solve(text, ua):
+        raise AssertionError("solver must not run")
+
+    monkeypatch.setattr(services, "get_cookies", no_solve)
+    cookies, _ = services._refresh_waf_cookies(generation, "challenge")
+
+    assert cookies == {"aws-waf-token": "sibling"}
+    assert cookie_file.with_suffix(".lock").exists() == (services.fcntl is not None)
+
+
+def test_save_is_atomic(monkeypatch, tmp_path):
+    cookie_file = tmp_path / "waf_cookies.json"
+    _reset_cookie_state(monkeypatch, cookie_file)
+    cookie_file.write_text(json.dumps({"aws-waf-token": "old"}), encoding="utf-8")
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(services.os, "replace", broken_replace)
+    services._save_waf_cookies({"aws-waf-token": "new"})
+
+    # the previous file is intact and no temporary file is left behind
+    assert json.loads(cookie_file.read_text(encoding="utf-8")) == {"aws-waf-token": "old"}
+    assert [p.name for p in tmp_path.iterdir()] == ["waf_cookies.json"]
+
+
+def test_token_close_to_expiry_is_refreshed_in_background(monkeypatch, tmp_path):
+    cookie_file = tmp_path / "waf_cookies.json"
+    _reset_cookie_state(monkeypatch, cookie_file)
+    monkeypatch.setattr(services, "_waf_retry_after", 0.0)
+    old_cookies, fresh_cookies = {"aws-waf-token": "old"}, {"aws-waf-token": "fresh"}
+    services._save_waf_cookies(old_cookies)
+    monkeypatch.setattr(services, "_waf_issued_at", services.time() - 280)
+
+    solving = threading.Event()
+    requests = []
+
+    def stub_get(url, headers=None, cookies=None, **kwargs):
+        requests.append((url, cookies))
+        if url == services._WAF_REFRESH_URL:
+            return _make_response(202, text="challenge")
+        return _make_response(200)
+
+    def slow_solver(text, ua):
+        solving.wait(5)
+        return fresh_cookies
+
+    monkeypatch.setattr(services.get_session(), "get", stub_get)
+    monkeypatch.setattr(services, "get_cookies", slow_solver)
+
+    resp = services.request_handler("https://www.imdb.com/title/tt0133093/reference")
+    # the foreground request did not wait for the solver
+    assert resp.status_code == 200
+    assert ("https://www.imdb.com/title/tt0133093/reference", old_cookies) in requests
+
+    solving.set()
+    services._waf_refresh_thread.join(5)
+    assert services._waf_cookies == fresh_cookies
+    assert (services._WAF_REFRESH_URL, None) in requests
+
+
+def test_fresh_token_or_disabled_refresh_starts_no_background_solve(monkeypatch, tmp_path):
+    cookie_file = tmp_path / "waf_cookies.json"
+    _reset_cookie_state(monkeypatch, cookie_file)
+    monkeypatch.setattr(services, "_waf_refresh_thread", None)
+    services._save_waf_cookies({"aws-waf-token": "fresh"})
+    monkeypatch.setattr(services.get_session(), "get", lambda *a, **kw: _make_response(200))
+
+    services.request_handler("https://www.imdb.com/")
+    assert services._waf_refresh_thread is None
+
+    monkeypatch.setattr(services, "_waf_issued_at", services.time() - 1000)
+    monkeypatch.setattr(services, "_waf_proactive_refresh", True)
+    services.configure_waf_refresh(enabled=False)
+    services.request_handler("https://www.imdb.com/")
+    assert services._waf_refresh_thread is None